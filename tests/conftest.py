@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Die Module in wdx/ importieren sich gegenseitig direkt (wie beim Start aus dem Ordner)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "wdx"))
+
+# WDX_DIR hängt am Home-Verzeichnis; Tests dürfen die echten Projekte nicht berühren
+_home = tempfile.mkdtemp(prefix="wdx-test-home-")
+os.environ["HOME"] = _home
+os.environ["USERPROFILE"] = _home
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+pytest.importorskip("pyzipper")
+
+from project_journal import move_op, put_op
+from project_manager import ProjectManager
+
+
+def _item(item_id, x):
+    return {"id": item_id, "url": f"https://example.org/{item_id}", "pos_x": x, "pos_y": 0}
+
+
+def test_external_edit_survives_reload_move_and_compact():
+    manager = ProjectManager()
+    ok, project = manager.create_project("reload-test", "")
+    assert ok
+    items = [_item("a", 0), _item("b", 100), _item("c", 200)]
+    project["data"]["items"] = items
+    manager.schedule_save(project, [put_op(item) for item in items])
+    manager.compact_project(project)
+
+    # Externe Änderung: "a" bearbeitet, "c" gelöscht
+    with open(project["data_file"], "r", encoding="utf-8") as f:
+        on_disk = json.load(f)
+    on_disk["items"] = [dict(on_disk["items"][0], title="extern"), on_disk["items"][1]]
+    with open(project["data_file"], "w", encoding="utf-8") as f:
+        json.dump(on_disk, f)
+
+    # Reload wie ProjectWindow.reload_items
+    updated = manager.read_project_data(project)
+    manager.adopt_external(project, updated)
+    project["data"]["items"] = updated["items"]
+
+    # Eigene Verschiebung, danach kompaktieren
+    moved = project["data"]["items"][1]
+    moved["pos_x"] = 555
+    manager.schedule_save(project, [move_op(moved)])
+    manager.compact_project(project)
+
+    with open(project["data_file"], "r", encoding="utf-8") as f:
+        saved = {item["id"]: item for item in json.load(f)["items"]}
+    assert set(saved) == {"a", "b"}
+    assert saved["a"]["title"] == "extern"
+    assert saved["b"]["pos_x"] == 555
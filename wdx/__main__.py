@@ -2,14 +2,20 @@ import tkinter as tk
 import ttkbootstrap as ttk
 from tkinter import messagebox
 import datetime
+import sqlite3
 import uuid
-import threading
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
 
-from constants import APP_TITLE
-from server import start_server
+from constants import APP_TITLE, SNAPSHOT_MAX_MB
+from server import start_server, stop_server
+from download_scheduler import (
+    DownloadScheduler, PRIORITY_USER, PRIORITY_BATCH, PRIORITY_BULK,
+)
+from page_fetcher import fetch_page_snapshot, apply_snapshot, stream_snapshot
+from bulk_refresh import HostThrottle, interleave_by_host
+from snapshot_store import SnapshotTooLarge
+from http_client import http_get, close_session
+from favicon_cache import get_favicon_cache
 from project_manager import ProjectManager
 from main_window import MainWindow
 from project_window import ProjectWindow
@@ -31,16 +37,43 @@ class WdxApp:
         self.apply_theme()
 
         self.main_window = MainWindow(root, self)
-        start_server(self)
         self.last_connection = None
         self.connection_count = 0
         self.current_project_name = None
+        self._bulk_refreshes = {}
+        self._bulk_throttle = HostThrottle()
+
+        self.download_scheduler = DownloadScheduler()
+        self.download_scheduler.register(
+            "add_source", self._run_add_source_job, self._on_add_source_job_done,
+            self._on_add_source_batch_done,
+        )
+        self.download_scheduler.register(
+            "reload_page", self._run_reload_job, self._on_reload_job_done
+        )
+        self.download_scheduler.register(
+            "bulk_reload", self._run_bulk_reload_job,
+            batch_done=self._on_bulk_reload_batch_done,
+        )
+        self.download_scheduler.start()
+        start_server(self)
 
+        self.project_manager.reconcile_sizes(
+            on_done=lambda changed: self.root.after(0, self.main_window.update_project_tiles)
+        )
         self.update_connection_status()
         logger.info("WdxApp gestartet")
 
     def open_project(self, project):
         logger.info("Öffne Projekt: %s", project["name"])
+        try:
+            self.project_manager.ensure_loaded(project)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.error("Projekt '%s' konnte nicht geladen werden: %s", project["name"], exc)
+            messagebox.showerror(
+                "Fehler", f"Projekt konnte nicht geladen werden:\n{exc}", parent=self.root
+            )
+            return
         self.main_window.hide()
         self.project_window = ProjectWindow(self.root, project, self)
         self.current_project_name = project["name"]
@@ -56,6 +89,9 @@ class WdxApp:
             ):
                 self.project_window.main_frame.destroy()
             del self.project_window
+            project = self._find_project(self.current_project_name)
+            if project is not None:
+                self.project_manager.compact_project(project)
 
             if hasattr(self, "current_project_name"):
                 self.root.after(0, self.main_window.set_browser_connected, True)
@@ -94,6 +130,128 @@ class WdxApp:
             self.connection_count,
         )
 
+        project = self._resolve_target_project()
+        if project is None:
+            return
+
+        self.download_scheduler.submit(
+            "add_source", {"data": data, "project": project["name"]}, PRIORITY_USER
+        )
+
+    def handle_batch_communication(self, sources):
+        self.last_connection = datetime.datetime.now()
+        self.connection_count += len(sources)
+        logger.info("Batch von %d Quelle(n) empfangen", len(sources))
+
+        project = self._resolve_target_project()
+        if project is None:
+            return
+
+        self.download_scheduler.submit_batch(
+            "add_source",
+            [{"data": data, "project": project["name"]} for data in sources],
+            PRIORITY_BATCH,
+            meta={"project": project["name"]},
+        )
+
+    def reload_source(self, project, source, priority=PRIORITY_USER):
+        self.download_scheduler.submit(
+            "reload_page",
+            {"project": project["name"], "source_id": source["id"], "url": source["url"]},
+            priority,
+        )
+
+    def refresh_all_sources(self, project):
+        """Reiht die Sammel-Aktualisierung aller Quellen eines Projekts ein.
+
+        Die Jobs laufen im Download-Scheduler nach allen anderen Downloads
+        (``PRIORITY_BULK``) und überdauern einen Neustart.
+        """
+        name = project["name"]
+        if name in self._bulk_refreshes:
+            logger.info("Sammel-Aktualisierung läuft bereits: %s", name)
+            return False
+        sources = [
+            {"project": name, "source_id": item["id"], "url": item["url"]}
+            for item in self.project_manager.ensure_loaded(project).get("items", [])
+            if item.get("type") == "source" and item.get("url")
+        ]
+        self._bulk_refreshes[name] = {"done": 0, "total": len(sources)}
+        logger.info("Sammel-Aktualisierung eingereiht — %d Quelle(n)", len(sources))
+        if not sources:
+            self._complete_bulk_refresh({"project": name, "total": 0}, [])
+            return True
+        self.download_scheduler.submit_batch(
+            "bulk_reload",
+            interleave_by_host(sources),
+            PRIORITY_BULK,
+            meta={"project": name, "total": len(sources)},
+        )
+        return True
+
+    def _run_bulk_reload_job(self, payload):
+        try:
+            with self._bulk_throttle.slot(payload["url"]):
+                snapshot = self._run_reload_job(payload)
+        finally:
+            self.root.after(0, self._report_bulk_progress, payload["project"])
+        return {"source_id": payload["source_id"], "snapshot": snapshot}
+
+    def _on_bulk_reload_batch_done(self, meta, results):
+        self.root.after(0, self._complete_bulk_refresh, meta, results)
+
+    def _report_bulk_progress(self, project_name):
+        progress = self._bulk_refreshes.get(project_name)
+        if progress is None:
+            return
+        progress["done"] += 1
+        window = self._window_for(project_name)
+        if window is not None:
+            window.show_bulk_progress(progress["done"], progress["total"])
+
+    def _complete_bulk_refresh(self, meta, results):
+        project_name = meta["project"]
+        self._bulk_refreshes.pop(project_name, None)
+        logger.info(
+            "Sammel-Aktualisierung abgeschlossen — %d von %d Quelle(n)",
+            len(results), meta["total"],
+        )
+        window = self._window_for(project_name)
+        if window is not None:
+            window._finalize_bulk_reload(results, meta["total"])
+            return
+
+        project = self._find_project(project_name)
+        if project is None:
+            return
+
+        def update_logic(data):
+            by_id = {item.get("id"): item for item in data.get("items", [])}
+            for result in results:
+                if result["source_id"] in by_id:
+                    apply_snapshot(by_id[result["source_id"]], result["snapshot"])
+
+        self.project_manager.update_project_file_safe(project, update_logic)
+        logger.info("Sammel-Aktualisierung im Hintergrund gespeichert: %s", project_name)
+
+    def _snapshot_options(self):
+        max_mb = self.project_manager.get_setting("snapshot_max_mb", SNAPSHOT_MAX_MB)
+        return {
+            "compress": self.project_manager.get_setting("compress_snapshots", False),
+            "max_bytes": int(max_mb) * 1024 * 1024,
+        }
+
+    def _find_project(self, name):
+        return next(
+            (p for p in self.project_manager.projects if p["name"] == name), None
+        )
+
+    def _window_for(self, project_name):
+        if self.current_project_name == project_name and hasattr(self, "project_window"):
+            return self.project_window
+        return None
+
+    def _resolve_target_project(self):
         try:
             self.root.deiconify()
             self.root.lift()
@@ -114,7 +272,7 @@ class WdxApp:
                     self.current_project_name,
                 )
                 self.current_project_name = None
-                return
+                return None
         else:
             project_names = [p["name"] for p in self.project_manager.projects]
             if not project_names:
@@ -123,25 +281,17 @@ class WdxApp:
                     "Keine Projekte vorhanden. Bitte erst ein Projekt erstellen.",
                 )
                 logger.warning("Keine Projekte vorhanden — Kommunikation abgebrochen")
-                return
+                return None
 
             project_name = self._ask_project_selection(project_names)
             if not project_name or project_name not in project_names:
                 logger.debug("Projektauswahl abgebrochen oder ungültig")
-                return
+                return None
 
             project = next(
                 p for p in self.project_manager.projects if p["name"] == project_name
             )
-
-        if self.current_project_name == project["name"] and hasattr(
-            self, "project_window"
-        ):
-            self.project_window.handle_external_data(data)
-        else:
-            threading.Thread(
-                target=self._download_worker, args=(data, project), daemon=True
-            ).start()
+        return project
 
     def _ask_project_selection(self, project_names):
         selection = {"name": None}
@@ -201,32 +351,27 @@ class WdxApp:
         images_dir.mkdir(exist_ok=True)
         sites_dir.mkdir(exist_ok=True)
 
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/91.0.4472.124 Safari/537.36"
-            )
-        }
-
-        html_content = ""
+        icon_href = None
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            html_content = response.text
-
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            html_filename = f"page_{source_id}_{timestamp}.html"
-            with open(sites_dir / html_filename, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            with http_get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                new_source["etag"] = response.headers.get("ETag", "")
+                new_source["last_modified"] = response.headers.get("Last-Modified", "")
+                html_filename, digest, icon_href = stream_snapshot(
+                    response, sites_dir, **self._snapshot_options()
+                )
+            new_source["content_hash"] = digest
 
             new_source["saved_pages"].append(
                 {
                     "file": html_filename,
+                    "hash": digest,
                     "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 }
             )
             logger.debug("HTML gespeichert: %s", html_filename)
+        except SnapshotTooLarge as exc:
+            logger.warning("HTML-Snapshot übersprungen — url=%s: %s", url, exc)
         except requests.exceptions.Timeout:
             logger.warning("HTML-Download Timeout — url=%s", url)
         except requests.exceptions.HTTPError as exc:
@@ -239,68 +384,11 @@ class WdxApp:
         # --- favicon ------------------------------------------------------
         fav_path = None
         try:
-            icon_url = None
-            base_url = ""
-            try:
-                parsed_uri = urlparse(url)
-                base_url = f"{parsed_uri.scheme}://{parsed_uri.netloc}"
-            except Exception as exc:
-                logger.debug("Base-URL konnte nicht ermittelt werden: %s", exc)
-
-            if html_content and base_url:
-                try:
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    icon_link = soup.find(
-                        "link",
-                        rel=lambda x: x
-                        and x.lower() in ["icon", "shortcut icon", "apple-touch-icon"],
-                    )
-                    if icon_link and icon_link.get("href"):
-                        icon_url = urljoin(base_url, icon_link.get("href"))
-                except Exception as exc:
-                    logger.debug("Favicon-Link im HTML nicht gefunden: %s", exc)
-
-            if not icon_url and base_url:
-                icon_url = urljoin(base_url, "/favicon.ico")
-
-            fav_content = None
-            if icon_url:
-                try:
-                    fav_resp = requests.get(icon_url, headers=headers, timeout=5)
-                    if fav_resp.status_code == 200 and len(fav_resp.content) > 0:
-                        fav_content = fav_resp.content
-                        logger.debug("Favicon von %s geladen", icon_url)
-                except requests.exceptions.RequestException as exc:
-                    logger.debug("Favicon-Download fehlgeschlagen (%s): %s", icon_url, exc)
-
-            if not fav_content and base_url:
-                try:
-                    google_url = (
-                        f"https://www.google.com/s2/favicons?domain={base_url}&sz=64"
-                    )
-                    g_resp = requests.get(google_url, headers=headers, timeout=5)
-                    if g_resp.status_code == 200:
-                        fav_content = g_resp.content
-                        logger.debug("Favicon via Google Fallback geladen")
-                except requests.exceptions.RequestException as exc:
-                    logger.debug("Google-Favicon-Fallback fehlgeschlagen: %s", exc)
-
-            if fav_content:
-                fav_name = f"favicon_{source_id}.ico"
-                if b"PNG" in fav_content[:8]:
-                    fav_name = f"favicon_{source_id}.png"
-                elif b"JFIF" in fav_content[:10] or b"Exif" in fav_content[:10]:
-                    fav_name = f"favicon_{source_id}.jpg"
-
-                fav_full_path = images_dir / fav_name
-                with open(fav_full_path, "wb") as f:
-                    f.write(fav_content)
+            fav_name = get_favicon_cache().install(url, images_dir, icon_href)
+            if fav_name:
                 new_source["favicon"] = fav_name
-                fav_path = fav_full_path
-                logger.debug("Favicon gespeichert: %s", fav_name)
-
-        except OSError as exc:
-            logger.error("Favicon konnte nicht auf Disk geschrieben werden: %s", exc)
+                fav_path = images_dir / fav_name
+                logger.debug("Favicon zugeordnet: %s", fav_name)
         except Exception as exc:
             logger.exception("Unerwarteter Fehler im Favicon-Worker: %s", exc)
 
@@ -309,7 +397,7 @@ class WdxApp:
             try:
                 existing_colors = {
                     item["color"]
-                    for item in project["data"].get("items", [])
+                    for item in self.project_manager.ensure_loaded(project).get("items", [])
                     if "color" in item
                 }
                 new_source["color"] = get_smart_color_for_source(
@@ -319,11 +407,106 @@ class WdxApp:
             except Exception as exc:
                 logger.warning("Farbanalyse fehlgeschlagen: %s", exc)
 
-        self.root.after(
-            0, lambda: self._finalize_source_add_safe(project, new_source)
+        return new_source
+
+    # ── Download-Jobs ──────────────────────────────────────────────────────
+    def _run_add_source_job(self, payload):
+        project = self._find_project(payload["project"])
+        if project is None:
+            raise LookupError(f"Projekt '{payload['project']}' nicht gefunden")
+        return self._download_worker(payload["data"], project)
+
+    def _on_add_source_job_done(self, payload, result, error):
+        self.root.after(0, lambda: self._complete_add_source(payload, result, error))
+
+    def _on_add_source_batch_done(self, meta, sources):
+        self.root.after(0, lambda: self._complete_add_batch(meta, sources))
+
+    def _complete_add_batch(self, meta, sources):
+        project = self._find_project(meta["project"])
+        if project is None:
+            logger.error(
+                "Batch von %d Quelle(n) verworfen — Projekt fehlt: %s",
+                len(sources), meta["project"],
+            )
+            return
+        self._finalize_batch_add_safe(project, sources)
+
+    def _complete_add_source(self, payload, source, error):
+        project = self._find_project(payload["project"])
+        if error is not None or project is None:
+            logger.error(
+                "Quelle konnte nicht hinzugefügt werden (%s): %s",
+                payload["data"].get("url", "?"), error or "Projekt fehlt",
+            )
+            return
+        self._finalize_source_add_safe(project, source)
+
+    def _run_reload_job(self, payload):
+        project = self._find_project(payload["project"])
+        if project is None:
+            raise LookupError(f"Projekt '{payload['project']}' nicht gefunden")
+        source = next(
+            (
+                item
+                for item in self.project_manager.ensure_loaded(project).get("items", [])
+                if item.get("id") == payload["source_id"]
+            ),
+            None,
         )
+        return fetch_page_snapshot(
+            payload["url"], payload["source_id"], project["path"], source,
+            **self._snapshot_options(),
+        )
+
+    def _on_reload_job_done(self, payload, result, error):
+        self.root.after(0, lambda: self._complete_reload(payload, result, error))
+
+    def _complete_reload(self, payload, result, error):
+        url = payload["url"]
+        if error is not None:
+            if isinstance(error, SnapshotTooLarge):
+                logger.warning("Reload übersprungen — url=%s: %s", url, error)
+                message = f"Seite zu groß zum Speichern:\n{error}"
+            elif isinstance(error, requests.exceptions.Timeout):
+                logger.warning("Reload Timeout — url=%s", url)
+                message = f"Zeitüberschreitung beim Laden von:\n{url}"
+            elif isinstance(error, requests.exceptions.HTTPError):
+                logger.warning("Reload HTTP-Fehler — url=%s: %s", url, error)
+                message = f"Seite nicht erreichbar:\n{error}"
+            elif isinstance(error, requests.exceptions.RequestException):
+                logger.error("Reload fehlgeschlagen — url=%s: %s", url, error)
+                message = f"Verbindungsfehler:\n{error}"
+            else:
+                logger.error("Reload fehlgeschlagen — url=%s: %s", url, error)
+                return
+            messagebox.showerror("Fehler", message, parent=self.root)
+            return
+
+        window = self._window_for(payload["project"])
+        if window is not None:
+            window._finalize_reload(payload["source_id"], result)
+            return
+
+        project = self._find_project(payload["project"])
+        if project is None:
+            return
+
+        def update_logic(data):
+            for item in data.get("items", []):
+                if item.get("id") == payload["source_id"]:
+                    apply_snapshot(item, result)
+                    break
+
+        self.project_manager.update_project_file_safe(project, update_logic)
+        logger.info("Seite im Hintergrund aktualisiert: %s", payload["source_id"])
 
     def _finalize_source_add_safe(self, project, source):
+        window = self._window_for(project["name"])
+        if window is not None:
+            window._add_external_source_to_gui(source)
+            return
+
         def update_logic(data):
             if "items" not in data:
                 data["items"] = []
@@ -345,6 +528,37 @@ class WdxApp:
                 f"Inhalt wurde in '{project['name']}' gespeichert.",
             )
 
+    def _finalize_batch_add_safe(self, project, sources):
+        if not sources:
+            logger.warning("Batch ohne erfolgreich verarbeitete Quellen — nichts gespeichert")
+            return
+
+        for index, source in enumerate(sources):
+            source["pos_x"] = 300 + (index * 20) % 500
+            source["pos_y"] = 300 + (index * 20 // 500) * 100
+
+        window = self._window_for(project["name"])
+        if window is not None:
+            window.add_external_sources(sources)
+        else:
+            def update_logic(data):
+                if "items" not in data:
+                    data["items"] = []
+                data["items"].extend(sources)
+
+            self.project_manager.update_project_file_safe(project, update_logic)
+            if self.current_project_name is None:
+                self.main_window.refresh_and_update()
+
+        logger.info(
+            "Batch gespeichert — %d Quelle(n) in '%s'", len(sources), project["name"]
+        )
+        if self.project_manager.get_setting("show_prompts", True):
+            messagebox.showinfo(
+                "Gespeichert",
+                f"{len(sources)} Quelle(n) wurden in '{project['name']}' gespeichert.",
+            )
+
 
 if __name__ == "__main__":
     root = ttk.Window()
@@ -352,6 +566,11 @@ if __name__ == "__main__":
     try:
         root.mainloop()
     finally:
-        if hasattr(app, "httpd"):
-            app.httpd.shutdown()
+        stop_server(app)
+        app.download_scheduler.shutdown()
+        app.project_manager.writer.shutdown()
+        app.project_manager.compact_all()
+        app.project_manager.close_store()
+        app.project_manager.sizes.save()
+        close_session()
         logger.info("wdx beendet")
\ No newline at end of file
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from constants import BULK_REFRESH_PER_HOST, BULK_REFRESH_RATE
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """Token-Bucket: höchstens ``rate`` Anfragen pro Sekunde über alle Worker."""
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self._tokens = self.rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def interleave_by_host(sources):
+    """Sortiert Quellen reihum nach Host, damit Worker nicht am selben Host warten."""
+    by_host = OrderedDict()
+    for source in sources:
+        by_host.setdefault(urlparse(source["url"]).netloc.lower(), []).append(source)
+    queues = list(by_host.values())
+    ordered = []
+    while queues:
+        for queue in list(queues):
+            ordered.append(queue.pop(0))
+            if not queue:
+                queues.remove(queue)
+    return ordered
+
+
+class HostThrottle:
+    """Drosselt Sammel-Aktualisierungen in den Download-Jobs selbst.
+
+    ``slot(url)`` wartet auf einen von höchstens ``per_host`` gleichzeitigen
+    Plätzen pro Host und danach auf die globale Ratenbegrenzung. Die Worker
+    stellt der app-weite ``DownloadScheduler``.
+    """
+
+    def __init__(self, per_host=BULK_REFRESH_PER_HOST, rate=BULK_REFRESH_RATE):
+        self.per_host = max(1, int(per_host))
+        self._limiter = RateLimiter(rate)
+        self._host_slots = {}
+        self._lock = threading.Lock()
+
+    def _slot_for(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            return self._host_slots.setdefault(host, threading.Semaphore(self.per_host))
+
+    @contextmanager
+    def slot(self, url):
+        with self._slot_for(url):
+            self._limiter.acquire()
+            yield
@@ -9,6 +9,22 @@ python -m compileall project_manager.py
 python -m compileall project_window.py
 python -m compileall utils.py
 python -m compileall server.py
+python -m compileall download_scheduler.py
+python -m compileall page_fetcher.py
+python -m compileall http_client.py
+python -m compileall favicon_cache.py
+python -m compileall bulk_refresh.py
+python -m compileall snapshot_store.py
+python -m compileall project_journal.py
+python -m compileall project_writer.py
+python -m compileall sqlite_store.py
+python -m compileall size_ledger.py
+python -m compileall file_watcher.py
+python -m compileall image_cache.py
+python -m compileall spatial_index.py
+python -m compileall item_index.py
+python -m compileall search_index.py
+python -m compileall page_index.py
 ren .\__pycache__\constants.cpython-314.pyc constants.pyc
 ren .\__pycache__\dialogs.cpython-314.pyc dialogs.pyc
 ren .\__pycache__\__main__.cpython-314.pyc __main__.pyc
@@ -19,6 +35,22 @@ ren .\__pycache__\project_manager.cpython-314.pyc project_manager.pyc
 ren .\__pycache__\project_window.cpython-314.pyc project_window.pyc
 ren .\__pycache__\utils.cpython-314.pyc utils.pyc
 ren .\__pycache__\server.cpython-314.pyc server.pyc
+ren .\__pycache__\download_scheduler.cpython-314.pyc download_scheduler.pyc
+ren .\__pycache__\page_fetcher.cpython-314.pyc page_fetcher.pyc
+ren .\__pycache__\http_client.cpython-314.pyc http_client.pyc
+ren .\__pycache__\favicon_cache.cpython-314.pyc favicon_cache.pyc
+ren .\__pycache__\bulk_refresh.cpython-314.pyc bulk_refresh.pyc
+ren .\__pycache__\snapshot_store.cpython-314.pyc snapshot_store.pyc
+ren .\__pycache__\project_journal.cpython-314.pyc project_journal.pyc
+ren .\__pycache__\project_writer.cpython-314.pyc project_writer.pyc
+ren .\__pycache__\sqlite_store.cpython-314.pyc sqlite_store.pyc
+ren .\__pycache__\size_ledger.cpython-314.pyc size_ledger.pyc
+ren .\__pycache__\file_watcher.cpython-314.pyc file_watcher.pyc
+ren .\__pycache__\image_cache.cpython-314.pyc image_cache.pyc
+ren .\__pycache__\spatial_index.cpython-314.pyc spatial_index.pyc
+ren .\__pycache__\item_index.cpython-314.pyc item_index.pyc
+ren .\__pycache__\search_index.cpython-314.pyc search_index.pyc
+ren .\__pycache__\page_index.cpython-314.pyc page_index.pyc
 mkdir .\__pycache__\com.crackyOS.wdx
 move .\__pycache__\*.pyc .\__pycache__\com.crackyOS.wdx\
 copy ..\wdx_extension\wdx_extension.crx .\__pycache__\com.crackyOS.wdx\
@@ -14,3 +14,33 @@ REG_PATH = r"Software\crackyOS\wdx"
 INVALID_CHARS = r'[<>:"/\\|?*]'
 DEFAULT_COLOR = "#ffffff"
 PORT = 8765
+SERVER_MAX_CONNECTIONS = 16
+SERVER_KEEPALIVE_TIMEOUT = 15
+SERVER_MAX_BODY_SIZE = 32 * 1024 * 1024
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_JOBS_FILE = WDX_DIR / "download_jobs.json"
+HTTP_POOL_HOSTS = 32
+HTTP_POOL_SIZE = 8
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 512
+FAVICON_CACHE_DIR = WDX_DIR / "favicons"
+FAVICON_CACHE_TTL = 7 * 24 * 3600
+FAVICON_NEGATIVE_TTL = 3600
+BULK_REFRESH_PER_HOST = 2
+BULK_REFRESH_RATE = 5
+SNAPSHOT_MAX_MB = 20
+SNAPSHOT_CHUNK_SIZE = 64 * 1024
+JOURNAL_COMPACT_ENTRIES = 500
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+PROJECT_WRITE_DELAY = 0.5
+PROJECT_WRITE_MAX_DELAY = 3.0
+SQLITE_DB_FILE = WDX_DIR / "wdx.sqlite3"
+SIZE_LEDGER_FILE = WDX_DIR / "sizes.json"
+SIZE_SCAN_INTERVAL = 24 * 3600
+FILE_WATCH_POLL_INTERVAL = 2.0
+FILE_WATCH_DEBOUNCE = 0.2
+LOD_ZOOM_PERCENT = 50
+IMAGE_CACHE_SIZE = 256
+PHOTO_CACHE_SIZE = 512
+IMAGE_SIZE_STEP = 2
+SPATIAL_CELL_SIZE = 512
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox, filedialog
 import pyperclip
 from pathlib import Path
+from size_ledger import get_size_ledger
 from ttkbootstrap.constants import *
 
 
@@ -130,7 +131,8 @@ class SourceDialog(tk.Toplevel):
 
             try:
                 import shutil as _shutil
-                _shutil.copy2(str(src), str(dest))
+                with get_size_ledger().tracking(dest):
+                    _shutil.copy2(str(src), str(dest))
                 insert_path = f"images/{dest_name}"
             except OSError as exc:
                 import tkinter.messagebox as _mb
@@ -404,7 +406,8 @@ class FileCardDialog(tk.Toplevel):
 
             try:
                 import shutil as _shutil
-                _shutil.copy2(str(src), str(dest))
+                with get_size_ledger().tracking(dest):
+                    _shutil.copy2(str(src), str(dest))
                 # Relativer Pfad — vom MarkdownReader aus project_path/images/ auflösbar
                 insert_path = f"images/{dest_name}"
             except OSError as exc:
@@ -0,0 +1,227 @@
+import datetime
+import heapq
+import itertools
+import json
+import os
+import threading
+import uuid
+
+from constants import WDX_DIR, DOWNLOAD_JOBS_FILE, DOWNLOAD_WORKERS
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+PRIORITY_USER = 0
+PRIORITY_BATCH = 1
+PRIORITY_BULK = 2
+
+PERSIST_DELAY = 0.5
+
+
+class DownloadScheduler:
+    """App-weiter Download-Scheduler mit festem Worker-Pool und persistenter Job-Tabelle.
+
+    Jobs bestehen aus einer Art (``kind``) und einem JSON-fähigen Payload. Für jede
+    Art werden über ``register`` eine Ausführungs- und eine Abschlussfunktion
+    hinterlegt, damit auch nach einem Neustart wiederhergestellte Jobs laufen können.
+
+    ``submit_batch`` fasst Jobs zu einem Stapel zusammen: Die Ergebnisse werden
+    mit der Job-Tabelle gespeichert und nach dem letzten Job gesammelt an
+    ``batch_done`` übergeben — auch wenn der Stapel einen Neustart überdauert.
+    """
+
+    def __init__(self, jobs_file=DOWNLOAD_JOBS_FILE, workers=DOWNLOAD_WORKERS):
+        self.jobs_file = jobs_file
+        self.workers = max(1, int(workers))
+        self._handlers = {}
+        self._jobs = {}
+        self._batches = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._running = False
+        self._threads = []
+        self._persist_timer = None
+        self._persist_lock = threading.Lock()
+
+    def register(self, kind, run, done=None, batch_done=None):
+        """run(payload) -> Ergebnis; done(payload, result, error) läuft im Worker-Thread.
+
+        ``batch_done(meta, results)`` erhält die Ergebnisse aller erfolgreichen
+        Jobs eines Stapels (ebenfalls im Worker-Thread).
+        """
+        self._handlers[kind] = (run, done, batch_done)
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            restored = self._load_jobs()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f"wdx-download-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(
+            "Download-Scheduler gestartet — %d Worker, %d Job(s) wiederhergestellt",
+            self.workers, restored,
+        )
+
+    def shutdown(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            if self._persist_timer:
+                self._persist_timer.cancel()
+                self._persist_timer = None
+        self._persist_now()
+        logger.info("Download-Scheduler beendet")
+
+    def submit(self, kind, payload, priority=PRIORITY_USER):
+        return self.submit_many([(kind, payload)], priority)[0]
+
+    def submit_batch(self, kind, payloads, priority=PRIORITY_BATCH, meta=None):
+        """Reiht ``payloads`` als Stapel ein; gibt die Stapel-Id zurück."""
+        if not payloads:
+            return None
+        batch_id = str(uuid.uuid4())
+        with self._cond:
+            self._batches[batch_id] = {
+                "kind": kind, "meta": meta, "pending": len(payloads), "results": [],
+            }
+        self.submit_many([(kind, payload) for payload in payloads], priority, batch_id)
+        return batch_id
+
+    def submit_many(self, jobs, priority=PRIORITY_USER, batch_id=None):
+        job_ids = []
+        with self._cond:
+            for kind, payload in jobs:
+                if kind not in self._handlers:
+                    raise KeyError(f"Unbekannte Job-Art: {kind}")
+                job = {
+                    "id": str(uuid.uuid4()),
+                    "kind": kind,
+                    "priority": priority,
+                    "payload": payload,
+                    "created": datetime.datetime.now().isoformat(),
+                }
+                if batch_id is not None:
+                    job["batch"] = batch_id
+                self._enqueue(job)
+                job_ids.append(job["id"])
+            self._schedule_persist()
+            self._cond.notify(len(job_ids))
+        logger.debug("%d Job(s) eingereiht (Priorität %d)", len(job_ids), priority)
+        return job_ids
+
+    def stats(self):
+        with self._cond:
+            return {
+                "queued": len(self._jobs) - self._in_flight,
+                "in_flight": self._in_flight,
+                "workers": self.workers,
+            }
+
+    def _enqueue(self, job):
+        self._jobs[job["id"]] = job
+        heapq.heappush(self._heap, (job["priority"], next(self._seq), job["id"]))
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                _, _, job_id = heapq.heappop(self._heap)
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                self._in_flight += 1
+            self._run_job(job)
+
+    def _run_job(self, job):
+        run, done, batch_done = self._handlers[job["kind"]]
+        result, error = None, None
+        try:
+            result = run(job["payload"])
+        except Exception as exc:
+            error = exc
+            logger.warning("Job %s (%s) fehlgeschlagen: %s", job["id"], job["kind"], exc)
+        finished = None
+        with self._cond:
+            self._in_flight -= 1
+            self._jobs.pop(job["id"], None)
+            # Ergebnis und erledigter Job landen im selben Abbild der Job-Tabelle
+            batch = self._batches.get(job.get("batch"))
+            if batch is not None:
+                batch["pending"] -= 1
+                if error is None and result is not None:
+                    batch["results"].append(result)
+                if batch["pending"] <= 0:
+                    finished = self._batches.pop(job["batch"])
+            self._schedule_persist()
+        if batch is not None and batch_done is not None:
+            if finished is not None:
+                try:
+                    batch_done(finished["meta"], finished["results"])
+                except Exception as exc:
+                    logger.exception("Abschluss von Stapel %s fehlgeschlagen: %s", job["batch"], exc)
+            return
+        if done is None:
+            return
+        try:
+            done(job["payload"], result, error)
+        except Exception as exc:
+            logger.exception("Abschluss von Job %s fehlgeschlagen: %s", job["id"], exc)
+
+    def _schedule_persist(self):
+        if self._persist_timer is not None:
+            return
+        self._persist_timer = threading.Timer(PERSIST_DELAY, self._persist_now)
+        self._persist_timer.daemon = True
+        self._persist_timer.start()
+
+    def _persist_now(self):
+        # Abbild unter der Schreibsperre ziehen, damit kein älteres ein neueres überschreibt
+        with self._persist_lock:
+            try:
+                with self._cond:
+                    self._persist_timer = None
+                    payload = json.dumps(
+                        {"jobs": list(self._jobs.values()), "batches": self._batches}
+                    )
+                WDX_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.jobs_file.with_suffix(".tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.jobs_file)
+            except (OSError, TypeError) as exc:
+                logger.error("Job-Tabelle konnte nicht gespeichert werden: %s", exc)
+
+    def _load_jobs(self):
+        if not self.jobs_file.exists():
+            return 0
+        try:
+            with open(self.jobs_file, "r", encoding="utf-8") as f:
+                table = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error("Job-Tabelle nicht lesbar (%s): %s", self.jobs_file, exc)
+            return 0
+        if not isinstance(table, dict):
+            logger.error("Job-Tabelle mit unbekanntem Format verworfen: %s", self.jobs_file)
+            return 0
+
+        jobs = table.get("jobs", [])
+        self._batches = table.get("batches", {})
+        restored = 0
+        for job in jobs:
+            if job.get("kind") not in self._handlers:
+                logger.warning("Unbekannte Job-Art verworfen: %s", job.get("kind"))
+                continue
+            self._enqueue(job)
+            restored += 1
+        return restored
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from html.parser import HTMLParser
+from urllib.parse import urlparse, urljoin
+
+import requests
+
+from constants import FAVICON_CACHE_DIR, FAVICON_CACHE_TTL, FAVICON_NEGATIVE_TTL
+from http_client import http_get
+from size_ledger import get_size_ledger
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+ICON_RELS = ("icon", "shortcut icon", "apple-touch-icon")
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class IconLinkParser(HTMLParser):
+    """Inkrementeller Parser für das erste <link rel=icon>.
+
+    Kann stückweise mit ``feed`` gefüttert werden und ignoriert alles nach
+    ``</head>`` bzw. ``<body>`` (``done`` ist dann gesetzt).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.href = None
+        self.done = False
+
+    def feed(self, data):
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+        elif tag == "link":
+            attrs = dict(attrs)
+            rel = (attrs.get("rel") or "").lower().strip()
+            if attrs.get("href") and (rel in ICON_RELS or "icon" in rel.split()):
+                self.href = attrs["href"]
+                self.done = True
+
+    handle_startendtag = handle_starttag
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
+
+def find_icon_href(html_content):
+    """Sucht das erste <link rel=icon> im HTML und gibt dessen href zurück."""
+    parser = IconLinkParser()
+    try:
+        parser.feed(html_content)
+    except Exception as exc:
+        logger.debug("Favicon-Link im HTML nicht gefunden: %s", exc)
+    return parser.href
+
+
+def favicon_extension(content: bytes) -> str:
+    if b"PNG" in content[:8]:
+        return ".png"
+    if b"JFIF" in content[:10] or b"Exif" in content[:10]:
+        return ".jpg"
+    return ".ico"
+
+
+class FaviconCache:
+    """Inhaltsadressierter Favicon-Speicher pro Domain mit TTL.
+
+    Die Icons liegen einmalig unter ``FAVICON_CACHE_DIR`` und werden bei Bedarf als
+    ``fav_<hash>.<ext>`` in den ``images/``-Ordner eines Projekts übernommen, damit
+    Exporte weiterhin vollständig sind.
+    """
+
+    def __init__(self, cache_dir=FAVICON_CACHE_DIR, ttl=FAVICON_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.index_file = cache_dir / "index.json"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._domain_locks = {}
+        self._index = self._load_index()
+
+    def install(self, page_url, images_dir, icon_href=None):
+        """Stellt das Favicon der Domain im Projekt bereit und gibt den Dateinamen zurück.
+
+        ``icon_href`` ist der bereits aus dem Seitenkopf gelesene Icon-Link, falls vorhanden.
+        """
+        entry = self.lookup(page_url, icon_href)
+        if not entry or not entry.get("hash"):
+            return None
+        blob = self.cache_dir / f"{entry['hash']}{entry['ext']}"
+        name = f"fav_{entry['hash']}{entry['ext']}"
+        target = images_dir / name
+        if target.exists():
+            return name
+        try:
+            images_dir.mkdir(exist_ok=True)
+            with get_size_ledger().tracking(target):
+                try:
+                    os.link(blob, target)
+                except OSError:
+                    shutil.copyfile(blob, target)
+            logger.debug("Favicon aus Cache übernommen: %s", name)
+            return name
+        except OSError as exc:
+            logger.error("Favicon konnte nicht ins Projekt kopiert werden: %s", exc)
+            return None
+
+    def lookup(self, page_url, icon_href=None):
+        parsed = urlparse(page_url)
+        domain = parsed.netloc.lower()
+        if not domain:
+            return None
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+
+        with self._lock:
+            domain_lock = self._domain_locks.setdefault(domain, threading.Lock())
+        # Parallele Downloads derselben Domain warten auf den ersten Abruf
+        with domain_lock:
+            with self._lock:
+                entry = self._index.get(domain)
+            if entry and self._is_fresh(entry):
+                return entry
+            entry = self._fetch(domain, base_url, icon_href)
+            with self._lock:
+                previous = self._index.get(domain)
+                self._index[domain] = entry
+                self._save_index()
+                if previous and previous.get("hash") not in (None, entry.get("hash")):
+                    self._drop_blob_if_unused(previous)
+            return entry
+
+    def _drop_blob_if_unused(self, entry):
+        if any(e.get("hash") == entry["hash"] for e in self._index.values()):
+            return
+        # Projekte halten eigene Kopien/Hardlinks, der Cache-Blob ist entbehrlich
+        try:
+            (self.cache_dir / f"{entry['hash']}{entry['ext']}").unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug("Veralteter Favicon-Blob nicht löschbar: %s", exc)
+
+    def _is_fresh(self, entry):
+        ttl = self.ttl if entry.get("hash") else FAVICON_NEGATIVE_TTL
+        if time.time() - entry.get("fetched", 0) > ttl:
+            return False
+        if entry.get("hash"):
+            return (self.cache_dir / f"{entry['hash']}{entry['ext']}").exists()
+        return True
+
+    def _fetch(self, domain, base_url, icon_href):
+        icon_url = urljoin(base_url, icon_href or "/favicon.ico")
+
+        fav_content = None
+        try:
+            resp = http_get(icon_url, timeout=5)
+            if resp.status_code == 200 and len(resp.content) > 0:
+                fav_content = resp.content
+                logger.debug("Favicon von %s geladen", icon_url)
+        except requests.exceptions.RequestException as exc:
+            logger.debug("Favicon-Download fehlgeschlagen (%s): %s", icon_url, exc)
+
+        if not fav_content:
+            try:
+                resp = http_get(
+                    f"https://www.google.com/s2/favicons?domain={base_url}&sz=64",
+                    timeout=5,
+                )
+                if resp.status_code == 200 and resp.content:
+                    fav_content = resp.content
+                    logger.debug("Favicon via Google Fallback geladen")
+            except requests.exceptions.RequestException as exc:
+                logger.debug("Google-Favicon-Fallback fehlgeschlagen: %s", exc)
+
+        entry = {"hash": None, "ext": "", "fetched": time.time()}
+        if not fav_content:
+            logger.debug("Kein Favicon für %s gefunden", domain)
+            return entry
+
+        digest = hashlib.sha1(fav_content).hexdigest()
+        ext = favicon_extension(fav_content)
+        blob = self.cache_dir / f"{digest}{ext}"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if not blob.exists():
+                with open(blob, "wb") as f:
+                    f.write(fav_content)
+            entry.update({"hash": digest, "ext": ext})
+        except OSError as exc:
+            logger.error("Favicon-Cache nicht beschreibbar: %s", exc)
+        return entry
+
+    def _load_index(self):
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Favicon-Index nicht lesbar, wird neu aufgebaut: %s", exc)
+            return {}
+
+    def _save_index(self):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as exc:
+            logger.error("Favicon-Index konnte nicht gespeichert werden: %s", exc)
+
+
+def get_favicon_cache() -> FaviconCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FaviconCache()
+        return _cache
@@ -0,0 +1,160 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from constants import FILE_WATCH_POLL_INTERVAL, FILE_WATCH_DEBOUNCE
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError) as exc:
+        logger.debug("inotify nicht verfügbar: %s", exc)
+        return None
+
+
+def file_signature(path):
+    """``(mtime_ns, größe)`` einer Datei oder ``None``, wenn sie fehlt."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileWatcher:
+    """Meldet Änderungen an einzelnen Dateien eines Verzeichnisses.
+
+    Unter Linux per inotify, sonst (oder wenn inotify nicht eingerichtet werden
+    kann) per Abfrage von mtime und Größe alle ``poll_interval`` Sekunden. Kurz
+    aufeinanderfolgende Ereignisse werden ``debounce`` Sekunden lang gesammelt
+    und als eine Menge von Dateinamen an ``on_change`` übergeben — im
+    Watcher-Thread, nicht im Tk-Thread.
+    """
+
+    def __init__(
+        self, directory, names, on_change,
+        poll_interval=FILE_WATCH_POLL_INTERVAL, debounce=FILE_WATCH_DEBOUNCE,
+    ):
+        self.directory = Path(directory)
+        self.names = set(names)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.backend = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._fd = None
+
+    def start(self):
+        libc = _load_inotify()
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                wd = libc.inotify_add_watch(fd, os.fsencode(self.directory), WATCH_MASK)
+                if wd >= 0:
+                    self._fd = fd
+                    self.backend = "inotify"
+                else:
+                    logger.debug(
+                        "inotify_add_watch fehlgeschlagen (errno %d)", ctypes.get_errno()
+                    )
+                    os.close(fd)
+        if self.backend is None:
+            self.backend = "polling"
+        target = self._inotify_loop if self.backend == "inotify" else self._poll_loop
+        self._thread = threading.Thread(target=target, name="wdx-file-watch", daemon=True)
+        self._thread.start()
+        logger.debug("Dateiüberwachung gestartet (%s): %s", self.backend, self.directory)
+
+    def stop(self):
+        # Der Thread schließt den inotify-Deskriptor selbst, spätestens nach 1 s
+        self._stop.set()
+
+    def _emit(self, changed):
+        try:
+            self.on_change(changed)
+        except Exception as exc:
+            logger.exception("Fehler bei Änderungsbenachrichtigung: %s", exc)
+
+    def _read_events(self):
+        changed = set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            _, _, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if name in self.names:
+                changed.add(name)
+        return changed
+
+    def _inotify_loop(self):
+        try:
+            self._watch_inotify(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def _watch_inotify(self, fd):
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready:
+                    continue
+                changed = self._read_events()
+                # Weitere Ereignisse desselben Schreibvorgangs abwarten
+                deadline = time.monotonic() + self.debounce
+                while not self._stop.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    ready, _, _ = select.select([fd], [], [], remaining)
+                    if ready:
+                        changed |= self._read_events()
+            except (OSError, ValueError) as exc:
+                if not self._stop.is_set():
+                    logger.warning("inotify-Überwachung beendet: %s", exc)
+                return
+            if changed and not self._stop.is_set():
+                self._emit(changed)
+
+    def _poll_loop(self):
+        signatures = {name: file_signature(self.directory / name) for name in self.names}
+        while not self._stop.wait(self.poll_interval):
+            changed = set()
+            for name in self.names:
+                current = file_signature(self.directory / name)
+                if current != signatures[name]:
+                    signatures[name] = current
+                    changed.add(name)
+            if changed:
+                self._emit(changed)
@@ -0,0 +1,147 @@
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from constants import HTTP_POOL_HOSTS, HTTP_POOL_SIZE, DNS_CACHE_TTL, DNS_CACHE_SIZE
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/91.0.4472.124 Safari/537.36"
+    )
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+_dns_cache = {}
+_dns_lock = threading.Lock()
+
+
+def resolve(host, port):
+    """``getaddrinfo`` für TCP mit TTL-Cache, nur für Verbindungen dieses Moduls.
+
+    ``getaddrinfo`` liefert keine TTL der Einträge; ``DNS_CACHE_TTL`` ist daher
+    eine Obergrenze, und ``forget`` verwirft einen Eintrag, sobald keine seiner
+    Adressen mehr erreichbar ist. ``DNS_CACHE_TTL = 0`` schaltet den Cache ab.
+    """
+    if DNS_CACHE_TTL <= 0:
+        return socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+    result = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    with _dns_lock:
+        if len(_dns_cache) >= DNS_CACHE_SIZE:
+            # Abgelaufene Einträge verwerfen, notfalls alles
+            for stale in [k for k, v in _dns_cache.items() if v[0] <= now]:
+                del _dns_cache[stale]
+            if len(_dns_cache) >= DNS_CACHE_SIZE:
+                _dns_cache.clear()
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+
+def forget(host, port):
+    with _dns_lock:
+        _dns_cache.pop((host, port), None)
+
+
+class _CachedResolveMixin:
+    """Verbindet über die Adressen aus ``resolve`` statt über eine eigene DNS-Abfrage.
+
+    ``host`` bleibt unverändert (Host-Header, SNI, Zertifikatsprüfung); nur die
+    Zieladresse (``_dns_host``) wird nacheinander auf die aufgelösten IPs gesetzt.
+    """
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = resolve(host, self.port)
+        except OSError:
+            # Fehlermeldung und Ausnahme wie ohne Cache
+            return super()._new_conn()
+        error = None
+        for _, _, _, _, sockaddr in addresses:
+            self._dns_host = sockaddr[0]
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as exc:
+                error = exc
+            finally:
+                self._dns_host = host
+        forget(host, self.port)
+        raise error
+
+
+class _CachedHTTPConnection(_CachedResolveMixin, HTTPConnection):
+    pass
+
+
+class _CachedHTTPSConnection(_CachedResolveMixin, HTTPSConnection):
+    pass
+
+
+class _CachedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedHTTPConnection
+
+
+class _CachedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedHTTPSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """``HTTPAdapter``, dessen Verbindungen Namen über ``resolve`` auflösen."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # Eigenes dict: die Vorgabe von urllib3 ist modulweit geteilt
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedHTTPConnectionPool,
+            "https": _CachedHTTPSConnectionPool,
+        }
+
+
+def get_session() -> requests.Session:
+    """Gibt die app-weite Session mit Connection-Pool pro Host und Keep-Alive zurück."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = CachedDNSAdapter(
+                pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+            logger.debug(
+                "HTTP-Session erstellt — %d Hosts, %d Verbindungen pro Host",
+                HTTP_POOL_HOSTS, HTTP_POOL_SIZE,
+            )
+        return _session
+
+
+def http_get(url, **kwargs) -> requests.Response:
+    return get_session().get(url, **kwargs)
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
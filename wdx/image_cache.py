@@ -0,0 +1,109 @@
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+from constants import IMAGE_CACHE_SIZE, PHOTO_CACHE_SIZE, IMAGE_SIZE_STEP
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def thumbnail_size(base, zoom, minimum=8):
+    """Kantenlänge für ``base`` Pixel bei ``zoom``, auf ``IMAGE_SIZE_STEP`` gerundet.
+
+    Durch das Runden treffen wiederholte Zoomstufen (1.2 × 1/1.2 ≠ 1.0) und
+    benachbarte Zoomwerte dieselben Cache-Einträge.
+    """
+    size = int(round(base * zoom / IMAGE_SIZE_STEP)) * IMAGE_SIZE_STEP
+    return max(minimum, size)
+
+
+class ImageCache:
+    """LRU-Cache für dekodierte Bilder und daraus skalierte ``PhotoImage``-Objekte.
+
+    ``image`` dekodiert eine Datei einmal (thread-sicher, auch aus Worker-Threads
+    aufrufbar); ``photo`` liefert das ``PhotoImage`` für eine Zielgröße und darf
+    nur im Tk-Thread verwendet werden. Einträge gelten nur, solange sich mtime
+    und Größe der Datei nicht ändern. Verdrängte ``PhotoImage``s bleiben gültig,
+    solange ein Label noch eine Referenz darauf hält.
+    """
+
+    def __init__(self, max_images=IMAGE_CACHE_SIZE, max_photos=PHOTO_CACHE_SIZE):
+        self.max_images = max_images
+        self.max_photos = max_photos
+        self._lock = threading.Lock()
+        self._images = OrderedDict()
+        self._photos = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def image(self, path):
+        """Dekodiertes RGBA-Bild zu ``path`` oder ``None``, wenn es nicht lesbar ist."""
+        key = str(path)
+        signature = self._signature(key)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._images.get(key)
+            if entry is not None and entry[0] == signature:
+                self._images.move_to_end(key)
+                return entry[1]
+        try:
+            with Image.open(key) as img:
+                decoded = img.convert("RGBA")
+        except (OSError, ValueError) as exc:
+            logger.warning("Bild konnte nicht geladen werden (%s): %s", key, exc)
+            return None
+        with self._lock:
+            self._images[key] = (signature, decoded)
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+        return decoded
+
+    def photo(self, path, size):
+        """``PhotoImage`` von ``path`` in ``size`` × ``size`` Pixeln (nur Tk-Thread)."""
+        key = (str(path), size)
+        signature = self._signature(key[0])
+        with self._lock:
+            entry = self._photos.get(key)
+            if entry is not None and entry[0] == signature:
+                self._photos.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        img = self.image(path)
+        if img is None:
+            return None
+        photo = ImageTk.PhotoImage(img.resize((size, size), Image.Resampling.LANCZOS))
+        with self._lock:
+            self.misses += 1
+            self._photos[key] = (signature, photo)
+            while len(self._photos) > self.max_photos:
+                self._photos.popitem(last=False)
+        return photo
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._photos.clear()
+
+
+def get_image_cache() -> ImageCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ImageCache()
+        return _cache
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+
+class ItemIndex:
+    """Nachschlagetabellen über die Elementliste eines geöffneten Projekts.
+
+    Die Liste in ``project["data"]["items"]`` bleibt maßgeblich (sie wird
+    gespeichert und bestimmt die Reihenfolge); ``ItemIndex`` hält dazu
+    id → Element, Typ → {id: Element} und id → Position aktuell. Änderungen an
+    der Liste laufen deshalb über ``add``, ``remove``, ``move`` bzw. ``rebuild``.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.by_id = {}
+        self.by_type = defaultdict(dict)
+        self.positions = {}
+        self.rebuild(items)
+
+    def rebuild(self, items):
+        self.items = items
+        self.by_id.clear()
+        self.by_type.clear()
+        self.positions.clear()
+        for item in items:
+            self._link(item)
+
+    def _link(self, item):
+        item_id = item.get("id")
+        self.by_id[item_id] = item
+        self.by_type[item.get("type", "source")][item_id] = item
+        self.positions[item_id] = (item.get("pos_x", 300), item.get("pos_y", 300))
+
+    def __contains__(self, item_id):
+        return item_id in self.by_id
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def get(self, item_id):
+        return self.by_id.get(item_id)
+
+    def of_type(self, item_type):
+        return list(self.by_type.get(item_type, {}).values())
+
+    def add(self, item):
+        self.items.append(item)
+        self._link(item)
+
+    def extend(self, items):
+        for item in items:
+            self.add(item)
+
+    def remove(self, item_ids):
+        """Entfernt Elemente in einem Durchlauf und gibt die entfernten zurück."""
+        item_ids = {i for i in item_ids if i in self.by_id}
+        if not item_ids:
+            return []
+        removed = []
+        for item_id in item_ids:
+            item = self.by_id.pop(item_id)
+            self.by_type[item.get("type", "source")].pop(item_id, None)
+            self.positions.pop(item_id, None)
+            removed.append(item)
+        # Liste an Ort und Stelle kürzen, andere Referenzen bleiben gültig
+        self.items[:] = [i for i in self.items if i.get("id") not in item_ids]
+        return removed
+
+    def move(self, item_id, x, y):
+        """Setzt die Position; ``True``, wenn sie sich geändert hat."""
+        item = self.by_id.get(item_id)
+        if item is None or self.positions.get(item_id) == (x, y):
+            return False
+        item["pos_x"], item["pos_y"] = x, y
+        self.positions[item_id] = (x, y)
+        return True
@@ -6,8 +6,9 @@ from ttkbootstrap.widgets.scrolled import ScrolledFrame
 import re
 import math
 import time
+import threading
 
-from constants import INVALID_CHARS
+from constants import INVALID_CHARS, SNAPSHOT_MAX_MB, LOD_ZOOM_PERCENT, SERVER_MAX_CONNECTIONS
 from wdx_logger import get_logger
 
 logger = get_logger(__name__)
@@ -94,9 +95,10 @@ class MainWindow:
         return f"{s} {units[i]}"
 
     def refresh_and_update(self):
-        for project in self.project_manager.projects:
-            project["size"] = self.project_manager._get_dir_size(project["path"])
         self.update_project_tiles()
+        self.project_manager.reconcile_sizes(
+            on_done=lambda changed: self.root.after(0, self.update_project_tiles)
+        )
 
     def update_project_tiles(self):
         for widget in self.projects_frame.winfo_children():
@@ -119,11 +121,15 @@ class MainWindow:
                 tile, text=project["description"], font=("Helvetica", 10)
             ).pack(anchor="w", pady=(5, 0))
 
-            size_str = self.format_size(project.get("size", 0))
+            size_str = self.format_size(self.project_manager.project_size(project))
             last_mod = project["last_modified"][:16].replace("T", " ")
             ttk.Label(
                 tile,
-                text=f"Zuletzt geändert: {last_mod}  |  Dateigröße: {size_str}",
+                text=(
+                    f"Zuletzt geändert: {last_mod}  |  "
+                    f"Elemente: {self.project_manager.item_count(project)}  |  "
+                    f"Dateigröße: {size_str}"
+                ),
                 font=("Helvetica", 8),
                 foreground="gray",
             ).pack(anchor="w")
@@ -155,7 +161,7 @@ class MainWindow:
     def show_settings(self):
         win = ttk.Toplevel(self.root)
         win.title("Einstellungen")
-        win.geometry("560x780")
+        win.geometry("560x1020")
         try:
             win.iconbitmap("icon128.ico")
         except Exception:
@@ -187,6 +193,141 @@ class MainWindow:
             variable=var_prompts, bootstyle="round-toggle",
             command=toggle_prompts,
         ).pack(pady=5)
+
+        var_compress = tk.BooleanVar(
+            value=self.app.project_manager.get_setting("compress_snapshots", False)
+        )
+        ttk.Checkbutton(
+            win, text="Gespeicherte Seiten komprimieren (gzip)",
+            variable=var_compress, bootstyle="round-toggle",
+            command=lambda: self.app.project_manager.set_setting(
+                "compress_snapshots", var_compress.get()
+            ),
+        ).pack(pady=5)
+
+        def run_snapshot_migration():
+            if not messagebox.askyesno(
+                "Komprimieren",
+                "Alle vorhandenen gespeicherten Seiten jetzt komprimieren?",
+                parent=win,
+            ):
+                return
+
+            manager = self.app.project_manager
+
+            # Dateien im Hintergrund, Projektdaten nur im Tk-Thread ändern
+            def compress():
+                results = manager.compress_snapshot_files()
+                self.root.after(0, apply_renames, results)
+
+            def apply_renames(results):
+                manager.apply_snapshot_renames(results)
+                threading.Thread(target=finish, args=(results,), daemon=True).start()
+
+            def finish(results):
+                files, saved = manager.finish_snapshot_migration(results)
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Komprimieren",
+                    f"{files} Seite(n) komprimiert, {saved / (1024 * 1024):.1f} MB gespart.",
+                ))
+
+            threading.Thread(target=compress, daemon=True).start()
+
+        ttk.Button(
+            win, text="Vorhandene Seiten komprimieren", bootstyle="secondary-outline",
+            command=run_snapshot_migration,
+        ).pack(pady=5)
+
+        var_sqlite = tk.BooleanVar(
+            value=self.app.project_manager.get_setting("storage_backend", "json") == "sqlite"
+        )
+
+        def toggle_sqlite():
+            manager = self.app.project_manager
+            backend = "sqlite" if var_sqlite.get() else "json"
+            if manager.migrating_storage:
+                return
+            if backend == manager.get_setting("storage_backend", "json"):
+                return
+            manager.migrating_storage = True
+            sqlite_toggle.configure(state="disabled")
+
+            # Kopieren im Hintergrund, Umschalten der Ablage nur im Tk-Thread
+            def migrate():
+                migration = manager.migrate_storage(backend)
+                self.root.after(0, activate, migration)
+
+            def activate(migration):
+                if migration is None:
+                    done(False)
+                    return
+                old_store = manager.activate_storage(migration)
+                if old_store is None:
+                    done(True)
+                    return
+                names = [p["name"] for p in manager.projects]
+
+                # Alte Ablage leeren, bevor ein weiterer Wechsel sie wieder öffnen kann
+                def release():
+                    manager.release_store(old_store, names)
+                    self.root.after(0, done, True)
+
+                threading.Thread(target=release, daemon=True).start()
+
+            def done(ok):
+                manager.migrating_storage = False
+                if not win.winfo_exists():
+                    return
+                sqlite_toggle.configure(state="normal")
+                var_sqlite.set(manager.get_setting("storage_backend", "json") == "sqlite")
+                if not ok:
+                    messagebox.showerror(
+                        "Fehler", "SQLite-Datenbank konnte nicht geöffnet werden.", parent=win
+                    )
+
+            threading.Thread(target=migrate, daemon=True).start()
+
+        sqlite_toggle = ttk.Checkbutton(
+            win, text="Projekte in SQLite-Datenbank speichern",
+            variable=var_sqlite, bootstyle="round-toggle",
+            command=toggle_sqlite,
+            state="disabled" if self.app.project_manager.migrating_storage else "normal",
+        )
+        sqlite_toggle.pack(pady=5)
+
+        size_frame = ttk.Frame(win)
+        size_frame.pack(pady=5)
+        ttk.Label(size_frame, text="Max. Größe gespeicherter Seiten (MB):").pack(side="left")
+        max_mb_var = tk.IntVar(
+            value=self.app.project_manager.get_setting("snapshot_max_mb", SNAPSHOT_MAX_MB)
+        )
+        ttk.Spinbox(
+            size_frame, from_=1, to=500, width=5, textvariable=max_mb_var,
+        ).pack(side="left", padx=5)
+
+        lod_frame = ttk.Frame(win)
+        lod_frame.pack(pady=5)
+        ttk.Label(lod_frame, text="Vereinfachte Kartenansicht unter Zoom (%):").pack(side="left")
+        lod_var = tk.IntVar(
+            value=self.app.project_manager.get_setting("lod_zoom_percent", LOD_ZOOM_PERCENT)
+        )
+        ttk.Spinbox(
+            lod_frame, from_=10, to=100, increment=5, width=5, textvariable=lod_var,
+        ).pack(side="left", padx=5)
+
+        conn_frame = ttk.Frame(win)
+        conn_frame.pack(pady=5)
+        ttk.Label(
+            conn_frame, text="Max. gleichzeitige Browser-Verbindungen (ab Neustart):"
+        ).pack(side="left")
+        conn_var = tk.IntVar(
+            value=self.app.project_manager.get_setting(
+                "server_max_connections", SERVER_MAX_CONNECTIONS
+            )
+        )
+        ttk.Spinbox(
+            conn_frame, from_=1, to=64, width=5, textvariable=conn_var,
+        ).pack(side="left", padx=5)
         ttk.Separator(win).pack(fill="x", pady=15, padx=20)
 
         # ── Verschlüsselungs-Passwort ─────────────────────────────────────
@@ -265,6 +406,21 @@ class MainWindow:
                 "encryption_password", pwd_var.get()
             )
             self.app.project_manager.set_setting("show_prompts", var_prompts.get())
+            try:
+                max_mb = max(1, int(max_mb_var.get()))
+            except (tk.TclError, ValueError):
+                max_mb = SNAPSHOT_MAX_MB
+            self.app.project_manager.set_setting("snapshot_max_mb", max_mb)
+            try:
+                lod_percent = min(100, max(10, int(lod_var.get())))
+            except (tk.TclError, ValueError):
+                lod_percent = LOD_ZOOM_PERCENT
+            self.app.project_manager.set_setting("lod_zoom_percent", lod_percent)
+            try:
+                max_connections = min(64, max(1, int(conn_var.get())))
+            except (tk.TclError, ValueError):
+                max_connections = SERVER_MAX_CONNECTIONS
+            self.app.project_manager.set_setting("server_max_connections", max_connections)
 
             fmt = citation_var.get().strip()
             if not fmt:
@@ -0,0 +1,169 @@
+import codecs
+import datetime
+import hashlib
+from collections import Counter
+from pathlib import Path
+
+from constants import SNAPSHOT_MAX_MB, SNAPSHOT_CHUNK_SIZE
+from favicon_cache import IconLinkParser, get_favicon_cache
+from http_client import http_get
+from snapshot_store import (
+    GZIP_SUFFIX, SnapshotTooLarge, store_snapshot_stream, read_snapshot_bytes, release_snapshots,
+)
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def conditional_headers(source):
+    """Baut If-None-Match/If-Modified-Since aus den gespeicherten Validatoren."""
+    headers = {}
+    if source.get("etag"):
+        headers["If-None-Match"] = source["etag"]
+    if source.get("last_modified"):
+        headers["If-Modified-Since"] = source["last_modified"]
+    return headers
+
+
+def _previous_hash(source, sites_dir):
+    if source.get("content_hash"):
+        return source["content_hash"]
+    # Ältere Quellen ohne gespeicherten Hash: letzten Snapshot einmal hashen
+    for page in reversed(source.get("saved_pages", [])):
+        path = sites_dir / page.get("file", "")
+        if page.get("file") and path.exists():
+            try:
+                return hashlib.sha256(read_snapshot_bytes(path)).hexdigest()
+            except (OSError, EOFError) as exc:
+                logger.debug("Letzter Snapshot nicht lesbar (%s): %s", path.name, exc)
+            break
+    return None
+
+
+def _last_snapshot_file(source):
+    for page in reversed(source.get("saved_pages", [])):
+        if page.get("file"):
+            return page["file"]
+    return None
+
+
+def _tee_head(chunks, parser, encoding):
+    """Reicht die Chunks durch und füttert den Kopf-Parser, bis ``</head>`` erreicht ist."""
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        if not parser.done:
+            try:
+                parser.feed(decoder.decode(chunk))
+            except Exception as exc:
+                logger.debug("Kopf-Parser abgebrochen: %s", exc)
+                parser.done = True
+        yield chunk
+
+
+def stream_snapshot(response, sites_dir, compress=False, max_bytes=None):
+    """Schreibt den Body einer Streaming-Antwort direkt als Snapshot auf die Platte.
+
+    Gibt ``(dateiname, hash, icon_href)`` zurück; der Icon-Link wird dabei aus dem
+    Seitenkopf gelesen, ohne das ganze Dokument zu parsen.
+    """
+    length = response.headers.get("Content-Length", "")
+    if max_bytes and length.isdigit() and int(length) > max_bytes:
+        raise SnapshotTooLarge(max_bytes)
+    parser = IconLinkParser()
+    chunks = _tee_head(
+        response.iter_content(chunk_size=SNAPSHOT_CHUNK_SIZE), parser, response.encoding
+    )
+    filename, digest = store_snapshot_stream(sites_dir, chunks, compress, max_bytes)
+    return filename, digest, parser.href
+
+
+def fetch_page_snapshot(
+    url, source_id, project_path, source=None, compress=False,
+    max_bytes=SNAPSHOT_MAX_MB * 1024 * 1024,
+):
+    """Lädt eine Seite neu und speichert HTML und Favicon im Projektordner.
+
+    Mit ``source`` werden die gespeicherten Validatoren (ETag, Last-Modified) als
+    bedingte Anfrage mitgeschickt. Antwortet der Server mit 304 oder ist der Inhalt
+    identisch zum letzten Snapshot, wird keine neue Datei angelegt und das
+    Ergebnis als ``unchanged`` markiert. ``compress`` speichert den Snapshot
+    gzip-komprimiert, ``max_bytes`` begrenzt seine Größe. Netzwerk- und IO-Fehler
+    werden an den Aufrufer weitergereicht.
+    """
+    logger.info("Seite neu laden — url=%s", url)
+    source = source or {}
+    sites_dir = Path(project_path) / "sites"
+    images_dir = Path(project_path) / "images"
+    sites_dir.mkdir(exist_ok=True)
+    images_dir.mkdir(exist_ok=True)
+
+    previous_file = _last_snapshot_file(source)
+    headers = conditional_headers(source) if previous_file else {}
+    previous_hash = _previous_hash(source, sites_dir) if previous_file else None
+    # Ältere Snapshots heißen nicht nach ihrem Hash; ein gleicher Inhalt ergäbe
+    # sonst eine zweite Datei neben der bisherigen
+    blob_existed = bool(previous_hash) and any(
+        (sites_dir / f"{previous_hash}.html{suffix}").exists() for suffix in ("", GZIP_SUFFIX)
+    )
+    with http_get(url, timeout=15, headers=headers, stream=True) as response:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        snapshot = {
+            "file": previous_file,
+            "timestamp": timestamp,
+            "favicon": None,
+            "unchanged": False,
+            "etag": response.headers.get("ETag") or source.get("etag"),
+            "last_modified": (
+                response.headers.get("Last-Modified") or source.get("last_modified")
+            ),
+            "content_hash": source.get("content_hash"),
+        }
+
+        if response.status_code == 304 and previous_file:
+            logger.debug("Seite unverändert (304): %s", url)
+            snapshot["unchanged"] = True
+            return snapshot
+
+        response.raise_for_status()
+        filename, digest, icon_href = stream_snapshot(
+            response, sites_dir, compress, max_bytes
+        )
+        final_url = response.url or url
+    snapshot["content_hash"] = digest
+
+    if previous_file and digest == previous_hash:
+        logger.debug("Seite unverändert (gleicher Inhalt): %s", url)
+        if filename != previous_file and not blob_existed:
+            # Eben erst angelegtes Duplikat der älteren Datei wieder entfernen
+            release_snapshots(sites_dir, [filename], Counter())
+        snapshot["unchanged"] = True
+        return snapshot
+
+    snapshot["file"] = filename
+
+    logger.debug("Seite gespeichert: %s", filename)
+    snapshot["favicon"] = get_favicon_cache().install(final_url, images_dir, icon_href)
+    return snapshot
+
+
+def apply_snapshot(source, snapshot):
+    """Überträgt das Ergebnis von ``fetch_page_snapshot`` auf die Quelle."""
+    entry = {
+        "file": snapshot["file"],
+        "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
+    }
+    if snapshot.get("content_hash"):
+        entry["hash"] = snapshot["content_hash"]
+    if snapshot["unchanged"]:
+        # Geprüft, aber unverändert: verweist auf den bestehenden Snapshot
+        entry["unchanged"] = True
+    source.setdefault("saved_pages", []).append(entry)
+    source["last_checked"] = entry["timestamp"]
+    for key in ("etag", "last_modified", "content_hash"):
+        if snapshot.get(key):
+            source[key] = snapshot[key]
+    if snapshot.get("favicon"):
+        source["favicon"] = snapshot["favicon"]
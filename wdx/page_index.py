@@ -0,0 +1,238 @@
+import sqlite3
+import threading
+import zlib
+from html.parser import HTMLParser
+from pathlib import Path
+
+from search_index import fold, tokenize
+from size_ledger import get_size_ledger
+from snapshot_store import read_snapshot
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+PAGE_INDEX_NAME = "page_index.sqlite3"
+# Sehr große Seiten nur bis hierhin indexieren (Zeichen Klartext)
+PAGE_TEXT_MAX_CHARS = 2_000_000
+# Seiten pro Transaktion beim Aufbau
+PAGE_INDEX_BATCH = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL UNIQUE,
+    text BLOB NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(
+    text, content='', detail=none, tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+
+class PageTextParser(HTMLParser):
+    """Sammelt den lesbaren Text eines Dokuments (ohne Skripte und Styles)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def extract_text(html):
+    """Klartext eines HTML-Dokuments mit zusammengefassten Leerräumen."""
+    parser = PageTextParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as exc:
+        logger.debug("HTML-Parser abgebrochen: %s", exc)
+    return " ".join(" ".join(parser.parts).split())[:PAGE_TEXT_MAX_CHARS]
+
+
+def page_files(items):
+    """``{id: [Snapshot-Dateien]}`` aller Elemente; im Tk-Thread aufrufen."""
+    return {
+        item.get("id"): [p["file"] for p in item.get("saved_pages", []) if p.get("file")]
+        for item in items
+        if item.get("saved_pages")
+    }
+
+
+class PageTextIndex:
+    """Volltextindex über die gespeicherten Snapshots eines Projekts (SQLite FTS5).
+
+    ``sync`` extrahiert den Klartext jeder Snapshot-Datei genau einmal und legt
+    ihn in ``page_index.sqlite3`` im Projektordner ab; da Snapshots nach ihrem
+    Hash benannt sind, ändert sich der Inhalt einer Datei nie. Die FTS-Tabelle
+    speichert weder Inhalt noch Wortpositionen (``detail=none``), der Text liegt
+    nur komprimiert in ``pages`` (für das Entfernen aus dem Index). ``search``
+    liefert die Ids der Elemente, von denen ein Snapshot alle Wörter der Anfrage
+    enthält.
+
+    Geschrieben wird nur aus ``sync`` (Worker-Thread), gelesen über eine eigene
+    Verbindung; dank WAL blockieren sich beide nicht.
+    """
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.db_file = self.project_path / PAGE_INDEX_NAME
+        self._sync_lock = threading.Lock()
+        self._writer = None
+        self._reader = None
+        self._file_items = {}
+        self._closed = False
+        self.ready = False
+
+    def _files(self):
+        # WAL- und SHM-Datei wachsen mit und zählen zur Projektgröße
+        return (
+            self.db_file,
+            self.db_file.with_name(self.db_file.name + "-wal"),
+            self.db_file.with_name(self.db_file.name + "-shm"),
+        )
+
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def sync(self, files_by_item):
+        """Indexiert neue Snapshots und entfernt nicht mehr referenzierte.
+
+        ``files_by_item`` stammt aus ``page_files``. Gibt die Zahl der
+        Änderungen zurück.
+        """
+        file_items = {}
+        for item_id, files in files_by_item.items():
+            for filename in files:
+                file_items.setdefault(filename, set()).add(item_id)
+        with self._sync_lock:
+            try:
+                return self._sync(file_items)
+            finally:
+                if self._closed and self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+
+    def _sync(self, file_items):
+        if self._closed:
+            return 0
+        if self._writer is None:
+            with get_size_ledger().tracking(*self._files()):
+                self._writer = self._connect()
+                self._writer.executescript(SCHEMA)
+        # Zuordnung sofort übernehmen, bereits indexierte Seiten sind damit suchbar
+        self._file_items = file_items
+        self.ready = True
+        known = dict(self._writer.execute("SELECT file, id FROM pages"))
+        removed = [name for name in known if name not in file_items]
+        added = [name for name in file_items if name not in known]
+        if not removed and not added:
+            return 0
+        with get_size_ledger().tracking(*self._files()):
+            removed_count = self._remove(removed, known)
+            added_count = self._add(added)
+        logger.debug(
+            "Seitenindex: %d Snapshot(s) indexiert, %d entfernt", added_count, removed_count
+        )
+        return added_count + removed_count
+
+    def _remove(self, files, known):
+        with self._writer:
+            for filename in files:
+                row_id = known[filename]
+                (blob,) = self._writer.execute(
+                    "SELECT text FROM pages WHERE id = ?", (row_id,)
+                ).fetchone()
+                self._writer.execute(
+                    "INSERT INTO page_text (page_text, rowid, text) VALUES ('delete', ?, ?)",
+                    (row_id, zlib.decompress(blob).decode("utf-8")),
+                )
+                self._writer.execute("DELETE FROM pages WHERE id = ?", (row_id,))
+        return len(files)
+
+    def _add(self, files):
+        sites_dir = self.project_path / "sites"
+        added = 0
+        for start in range(0, len(files), PAGE_INDEX_BATCH):
+            rows = []
+            for filename in files[start:start + PAGE_INDEX_BATCH]:
+                if self._closed:
+                    break
+                path = sites_dir / filename
+                try:
+                    text = fold(extract_text(read_snapshot(path)))
+                except (OSError, EOFError) as exc:
+                    logger.debug("Snapshot nicht lesbar (%s): %s", filename, exc)
+                    continue
+                rows.append((filename, text))
+            with self._writer:
+                for filename, text in rows:
+                    cursor = self._writer.execute(
+                        "INSERT INTO pages (file, text) VALUES (?, ?)",
+                        (filename, zlib.compress(text.encode("utf-8"), 6)),
+                    )
+                    self._writer.execute(
+                        "INSERT INTO page_text (rowid, text) VALUES (?, ?)",
+                        (cursor.lastrowid, text),
+                    )
+            added += len(rows)
+            if self._closed:
+                break
+        return added
+
+    def search(self, query):
+        """Ids der Elemente, deren Snapshots jedes Wort der Anfrage als Wortanfang enthalten.
+
+        Leere Menge, solange der Index noch nicht bereit ist (nur Tk-Thread).
+        """
+        # FTS5 trennt auch an ``_``; ohne Positionen sind nur Einzelwörter erlaubt
+        tokens = [part for token in tokenize(query) for part in token.split("_") if part]
+        if not tokens or not self.ready or self._closed:
+            return set()
+        match = " AND ".join(f'"{token}"*' for token in dict.fromkeys(tokens))
+        try:
+            if self._reader is None:
+                self._reader = self._connect()
+            rows = self._reader.execute(
+                "SELECT file FROM pages WHERE id IN "
+                "(SELECT rowid FROM page_text WHERE page_text MATCH ?)",
+                (match,),
+            ).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning("Seitenindex-Abfrage fehlgeschlagen: %s", exc)
+            return set()
+        file_items = self._file_items
+        hits = set()
+        for (filename,) in rows:
+            hits |= file_items.get(filename, set())
+        return hits
+
+    def close(self):
+        """Schließt die Verbindungen; ein laufendes ``sync`` bricht nach dem aktuellen Stapel ab."""
+        self._closed = True
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sync_lock.acquire(blocking=False):
+            try:
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+            finally:
+                self._sync_lock.release()
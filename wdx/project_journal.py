@@ -0,0 +1,239 @@
+import copy
+import json
+import os
+
+from constants import JOURNAL_COMPACT_ENTRIES, JOURNAL_COMPACT_BYTES
+from size_ledger import get_size_ledger
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_NAME = "project.journal"
+POSITION_KEYS = ("pos_x", "pos_y")
+
+
+def journal_path(data_file):
+    return data_file.with_name(JOURNAL_NAME)
+
+
+def _without_position(item):
+    return {k: v for k, v in item.items() if k not in POSITION_KEYS}
+
+
+def put_op(item):
+    """Operation für ein neues oder geändertes Element (mit eigener Kopie)."""
+    return {"op": "put", "item": copy.deepcopy(item)}
+
+
+def move_op(item):
+    return {"op": "move", "id": item.get("id"), "x": item.get("pos_x"), "y": item.get("pos_y")}
+
+
+def delete_op(item_id):
+    return {"op": "delete", "id": item_id}
+
+
+def meta_op(key, value):
+    return {"op": "meta", "key": key, "value": copy.deepcopy(value)}
+
+
+def apply_ops(data, ops):
+    """Spielt Journal-Operationen auf ``data`` ein (idempotent, in Reihenfolge)."""
+    items = data.setdefault("items", [])
+    index = {item.get("id"): pos for pos, item in enumerate(items)}
+    for op in ops:
+        kind = op.get("op")
+        if kind == "put":
+            item = op["item"]
+            pos = index.get(item.get("id"))
+            if pos is None:
+                index[item.get("id")] = len(items)
+                items.append(item)
+            else:
+                items[pos] = item
+        elif kind == "move":
+            pos = index.get(op["id"])
+            if pos is not None:
+                items[pos]["pos_x"] = op["x"]
+                items[pos]["pos_y"] = op["y"]
+        elif kind == "delete":
+            if op["id"] in index:
+                items[:] = [i for i in items if i.get("id") != op["id"]]
+                index = {item.get("id"): pos for pos, item in enumerate(items)}
+        elif kind == "order":
+            rank = {item_id: pos for pos, item_id in enumerate(op["ids"])}
+            items.sort(key=lambda i: rank.get(i.get("id"), len(rank)))
+            index = {item.get("id"): pos for pos, item in enumerate(items)}
+        elif kind == "meta":
+            data[op["key"]] = op["value"]
+
+
+def read_journal(path):
+    """Liest die Operationen eines Journals; gibt ``(ops, gültige_bytes)`` zurück."""
+    ops = []
+    valid = 0
+    if not path.exists():
+        return ops, valid
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("ohne Zeilenende")
+                    ops.append(json.loads(line))
+                except ValueError:
+                    # Abgebrochener letzter Eintrag nach einem Absturz
+                    logger.warning("Unvollständiger Journal-Eintrag verworfen: %s", path)
+                    break
+                valid += len(line)
+    except OSError as exc:
+        logger.error("Journal nicht lesbar (%s): %s", path, exc)
+    return ops, valid
+
+
+class ProjectJournal:
+    """Write-Ahead-Journal für die Elemente eines Projekts.
+
+    Statt ``project.json`` bei jeder Änderung komplett neu zu schreiben, wird der
+    Unterschied zum zuletzt geschriebenen Stand als Operationen (``put``,
+    ``move``, ``delete``, ``order``, ``meta``) zeilenweise an ``project.journal``
+    angehängt. ``compact`` schreibt den Gesamtstand und leert das Journal.
+
+    Die Basis (zuletzt geschriebener Stand) ist eine eigene Kopie und wird nur
+    über ``advance`` aus den Operationen nachgeführt; nach ``reset`` greift das
+    Journal nie mehr auf die laufend geänderten Projektdaten zu.
+    """
+
+    def __init__(self, data_file):
+        self.data_file = data_file
+        self.entries = 0
+        self.size = 0
+        self._items = {}
+        self._order = []
+        self._meta = {}
+
+    @property
+    def path(self):
+        return journal_path(self.data_file)
+
+    def replay(self, data):
+        """Übernimmt ein vorhandenes Journal in ``data`` und setzt die Basis."""
+        ops, valid = read_journal(self.path)
+        if ops:
+            apply_ops(data, ops)
+            logger.debug("%d Journal-Eintrag/Einträge eingespielt: %s", len(ops), self.path)
+        try:
+            if self.path.exists() and self.path.stat().st_size > valid:
+                # Defektes Ende abschneiden, damit neue Einträge lesbar bleiben
+                with open(self.path, "r+b") as f:
+                    f.truncate(valid)
+        except OSError as exc:
+            logger.error("Journal konnte nicht repariert werden (%s): %s", self.path, exc)
+        self.entries = len(ops)
+        self.size = valid
+        self.reset(data)
+        return len(ops)
+
+    def reset(self, data):
+        items = data.get("items", [])
+        self._items = {item.get("id"): copy.deepcopy(item) for item in items}
+        self._order = [item.get("id") for item in items]
+        self._meta = {
+            key: copy.deepcopy(value) for key, value in data.items() if key != "items"
+        }
+
+    def diff(self, data):
+        ops = []
+        items = data.get("items", [])
+        current_ids = set()
+        for item in items:
+            item_id = item.get("id")
+            current_ids.add(item_id)
+            previous = self._items.get(item_id)
+            if previous == item:
+                continue
+            if previous is not None and _without_position(previous) == _without_position(item):
+                ops.append({
+                    "op": "move", "id": item_id,
+                    "x": item.get("pos_x"), "y": item.get("pos_y"),
+                })
+            else:
+                ops.append({"op": "put", "item": item})
+        for item_id in self._items:
+            if item_id not in current_ids:
+                ops.append({"op": "delete", "id": item_id})
+
+        # Neue Elemente werden beim Einspielen angehängt; weicht die tatsächliche
+        # Reihenfolge davon ab, wird sie explizit festgehalten
+        order = [i.get("id") for i in items]
+        expected = [item_id for item_id in self._order if item_id in current_ids]
+        expected += [item_id for item_id in order if item_id not in self._items]
+        if expected != order:
+            ops.append({"op": "order", "ids": order})
+
+        for key, value in data.items():
+            if key != "items" and self._meta.get(key) != value:
+                ops.append({"op": "meta", "key": key, "value": value})
+        return ops
+
+    def record(self, ops):
+        """Hängt ``ops`` an und führt die Basis nach; gibt die Anzahl zurück."""
+        if not ops:
+            return 0
+        payload = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops)
+        with get_size_ledger().tracking(self.path):
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(payload)
+        self.entries += len(ops)
+        self.size += len(payload.encode("utf-8"))
+        self.advance(ops)
+        return len(ops)
+
+    def advance(self, ops):
+        """Führt die Basis nach, nachdem ``ops`` gespeichert wurden.
+
+        Die Operationen müssen eigene Kopien enthalten (``put``-Elemente werden
+        übernommen, nicht kopiert).
+        """
+        for op in ops:
+            kind = op["op"]
+            if kind == "put":
+                item_id = op["item"].get("id")
+                if item_id not in self._items:
+                    self._order.append(item_id)
+                self._items[item_id] = op["item"]
+            elif kind == "move":
+                item = self._items.get(op["id"])
+                if item is not None:
+                    self._items[op["id"]] = dict(item, pos_x=op["x"], pos_y=op["y"])
+            elif kind == "delete":
+                if self._items.pop(op["id"], None) is not None:
+                    self._order.remove(op["id"])
+            elif kind == "order":
+                known = [item_id for item_id in op["ids"] if item_id in self._items]
+                listed = set(known)
+                self._order = known + [i for i in self._order if i not in listed]
+            elif kind == "meta":
+                self._meta[op["key"]] = op["value"]
+
+    def snapshot(self):
+        """Zuletzt gespeicherter Stand als Projektdaten (Basis, nicht kopiert)."""
+        data = dict(self._meta)
+        data["items"] = [self._items[item_id] for item_id in self._order]
+        return data
+
+    @property
+    def needs_compaction(self):
+        return self.entries >= JOURNAL_COMPACT_ENTRIES or self.size >= JOURNAL_COMPACT_BYTES
+
+    def compact(self):
+        """Schreibt die Basis atomar nach ``project.json`` und leert das Journal."""
+        tmp_file = self.data_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=4)
+        with get_size_ledger().tracking(self.data_file, self.path):
+            os.replace(tmp_file, self.data_file)
+            if self.path.exists():
+                os.remove(self.path)
+        self.entries = 0
+        self.size = 0
@@ -7,10 +7,22 @@ from pathlib import Path
 from tkinter import messagebox, filedialog
 import pyzipper
 import datetime
+import sqlite3
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
-from constants import WDX_DIR, PROJECTS_FILE, CODENAME, CONFIG_FILE
+from constants import (
+    WDX_DIR, PROJECTS_FILE, CODENAME, CONFIG_FILE, SNAPSHOT_MAX_MB, LOD_ZOOM_PERCENT,
+    SERVER_MAX_CONNECTIONS,
+)
+from snapshot_store import compress_project_files, rename_snapshot_refs, remove_originals
+from project_writer import ProjectWriter
+from project_journal import JOURNAL_NAME, ProjectJournal, journal_path, read_journal, apply_ops
+from sqlite_store import SqliteProjectStore
+from search_index import SEARCH_INDEX_NAME
+from page_index import PAGE_INDEX_NAME
+from size_ledger import get_size_ledger, dir_size
+from file_watcher import file_signature
 from wdx_logger import get_logger
 
 if sys.platform == "win32":
@@ -24,6 +36,7 @@ DEFAULT_CITATION_FORMAT = "{url}, zuletzt aufgerufen am {added}"
 class ProjectManager:
     def __init__(self):
         self.lock = threading.Lock()
+        self._load_lock = threading.Lock()
         self.projects = []
 
         self.config = {
@@ -32,32 +45,47 @@ class ProjectManager:
             "encryption_password": CODENAME,
             "citation_format": DEFAULT_CITATION_FORMAT,
             "first_run": True,
+            "compress_snapshots": False,
+            "snapshot_max_mb": SNAPSHOT_MAX_MB,
+            "lod_zoom_percent": LOD_ZOOM_PERCENT,
+            "storage_backend": "json",
+            "server_max_connections": SERVER_MAX_CONNECTIONS,
         }
 
+        self.store = None
+        # Läuft ein Backend-Wechsel (nur im Tk-Thread gesetzt und gelesen)
+        self.migrating_storage = False
+        self.sizes = get_size_ledger()
+        self.writer = ProjectWriter(self._write_project)
         self.load_settings()
+        if self.config.get("storage_backend") == "sqlite":
+            self._open_store()
         self.load_projects()
 
     
     def _get_dir_size(self, path) -> int:
-        total_size = 0
-        try:
-            path_obj = Path(path)
-            if not path_obj.exists():
-                return 0
-            with os.scandir(path_obj) as it:
-                for entry in it:
-                    try:
-                        if entry.is_file(follow_symlinks=False):
-                            total_size += entry.stat().st_size
-                        elif entry.is_dir(follow_symlinks=False):
-                            total_size += self._get_dir_size(entry.path)
-                    except (PermissionError, OSError) as exc:
-                        logger.debug(
-                            "Dateigröße nicht lesbar (%s): %s", entry.path, exc
-                        )
-        except Exception as exc:
-            logger.warning("Fehler bei Größenberechnung für %s: %s", path, exc)
-        return total_size
+        return dir_size(path)
+
+    def project_size(self, project) -> int:
+        """Projektgröße aus dem Größen-Ledger, ohne den Ordner zu durchlaufen."""
+        size = self.sizes.size(project["name"])
+        if size is not None:
+            project["size"] = size
+        return project.get("size", 0)
+
+    def reconcile_sizes(self, on_done=None):
+        """Gleicht veraltete Ledger-Einträge im Hintergrund per Scan ab."""
+
+        def done(changed):
+            for project in self.projects:
+                if project["name"] in changed:
+                    self.project_size(project)
+            if on_done is not None and changed:
+                on_done(changed)
+
+        return self.sizes.reconcile(
+            [(p["name"], p["path"]) for p in self.projects], on_done=done
+        )
 
     
     def load_settings(self):
@@ -92,6 +120,11 @@ class ProjectManager:
                     ("encryption_password", "encryption_password", str),
                     ("citation_format", "citation_format", str),
                     ("first_run", "first_run", bool),
+                    ("compress_snapshots", "compress_snapshots", bool),
+                    ("snapshot_max_mb", "snapshot_max_mb", int),
+                    ("lod_zoom_percent", "lod_zoom_percent", int),
+                    ("storage_backend", "storage_backend", str),
+                    ("server_max_connections", "server_max_connections", int),
                 ]:
                     try:
                         val, _ = winreg.QueryValueEx(key, reg_key)
@@ -114,6 +147,26 @@ class ProjectManager:
                     key, "first_run", 0, winreg.REG_DWORD,
                     1 if self.config.get("first_run", True) else 0,
                 )
+                winreg.SetValueEx(
+                    key, "compress_snapshots", 0, winreg.REG_DWORD,
+                    1 if self.config.get("compress_snapshots", False) else 0,
+                )
+                winreg.SetValueEx(
+                    key, "snapshot_max_mb", 0, winreg.REG_DWORD,
+                    int(self.config.get("snapshot_max_mb", SNAPSHOT_MAX_MB)),
+                )
+                winreg.SetValueEx(
+                    key, "lod_zoom_percent", 0, winreg.REG_DWORD,
+                    int(self.config.get("lod_zoom_percent", LOD_ZOOM_PERCENT)),
+                )
+                winreg.SetValueEx(
+                    key, "server_max_connections", 0, winreg.REG_DWORD,
+                    int(self.config.get("server_max_connections", SERVER_MAX_CONNECTIONS)),
+                )
+                winreg.SetValueEx(
+                    key, "storage_backend", 0, winreg.REG_SZ,
+                    self.config.get("storage_backend", "json"),
+                )
                 winreg.SetValueEx(
                     key, "show_prompts", 0, winreg.REG_DWORD,
                     1 if self.config["show_prompts"] else 0,
@@ -154,6 +207,11 @@ class ProjectManager:
     
     
     def load_projects(self):
+        """Liest nur die Projektübersicht aus projects.json.
+
+        Die vollständigen Projektdaten werden erst mit ``ensure_loaded`` beim
+        Öffnen (oder ersten Zugriff) geladen.
+        """
         self.projects = []
         if not PROJECTS_FILE.exists():
             logger.info("Keine projects.json gefunden — leere Projektliste")
@@ -168,7 +226,9 @@ class ProjectManager:
                     p_path = Path(proj["path"])
                     d_file = Path(proj["data_file"])
 
-                    if not d_file.exists():
+                    if not d_file.exists() and not (
+                        self.store is not None and self.store.has_project(proj["name"])
+                    ):
                         logger.warning(
                             "Projektdatei fehlt, überspringe '%s': %s",
                             proj.get("name", "?"),
@@ -176,38 +236,78 @@ class ProjectManager:
                         )
                         continue
 
-                    with open(d_file, "r", encoding="utf-8") as f:
-                        actual_data = json.load(f)
-
+                    size = self.sizes.size(proj["name"])
+                    if size is None:
+                        # Noch ohne Ledger-Eintrag: Wert übernehmen, Scan folgt
+                        size = proj.get("size", 0)
+                        self.sizes.set(proj["name"], size)
                     self.projects.append(
                         {
-                            "name": actual_data.get("name", proj["name"]),
-                            "description": actual_data.get(
-                                "description", proj["description"]
-                            ),
-                            "created": actual_data.get("created", proj["created"]),
-                            "last_modified": actual_data.get(
-                                "last_modified", proj["last_modified"]
-                            ),
+                            "name": proj["name"],
+                            "description": proj["description"],
+                            "created": proj["created"],
+                            "last_modified": proj["last_modified"],
                             "path": p_path,
                             "data_file": d_file,
-                            "data": actual_data,
-                            "size": self._get_dir_size(p_path),
+                            "data": None,
+                            "item_count": proj.get("item_count", 0),
+                            "size": size,
+                            "journal": None,
                         }
                     )
-                except (KeyError, json.JSONDecodeError, OSError) as exc:
+                except (KeyError, OSError, sqlite3.Error) as exc:
                     logger.error(
                         "Projekt '%s' konnte nicht geladen werden: %s",
                         proj.get("name", "?"),
                         exc,
                     )
 
-            logger.info("%d Projekt(e) geladen", len(self.projects))
+            logger.info("%d Projekt(e) in der Übersicht", len(self.projects))
         except json.JSONDecodeError as exc:
             logger.critical("projects.json beschädigt: %s", exc)
         except OSError as exc:
             logger.critical("projects.json nicht lesbar: %s", exc)
 
+    def ensure_loaded(self, project):
+        """Lädt die vollständigen Projektdaten beim ersten Zugriff nach.
+
+        Fehler (fehlende oder beschädigte Datei) werden an den Aufrufer
+        weitergereicht.
+        """
+        with self._load_lock:
+            if project.get("data") is not None:
+                return project["data"]
+            d_file = project["data_file"]
+            data = None
+            if self.store is not None:
+                data = self.store.load(project["name"])
+            journal = ProjectJournal(d_file)
+            if data is not None:
+                journal.reset(data)
+            else:
+                with open(d_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                journal.replay(data)
+                if self.store is not None:
+                    # Noch nicht in der Datenbank: einmalig übernehmen
+                    journal.compact()
+                    self.store.replace(project["name"], data)
+                    logger.info("Projekt in SQLite übernommen: %s", project["name"])
+            project["journal"] = journal
+            project["written_signature"] = self.data_signature(project)
+            project["item_count"] = len(data.get("items", []))
+            project["data"] = data
+            logger.info(
+                "Projektdaten geladen: %s (%d Element(e))",
+                project["name"], project["item_count"],
+            )
+            return data
+
+    def item_count(self, project):
+        if project.get("data") is not None:
+            project["item_count"] = len(project["data"].get("items", []))
+        return project.get("item_count", 0)
+
     def save_projects(self):
         with self.lock:
             projects_data = [
@@ -218,56 +318,310 @@ class ProjectManager:
                     "last_modified": p["last_modified"],
                     "path": str(p["path"]),
                     "data_file": str(p["data_file"]),
+                    "item_count": self.item_count(p),
+                    "size": self.project_size(p),
                 }
                 for p in self.projects
             ]
             try:
                 WDX_DIR.mkdir(parents=True, exist_ok=True)
-                with open(PROJECTS_FILE, "w", encoding="utf-8") as f:
+                tmp_file = PROJECTS_FILE.with_suffix(".tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
                     json.dump(projects_data, f, indent=4)
+                os.replace(tmp_file, PROJECTS_FILE)
                 logger.debug("projects.json gespeichert (%d Einträge)", len(projects_data))
             except OSError as exc:
                 logger.error("projects.json konnte nicht gespeichert werden: %s", exc)
+        self.sizes.save()
 
-    def update_project_file_safe(self, project, update_fn):
+    def _open_store(self):
+        try:
+            self.store = SqliteProjectStore()
+            logger.info("SQLite-Ablage geöffnet: %s", self.store.db_file)
+        except sqlite3.Error as exc:
+            logger.error("SQLite-Ablage nicht verfügbar, verwende JSON: %s", exc)
+            self.store = None
+
+    def migrate_storage(self, backend):
+        """Schritt 1 des Backend-Wechsels (Worker-Thread): Projekte ins neue Backend kopieren.
+
+        Die laufende Ablage bleibt in Gebrauch, bis ``activate_storage`` im
+        Tk-Thread umschaltet. Kopiert wird der gespeicherte Stand (Journal-Basis
+        bzw. Datei), je Projekt unter ``self.lock``; die dabei gemerkte Signatur
+        zeigt ``activate_storage`` spätere Schreibvorgänge an. Gibt ``None``
+        zurück, wenn die SQLite-Datenbank nicht geöffnet werden kann.
+        """
+        store = None
+        if backend == "sqlite":
+            try:
+                store = SqliteProjectStore()
+            except sqlite3.Error as exc:
+                logger.error("SQLite-Ablage nicht verfügbar: %s", exc)
+                return None
+        signatures = {}
+        for project in list(self.projects):
+            # _load_lock: ein gleichzeitiges ensure_loaded liest sonst halb umgezogene Dateien
+            with self._load_lock, self.lock:
+                try:
+                    self._copy_saved_state(project, store)
+                except (OSError, ValueError, sqlite3.Error) as exc:
+                    logger.error(
+                        "Projekt '%s' konnte nicht umgezogen werden: %s", project["name"], exc
+                    )
+                    continue
+                signatures[project["name"]] = project.get("written_signature")
+        return {"backend": backend, "store": store, "signatures": signatures}
+
+    def _copy_saved_state(self, project, store):
+        """Schreibt den gespeicherten Stand nach project.json und ggf. in ``store``."""
+        if project.get("data") is not None:
+            self._compact_locked(project)
+            data = self._journal(project).snapshot()
+        else:
+            journal = ProjectJournal(project["data_file"])
+            data = self.store.load(project["name"]) if self.store is not None else None
+            if data is None:
+                with open(project["data_file"], "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                journal.replay(data)
+            else:
+                journal.reset(data)
+            journal.compact()
+        if store is not None:
+            store.replace(project["name"], data)
+
+    def activate_storage(self, migration):
+        """Schritt 2 (Tk-Thread): schaltet auf die kopierte Ablage um.
+
+        Projekte, die seit dem Kopieren gespeichert wurden, werden nachgezogen.
+        Gibt die bisherige SQLite-Ablage zurück (für ``release_store``) oder None.
+        """
+        store = migration["store"]
+        signatures = migration["signatures"]
+        missing = object()
+        with self.lock:
+            for project in self.projects:
+                if project.get("data") is None:
+                    continue
+                if signatures.get(project["name"], missing) != project.get("written_signature"):
+                    self._copy_saved_state(project, store)
+            old_store = self.store
+            self.store = store
+            for project in self.projects:
+                project["written_signature"] = self.data_signature(project)
+        self.set_setting("storage_backend", migration["backend"])
+        self.save_projects()
+        logger.info(
+            "Speicher-Backend gewechselt: %s (%d Projekt(e))", migration["backend"], len(signatures)
+        )
+        return old_store
+
+    @staticmethod
+    def release_store(store, names):
+        """Schritt 3 (Worker-Thread): leert und schließt die nicht mehr genutzte Ablage."""
+        try:
+            for name in names:
+                store.delete(name)
+        except sqlite3.Error as exc:
+            logger.warning("Alte SQLite-Ablage konnte nicht geleert werden: %s", exc)
+        store.close()
+
+    def close_store(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def _journal(self, project):
+        journal = project.get("journal")
+        if journal is None or journal.data_file != project["data_file"]:
+            journal = ProjectJournal(project["data_file"])
+            journal.reset(project["data"])
+            project["journal"] = journal
+        return journal
+
+    def _persist(self, project, ops):
+        """Speichert ``ops``; gibt True zurück, wenn kompaktiert wurde."""
+        if not ops:
+            return False
+        journal = self._journal(project)
+        project["last_modified"] = datetime.datetime.now().isoformat()
+        if self.store is not None:
+            # SQLite: nur geänderte Zeilen schreiben, kein Journal nötig
+            self.store.apply(project["name"], ops)
+            journal.advance(ops)
+            return False
+        journal.record(ops)
+        if not journal.needs_compaction:
+            return False
+        self._compact_locked(project)
+        return True
+
+    def _compact_locked(self, project):
+        self._journal(project).compact()
+        project["written_signature"] = self.data_signature(project)
+        logger.debug("Projekt kompaktiert: %s", project["name"])
+
+    def compact_project(self, project):
+        """Schreibt das Journal in project.json zurück (Schließen, Export, Beenden)."""
+        if project.get("data") is None:
+            return
+        self.writer.flush(project)
         with self.lock:
+            journal = self._journal(project)
+            if not journal.entries and not journal.path.exists():
+                return
             try:
-                update_fn(project["data"])
-                project["last_modified"] = datetime.datetime.now().isoformat()
-                with open(project["data_file"], "w", encoding="utf-8") as f:
-                    json.dump(project["data"], f, indent=4)
-                project["size"] = self._get_dir_size(project["path"])
-                logger.debug("Projekt-Datei aktualisiert: %s", project["name"])
+                self._compact_locked(project)
             except OSError as exc:
                 logger.error(
-                    "Projekt '%s' konnte nicht geschrieben werden: %s",
-                    project["name"],
-                    exc,
+                    "Projekt '%s' konnte nicht kompaktiert werden: %s", project["name"], exc
                 )
+                return
+        self.save_projects()
+
+    def compact_all(self):
+        for project in list(self.projects):
+            self.compact_project(project)
+
+    def write_project_json(self, project):
+        """Schreibt project.json aus den aktuellen Daten (Export im SQLite-Betrieb)."""
+        self.ensure_loaded(project)
+        self.writer.flush(project)
+        with self.lock:
+            self._compact_locked(project)
+
+    def read_project_data(self, project):
+        """Liest project.json samt Journal frisch von der Platte."""
+        if self.store is not None:
+            return self.store.load(project["name"])
+        with open(project["data_file"], "r", encoding="utf-8") as f:
+            data = json.load(f)
+        ops, _ = read_journal(journal_path(project["data_file"]))
+        apply_ops(data, ops)
+        return data
+
+    def adopt_external(self, project, data):
+        """Übernimmt frisch gelesene Daten (``read_project_data``) als gespeicherten Stand.
+
+        Ohne diesen Schritt vergleicht der Schreib-Thread weiter mit dem Stand vor
+        der externen Änderung, und das nächste Kompaktieren schriebe ihn zurück.
+        """
+        with self.lock:
+            self._journal(project).reset(data)
+
+    def data_signature(self, project):
+        """Stand von project.json und Journal als ``(mtime_ns, größe)``-Paare."""
+        if self.store is not None:
+            return ("sqlite", self.store.modified_at(project["name"]))
+        return (
+            file_signature(project["data_file"]),
+            file_signature(journal_path(project["data_file"])),
+        )
+
+    def is_own_write(self, project):
+        """True, wenn der Dateistand vom letzten eigenen Schreibvorgang stammt.
+
+        Wartet dafür auf einen laufenden Schreibvorgang (``self.lock``), damit
+        dessen Dateiereignisse nicht als externe Änderung erscheinen.
+        """
+        with self.lock:
+            return self.data_signature(project) == project.get("written_signature")
+
+    def update_project_file_safe(self, project, update_fn):
+        """Ändert die Projektdaten unter Sperre und plant das Speichern ein."""
+        self.ensure_loaded(project)
+        with self.lock:
+            try:
+                update_fn(project["data"])
+                logger.debug("Projekt-Datei aktualisiert: %s", project["name"])
             except Exception as exc:
                 logger.exception(
                     "Unerwarteter Fehler in update_project_file_safe (%s): %s",
                     project["name"],
                     exc,
                 )
-        self.save_projects()
+        self.schedule_save(project)
+
+    def schedule_save(self, project, ops=None):
+        """Merkt Änderungen zum Speichern vor; der ProjectWriter bündelt die Schreibvorgänge.
+
+        Nur im Tk-Thread aufrufen. ``ops`` sind die Journal-Operationen der
+        Änderung (``put_op``, ``move_op``, ``delete_op``, ``meta_op``) und werden
+        ohne Vergleich gespeichert. Ohne ``ops`` entsteht hier ein Abbild der
+        Daten, das der Schreib-Thread mit dem zuletzt gespeicherten Stand vergleicht.
+        """
+        if ops is None:
+            self.writer.mark_dirty(project, json.dumps(project["data"], ensure_ascii=False))
+        elif ops:
+            self.writer.mark_dirty(project, list(ops))
 
     def save_specific_project_data(self, project):
-        try:
-            project["last_modified"] = datetime.datetime.now().isoformat()
-            with open(project["data_file"], "w", encoding="utf-8") as f:
-                json.dump(project["data"], f, indent=4)
-            project["size"] = self._get_dir_size(project["path"])
-            logger.debug("Projektdaten gespeichert: %s", project["name"])
-        except OSError as exc:
-            logger.error(
-                "Projektdaten für '%s' konnten nicht gespeichert werden: %s",
-                project["name"],
-                exc,
+        """Speichert sofort, inklusive aller noch ausstehenden Änderungen."""
+        self.schedule_save(project)
+        self.writer.flush(project)
+
+    def _write_project(self, project, changes):
+        compacted = False
+        with self.lock:
+            journal = self._journal(project)
+            for change in changes:
+                try:
+                    ops = journal.diff(json.loads(change)) if isinstance(change, str) else change
+                    compacted = self._persist(project, ops) or compacted
+                except (OSError, sqlite3.Error) as exc:
+                    logger.error(
+                        "Projektdaten für '%s' konnten nicht gespeichert werden: %s",
+                        project["name"],
+                        exc,
+                    )
+                    break
+                except Exception as exc:
+                    logger.exception("Unerwarteter Fehler beim Speichern von '%s': %s", project["name"], exc)
+                    break
+            project["written_signature"] = self.data_signature(project)
+        if compacted:
+            self.save_projects()
+        else:
+            self.sizes.save()
+
+    def compress_snapshot_files(self):
+        """Schritt 1 der Snapshot-Migration (Worker-Thread): nur Dateien komprimieren.
+
+        Gibt ``[(projekt, umbenennungen, gesparte_bytes)]`` für
+        ``apply_snapshot_renames`` und ``finish_snapshot_migration`` zurück.
+        """
+        results = []
+        for project in list(self.projects):
+            try:
+                self.ensure_loaded(project)
+            except (OSError, ValueError, sqlite3.Error) as exc:
+                logger.error("Projekt '%s' übersprungen: %s", project["name"], exc)
+                continue
+            renamed, saved = compress_project_files(project["path"])
+            if renamed:
+                results.append((project, renamed, saved))
+        return results
+
+    def apply_snapshot_renames(self, results):
+        """Schritt 2 (Tk-Thread): Verweise umstellen und das Speichern einplanen."""
+        for project, renamed, _ in results:
+            self.update_project_file_safe(
+                project, lambda data, renamed=renamed: rename_snapshot_refs(data, renamed)
             )
-        except Exception as exc:
-            logger.exception("Unerwarteter Fehler beim Speichern von '%s': %s", project["name"], exc)
-        self.save_projects()
+
+    def finish_snapshot_migration(self, results):
+        """Schritt 3 (Worker-Thread): nach dem Speichern die Originale löschen."""
+        total_files, total_saved = 0, 0
+        for project, renamed, saved in results:
+            self.writer.flush(project)
+            remove_originals(project["path"], renamed)
+            total_files += len(renamed)
+            total_saved += saved
+        logger.info(
+            "Snapshot-Migration abgeschlossen — %d Datei(en), %d KB gespart",
+            total_files, total_saved // 1024,
+        )
+        return total_files, total_saved
 
     def create_project(self, name, description):
         project_dir = WDX_DIR / name
@@ -296,13 +650,19 @@ class ProjectManager:
                 "path": project_dir,
                 "data_file": data_file,
                 "data": initial_data,
+                "item_count": 0,
                 "size": 0,
+                "journal": ProjectJournal(data_file),
             }
+            new_project["journal"].reset(initial_data)
+            if self.store is not None:
+                self.store.replace(name, initial_data)
+            self.sizes.set(name, dir_size(project_dir), scanned=True)
             self.projects.append(new_project)
             self.save_projects()
             logger.info("Neues Projekt erstellt: %s", name)
             return True, new_project
-        except OSError as exc:
+        except (OSError, sqlite3.Error) as exc:
             logger.error("Projekt '%s' konnte nicht erstellt werden: %s", name, exc)
             return False, str(exc)
 
@@ -312,12 +672,19 @@ class ProjectManager:
         if new_path.exists() and new_path != project["path"]:
             logger.warning("Umbenennen abgelehnt — '%s' existiert bereits", new_name)
             return False, "Existiert bereits!"
+        try:
+            self.ensure_loaded(project)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.error("Umbenennen fehlgeschlagen — Projekt nicht lesbar: %s", exc)
+            return False, str(exc)
+        self.writer.flush(project)
         gc.collect()
         try:
             old_name = project["name"]
             # Verzeichnis nur umbenennen wenn der Name sich geändert hat
             if new_name != project["name"]:
                 os.rename(str(project["path"]), str(new_path))
+                self.sizes.rename(project["name"], new_name)
                 project["path"] = new_path
                 project["data_file"] = new_path / "project.json"
 
@@ -328,8 +695,13 @@ class ProjectManager:
                 project["description"] = new_description
                 project["data"]["description"] = new_description
 
-            with open(project["data_file"], "w", encoding="utf-8") as f:
-                json.dump(project["data"], f, indent=4)
+            with self.lock:
+                journal = self._journal(project)
+                journal.reset(project["data"])
+                if self.store is not None:
+                    self.store.rename(old_name, new_name, project["data"])
+                else:
+                    journal.compact()
 
             self.save_projects()
             logger.info(
@@ -341,7 +713,7 @@ class ProjectManager:
         except PermissionError:
             logger.warning("Umbenennen fehlgeschlagen — Datei wird verwendet: %s", project["name"])
             return False, "Datei wird noch verwendet"
-        except OSError as exc:
+        except (OSError, sqlite3.Error) as exc:
             logger.error("Umbenennen fehlgeschlagen: %s", exc)
             return False, str(exc)
 
@@ -358,9 +730,18 @@ class ProjectManager:
         logger.info("Exportiere Projekt '%s' nach %s", project["name"], file_path)
 
         try:
+            self.ensure_loaded(project)
+            self.compact_project(project)
+            if self.store is not None:
+                self.write_project_json(project)
             files_to_add = []
             for root, _, files in os.walk(project["path"]):
                 for file in files:
+                    # Suchindizes werden beim Öffnen neu aufgebaut
+                    if file == JOURNAL_NAME or file == SEARCH_INDEX_NAME:
+                        continue
+                    if file.startswith(PAGE_INDEX_NAME):
+                        continue
                     full_path = Path(root) / file
                     rel_path = full_path.relative_to(project["path"])
                     files_to_add.append((full_path, rel_path))
@@ -413,9 +794,12 @@ class ProjectManager:
                 target_dir.mkdir(parents=True)
                 zip_ref.extractall(target_dir)
                 data_file = target_dir / "project.json"
+                journal_path(data_file).unlink(missing_ok=True)
                 data["name"] = name
                 with open(data_file, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=4)
+                if self.store is not None:
+                    self.store.replace(name, data)
 
                 new_proj = {
                     "name": name,
@@ -427,8 +811,10 @@ class ProjectManager:
                     "path": target_dir,
                     "data_file": data_file,
                     "data": data,
+                    "item_count": len(data.get("items", [])),
                     "size": self._get_dir_size(target_dir),
                 }
+                self.sizes.set(name, new_proj["size"], scanned=True)
                 self.projects.append(new_proj)
                 self.save_projects()
                 logger.info("Import erfolgreich: '%s'", name)
@@ -444,7 +830,7 @@ class ProjectManager:
             logger.error("Import: project.json beschädigt: %s", exc)
             messagebox.showerror("Import Fehler", "Projektdatei ist beschädigt.")
             return False
-        except OSError as exc:
+        except (OSError, sqlite3.Error) as exc:
             logger.error("Import IO-Fehler: %s", exc)
             messagebox.showerror("Import Fehler", str(exc))
             return False
@@ -453,11 +839,14 @@ class ProjectManager:
         gc.collect()
         try:
             shutil.rmtree(project["path"])
+            if self.store is not None:
+                self.store.delete(project["name"])
+            self.sizes.remove(project["name"])
             self.projects.remove(project)
             self.save_projects()
             logger.info("Projekt gelöscht: %s", project["name"])
             return True
-        except OSError as exc:
+        except (OSError, sqlite3.Error) as exc:
             logger.error("Projekt '%s' konnte nicht gelöscht werden: %s", project["name"], exc)
             messagebox.showerror("Fehler", str(exc))
             return False
\ No newline at end of file
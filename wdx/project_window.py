@@ -3,6 +3,17 @@ from ttkbootstrap.constants import *
 import tkinter as tk
 from tkinter import messagebox, simpledialog, colorchooser, filedialog
 from dialogs import SourceDialog, HeadingDialog, FileCardDialog
+from page_fetcher import apply_snapshot
+from snapshot_store import read_snapshot_bytes, browser_path, snapshot_refs, release_snapshots
+from size_ledger import get_size_ledger
+from image_cache import get_image_cache, thumbnail_size
+from spatial_index import GridIndex
+from item_index import ItemIndex
+from search_index import SearchIndex, SEARCH_INDEX_NAME
+from page_index import PageTextIndex, page_files
+from file_watcher import FileWatcher
+from project_journal import JOURNAL_NAME, put_op, move_op, delete_op, meta_op
+from constants import LOD_ZOOM_PERCENT
 import datetime
 import uuid
 import webbrowser
@@ -16,10 +27,9 @@ import sys
 from bs4 import BeautifulSoup
 from pathlib import Path
 from PIL import Image, ImageTk
-import requests
-from urllib.parse import urlparse, urljoin
 import threading
 import concurrent.futures
+from collections import Counter, OrderedDict
 
 from wdx_logger import get_logger
 
@@ -39,6 +49,29 @@ def get_contrast_color(hex_color):
     return "#000000" if luminosity > 128 else "#ffffff"
 
 
+CARD_LAYOUT_KEYS = ("pos_x", "pos_y", "effective_color")
+
+
+def card_fingerprint(item):
+    """Hash der angezeigten Felder eines Elements (ohne Position)."""
+    fields = {k: v for k, v in item.items() if k not in CARD_LAYOUT_KEYS}
+    return hash(json.dumps(fields, sort_keys=True, default=str))
+
+
+# Widgets gibt es nur für Karten im sichtbaren Bereich plus diesem Rand (Pixel)
+VIEWPORT_MARGIN = 400
+# Ausgeblendete Karten, die beim Zurückscrollen wiederverwendet werden
+CARD_POOL_SIZE = 120
+# Geschätzte Kartengröße bei Zoom 1, bis die Karte einmal gezeichnet wurde
+CARD_SHELL_SIZES = {"source": (390, 230), "file": (340, 200), "heading": (260, 80)}
+# Mindestabstand zwischen zwei Minimap-Aktualisierungen (ms, etwa ein Frame)
+MINIMAP_REFRESH_MS = 16
+# Wartezeit nach der letzten Änderung, bis der Suchindex nachgeführt wird (ms)
+SEARCH_SYNC_DELAY_MS = 1000
+# Ansichtszustand, der mit dem Projekt gespeichert wird
+VIEW_KEYS = ("canvas_zoom_level", "selected_source_id")
+
+
 FILE_TYPE_ICONS = {
     ".pdf": "📕", ".doc": "📝", ".docx": "📝", ".odt": "📝",
     ".xls": "📊", ".xlsx": "📊", ".ods": "📊", ".csv": "📊",
@@ -438,6 +471,13 @@ class ProjectWindow:
         self.app = app
         self.source_frames = {}
         self.card_widgets = {}
+        self.card_shells = {}
+        self._shell_items = {}
+        self._card_pool = OrderedDict()
+        self._viewport_pending = False
+        self._lod_texts = {}
+        self.spatial = GridIndex()
+        self._marquee = None
         self.selected_source_id = None
         self.dragging_card = False
         self.dragging_canvas = False
@@ -450,8 +490,7 @@ class ProjectWindow:
         self.clipboard = None
         self.paste_offset_x = 50
         self.paste_offset_y = 50
-        self.last_file_mtime = 0
-        self.update_last_mtime()
+        self.file_watcher = None
         self.executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=os.cpu_count() or 4
         )
@@ -465,9 +504,17 @@ class ProjectWindow:
         self.base_font_default = ("Helvetica", 10)
         self.base_icon_size = 20
         self.base_favicon_subsample = 2
+        self.lod_threshold = self.app.project_manager.get_setting(
+            "lod_zoom_percent", LOD_ZOOM_PERCENT
+        ) / 100
+        self.lod_active = self.zoom_level < self.lod_threshold
         self.minimap_canvas = None
         self.viewport_rect_id = None
         self._minimap_params = {}
+        self._minimap_rects = {}
+        self._minimap_dirty = set()
+        self._minimap_pending = False
+        self._minimap_transform = None
         self.search_results = []
         self.search_result_index = 0
         self.search_highlighted_ids = set()
@@ -480,6 +527,11 @@ class ProjectWindow:
                 ]
             else:
                 self.project["data"]["items"] = []
+        self.item_index = ItemIndex(self.project["data"]["items"])
+        self._saved_view = {key: self.project["data"].get(key) for key in VIEW_KEYS}
+        self.search_index = SearchIndex(Path(self.project["path"]) / SEARCH_INDEX_NAME)
+        self.page_index = PageTextIndex(self.project["path"])
+        self._search_sync_job = None
 
         logger.info("ProjectWindow geöffnet: %s", project["name"])
 
@@ -514,6 +566,12 @@ class ProjectWindow:
             btn_frame, text="🔄", width=3, bootstyle="info-outline",
             command=self.manual_reload,
         ).pack(side="left", padx=2)
+        ttk.Button(
+            btn_frame, text="🌐", width=3, bootstyle="info-outline",
+            command=self.refresh_all_sources,
+        ).pack(side="left", padx=2)
+        self.bulk_status_label = ttk.Label(btn_frame, text="", font=("Helvetica", 9))
+        self.bulk_status_label.pack(side="left", padx=(6, 0))
         ttk.Label(
             header_frame,
             text=f"Mindmap: {project['name']}",
@@ -548,20 +606,28 @@ class ProjectWindow:
             bootstyle="round-toggle",
             command=self._on_search_change,
         ).grid(row=0, column=2, padx=(0, 12))
+        self.search_pages_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            search_frame,
+            text="Seiteninhalte durchsuchen",
+            variable=self.search_pages_var,
+            bootstyle="round-toggle",
+            command=self._on_search_change,
+        ).grid(row=0, column=3, padx=(0, 12))
         self.search_prev_btn = ttk.Button(
             search_frame, text="◀", width=3, bootstyle="secondary-outline",
             command=self._search_prev,
         )
-        self.search_prev_btn.grid(row=0, column=3, padx=1)
+        self.search_prev_btn.grid(row=0, column=4, padx=1)
         self.search_next_btn = ttk.Button(
             search_frame, text="▶", width=3, bootstyle="secondary-outline",
             command=self._search_next,
         )
-        self.search_next_btn.grid(row=0, column=4, padx=1)
+        self.search_next_btn.grid(row=0, column=5, padx=1)
         self.search_status_label = ttk.Label(
             search_frame, text="", font=("Helvetica", 9), width=14
         )
-        self.search_status_label.grid(row=0, column=5, padx=(6, 0))
+        self.search_status_label.grid(row=0, column=6, padx=(6, 0))
 
         self.canvas = tk.Canvas(
             self.main_frame, bg="#f5f7fa", highlightthickness=0
@@ -578,7 +644,8 @@ class ProjectWindow:
             command=self.canvas.yview, bootstyle="round",
         )
         self.canvas.configure(
-            xscrollcommand=h_scroll.set, yscrollcommand=v_scroll.set
+            xscrollcommand=lambda *args: self._on_canvas_scrolled(h_scroll, *args),
+            yscrollcommand=lambda *args: self._on_canvas_scrolled(v_scroll, *args),
         )
         self.canvas.config(xscrollincrement=1, yscrollincrement=1)
         h_scroll.grid(row=2, column=0, sticky=(tk.W, tk.E))
@@ -602,13 +669,18 @@ class ProjectWindow:
         )
         self.minimap_canvas.place(relx=1.0, rely=1.0, x=-70, y=-70, anchor="se")
         self.minimap_canvas.bind("<ButtonPress-1>", self.on_minimap_click)
+        self.minimap_canvas.bind("<Configure>", lambda e: self._update_minimap())
         self.context_menu = tk.Menu(self.root, tearoff=0, font=("Helvetica", 10))
         self.load_items_on_canvas()
+        self.executor.submit(
+            self._sync_search_index, list(self.item_index.items), True
+        )
+        self.executor.submit(self._sync_page_index, page_files(self.item_index.items))
         self.canvas.bind("<ButtonPress-1>", self.on_canvas_press)
         self.canvas.bind("<B1-Motion>", self.on_canvas_motion)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
         self._bind_shortcuts()
-        self.start_auto_refresh()
+        self.start_file_watch()
 
     
     def _bind_shortcuts(self):
@@ -617,6 +689,7 @@ class ProjectWindow:
             self.root.bind(modifier.format("q"), lambda e: self.shortcut_citation())
             self.root.bind(modifier.format("h"), lambda e: self.show_saved_shortcut())
             self.root.bind(modifier.format("l"), lambda e: self.reload_current_page_shortcut())
+            self.root.bind(modifier.format("L"), lambda e: self.refresh_all_sources())
             self.root.bind(modifier.format("e"), lambda e: self.edit_shortcut())
             self.root.bind(modifier.format("w"), lambda e: self.back_to_projects())
             self.root.bind(modifier.format("r"), lambda e: self.reset_zoom())
@@ -641,9 +714,7 @@ class ProjectWindow:
     def _handle_copy_shortcut(self, event):
         if self.selected_source_ids:
             item_id = next(iter(self.selected_source_ids))
-            item = next(
-                (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-            )
+            item = self.item_index.get(item_id)
             if item:
                 self.copy_card(item)
 
@@ -690,9 +761,18 @@ class ProjectWindow:
         self._remove_search_highlights()
         self.search_results = []
 
-        for item in self.project["data"]["items"]:
-            if self._item_matches(item, query_lower, only_kw):
-                self.search_results.append(item["id"])
+        hits = self.search_index.search(query, only_kw)
+        if hits is None:
+            # Index noch im Aufbau oder Anfrage ohne Wortzeichen
+            hits = {
+                item["id"] for item in self.item_index.items
+                if self._item_matches(item, query_lower, only_kw)
+            }
+        if self.search_pages_var.get():
+            hits |= self.page_index.search(query)
+        self.search_results = [
+            item["id"] for item in self.item_index.items if item["id"] in hits
+        ]
 
         if self.search_results:
             self.search_result_index = 0
@@ -705,6 +785,40 @@ class ProjectWindow:
             self.search_status_label.config(text="Kein Treffer")
             logger.debug("Suche '%s' — kein Treffer", query)
 
+    def _sync_search_index(self, items, load=False):
+        """Baut den Suchindex im Hintergrund auf bzw. führt ihn nach (Worker-Thread)."""
+        try:
+            if load:
+                self.search_index.load()
+            changed = self.search_index.sync(items)
+            if changed:
+                self.search_index.save()
+            logger.debug("Suchindex abgeglichen: %d Änderung(en)", changed)
+        except Exception as exc:
+            logger.exception("Suchindex konnte nicht aktualisiert werden: %s", exc)
+
+    def _sync_page_index(self, files_by_item):
+        """Extrahiert neue Snapshots in den Seitenindex (Worker-Thread)."""
+        try:
+            self.page_index.sync(files_by_item)
+        except Exception as exc:
+            logger.exception("Seitenindex konnte nicht aktualisiert werden: %s", exc)
+
+    def _schedule_search_sync(self):
+        if self.shutting_down:
+            return
+        if self._search_sync_job is not None:
+            self.root.after_cancel(self._search_sync_job)
+        self._search_sync_job = self.root.after(
+            SEARCH_SYNC_DELAY_MS, self._start_search_sync
+        )
+
+    def _start_search_sync(self):
+        self._search_sync_job = None
+        if not self.shutting_down:
+            self.executor.submit(self._sync_search_index, list(self.item_index.items))
+            self.executor.submit(self._sync_page_index, page_files(self.item_index.items))
+
     def _apply_search_highlights(self):
         self.search_highlighted_ids = set(self.search_results)
         for i, item_id in enumerate(self.search_results):
@@ -712,21 +826,13 @@ class ProjectWindow:
             self._highlight_card(active=is_active, item_id=item_id)
 
     def _highlight_card(self, active=False, item_id=None):
-        if item_id not in self.source_frames:
+        if item_id not in self.card_shells:
             return
-        frame, canvas_id = self.source_frames[item_id]
         self.canvas.update_idletasks()
-        coords = self.canvas.coords(canvas_id)
+        coords = self.canvas.coords(self.card_shells[item_id])
         if not coords:
             return
-        x1, y1 = coords[0], coords[1]
-        fw = frame.winfo_width()
-        fh = frame.winfo_height()
-        if fw <= 1 or fh <= 1:
-            fw = frame.winfo_reqwidth()
-            fh = frame.winfo_reqheight()
-        x2 = x1 + fw
-        y2 = y1 + fh
+        x1, y1, x2, y2 = coords
         tag = f"search_glow_{item_id}"
         self.canvas.delete(tag)
         if active:
@@ -739,7 +845,6 @@ class ProjectWindow:
             tags=(tag, "search_glow"),
         )
         self.canvas.tag_raise(tag)
-        self.canvas.tag_raise(canvas_id)
 
     def _remove_search_highlights(self):
         self.canvas.delete("search_glow")
@@ -757,18 +862,15 @@ class ProjectWindow:
         if not self.search_results:
             return
         item_id = self.search_results[index]
-        if item_id not in self.source_frames:
+        if item_id not in self.card_shells:
             return
-        frame, canvas_id = self.source_frames[item_id]
         self.canvas.update_idletasks()
-        coords = self.canvas.coords(canvas_id)
+        coords = self.canvas.coords(self.card_shells[item_id])
         if not coords:
             return
-        x1, y1 = coords[0], coords[1]
-        fw = frame.winfo_width() or frame.winfo_reqwidth()
-        fh = frame.winfo_height() or frame.winfo_reqheight()
-        cx = x1 + fw / 2
-        cy = y1 + fh / 2
+        x1, y1, x2, y2 = coords
+        cx = (x1 + x2) / 2
+        cy = (y1 + y2) / 2
         bbox = self.canvas.bbox("all")
         if not bbox:
             return
@@ -824,7 +926,8 @@ class ProjectWindow:
             check_path = (
                 Path(self.project["path"]) / "images" / item["favicon"]
             )
-            if check_path.exists():
+            # Dekodieren im Worker-Thread, damit der Tk-Thread nur noch skaliert
+            if get_image_cache().image(check_path) is not None:
                 favicon_path = str(check_path)
             else:
                 logger.debug("Favicon-Datei nicht gefunden: %s", check_path)
@@ -868,24 +971,312 @@ class ProjectWindow:
             frame.destroy()
         self.source_frames.clear()
         self.card_widgets.clear()
+        self._card_pool.clear()
+        self.canvas.delete("card_lod")
+        self._lod_texts.clear()
+        self.canvas.delete("card_shell")
+        self.card_shells.clear()
+        self._shell_items.clear()
+        self.spatial.clear()
+        self._minimap_transform = None
         self.canvas.delete("search_glow")
         self.search_highlighted_ids = set()
 
+        # Nur Platzhalter anlegen; Widgets entstehen in _refresh_viewport
         for result in processed_results:
             item = result["item"]
+            self._ensure_shell(item)
             if self.project["data"].get("selected_source_id") == item["id"]:
-                self.selected_source_id = item["id"]
-            kind = result.get("kind")
-            if kind == "source":
-                self._create_source_card_gui(item, result["favicon_path"])
-            elif kind == "file":
-                self._create_file_card_gui(item)
-            else:
-                self._create_heading_card_gui(item)
+                self.selected_source_ids.add(item["id"])
 
         self.update_scrollregion()
+        self._refresh_viewport()
         self._update_minimap()
 
+    def _create_card_gui(self, result):
+        item = result["item"]
+        kind = result.get("kind")
+        if kind == "source":
+            self._create_source_card_gui(item, result["favicon_path"])
+        elif kind == "file":
+            self._create_file_card_gui(item)
+        else:
+            self._create_heading_card_gui(item)
+
+    def _destroy_card(self, item_id, keep_shell=False):
+        entry = self.source_frames.pop(item_id, None)
+        if entry is not None:
+            frame, canvas_id = entry
+            self.canvas.delete(canvas_id)
+            frame.destroy()
+        self.card_widgets.pop(item_id, None)
+        self._card_pool.pop(item_id, None)
+        self.canvas.delete(f"search_glow_{item_id}")
+        lod_text = self._lod_texts.pop(item_id, None)
+        if lod_text is not None:
+            self.canvas.delete(lod_text)
+        if not keep_shell:
+            shell = self.card_shells.pop(item_id, None)
+            if shell is not None:
+                self.canvas.delete(shell)
+                self._shell_items.pop(shell, None)
+            self.spatial.remove(item_id)
+            self._update_minimap([item_id])
+
+    def _ensure_shell(self, item):
+        """Legt den Platzhalter eines Elements an oder aktualisiert dessen dict.
+
+        Jedes Element hat ein unsichtbares Canvas-Rechteck mit dem Tag
+        ``card_{id}``; es bestimmt Position, Größe, Scrollbereich und Sichtbarkeit
+        der Karte, auch wenn (noch) kein Widget dafür existiert.
+        """
+        item_id = item["id"]
+        shell = self.card_shells.get(item_id)
+        if shell is None:
+            x, y = item.get("pos_x", 300), item.get("pos_y", 300)
+            w, h = CARD_SHELL_SIZES.get(item.get("type"), CARD_SHELL_SIZES["source"])
+            box = (x, y, x + w * self.zoom_level, y + h * self.zoom_level)
+            bg = self.canvas.cget("bg")
+            shell = self.canvas.create_rectangle(
+                *box, fill=bg, outline="", tags=("card_shell", f"card_{item_id}"),
+            )
+            self.canvas.tag_lower(shell)
+            self.card_shells[item_id] = shell
+            self.spatial.set(item_id, *box)
+        self._shell_items[shell] = item
+        self._update_minimap([item_id])
+        if self.lod_active:
+            self._style_lod_shell(shell, item)
+        return shell
+
+    def _index_card(self, item_id, box):
+        self.spatial.set(item_id, *box)
+        self._update_minimap([item_id])
+
+    def _card_origin(self, item):
+        coords = self.canvas.coords(self._ensure_shell(item))
+        return coords[0], coords[1]
+
+    def _fit_shell(self, item_id, frame):
+        """Passt den Platzhalter an die tatsächliche Kartengröße an."""
+        shell = self.card_shells.get(item_id)
+        entry = self.source_frames.get(item_id)
+        if shell is None or entry is None or entry[0] is not frame:
+            return
+        coords = self.canvas.coords(entry[1])
+        if coords:
+            x, y = coords
+            box = (x, y, x + frame.winfo_width(), y + frame.winfo_height())
+            self.canvas.coords(shell, *box)
+            self._index_card(item_id, box)
+
+    def _place_card_window(self, item, frame):
+        item_id = item["id"]
+        x, y = self._card_origin(item)
+        window_id = self.canvas.create_window(
+            x, y, window=frame, anchor="nw", tags=("card_window", f"card_{item_id}")
+        )
+        self.source_frames[item_id] = (frame, window_id)
+        frame.bind("<Configure>", lambda e, iid=item_id, f=frame: self._fit_shell(iid, f))
+        return window_id
+
+    def _on_canvas_scrolled(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        self._schedule_viewport_refresh()
+
+    def _schedule_viewport_refresh(self):
+        if self._viewport_pending or self.shutting_down:
+            return
+        self._viewport_pending = True
+        self.root.after_idle(self._refresh_viewport)
+
+    def _visible_item_ids(self):
+        return self.spatial.query(
+            self.canvas.canvasx(0) - VIEWPORT_MARGIN,
+            self.canvas.canvasy(0) - VIEWPORT_MARGIN,
+            self.canvas.canvasx(self.canvas.winfo_width()) + VIEWPORT_MARGIN,
+            self.canvas.canvasy(self.canvas.winfo_height()) + VIEWPORT_MARGIN,
+        )
+
+    def _refresh_viewport(self):
+        """Erzeugt Widgets für sichtbare Karten und blendet die übrigen aus.
+
+        Ausgeblendete Karten bleiben bis zu ``CARD_POOL_SIZE`` Stück erhalten und
+        werden beim Zurückscrollen nur wieder eingeblendet; ältere werden zerstört.
+        Die Auswahl wird nur über Ids geführt; ausgewählte Karten erhalten ihre
+        Markierung, sobald ihr Widget entsteht.
+        """
+        self._viewport_pending = False
+        if self.shutting_down or not self.canvas.winfo_exists():
+            return
+        visible = self._visible_item_ids()
+        # In der vereinfachten Ansicht gibt es keine Widgets
+        keep = set() if self.lod_active else visible
+
+        for item_id in list(self.source_frames):
+            if item_id not in keep and item_id not in self._card_pool:
+                self.canvas.itemconfigure(self.source_frames[item_id][1], state="hidden")
+                self._card_pool[item_id] = True
+
+        created = 0
+        if self.lod_active:
+            self._refresh_lod_texts(visible)
+            visible = set()
+        for item_id in visible:
+            if item_id in self._card_pool:
+                del self._card_pool[item_id]
+                self.canvas.itemconfigure(self.source_frames[item_id][1], state="normal")
+                self._update_card_content_scale([item_id])
+            elif item_id not in self.source_frames:
+                item = self._shell_items[self.card_shells[item_id]]
+                self._create_card_gui(self._process_item_data(item))
+                created += 1
+
+        excess = len(self._card_pool) - CARD_POOL_SIZE
+        for item_id in list(self._card_pool)[:max(0, excess)]:
+            self._destroy_card(item_id, keep_shell=True)
+        if created:
+            logger.debug(
+                "Viewport: %d Karte(n) erzeugt, %d sichtbar, %d im Pool",
+                created, len(visible), len(self._card_pool),
+            )
+
+    def _update_lod(self):
+        """Schaltet beim Unterschreiten der Zoom-Schwelle auf Canvas-Rechtecke um.
+
+        In der vereinfachten Ansicht zeigt jeder Platzhalter die Kartenfarbe und
+        (ab lesbarer Schriftgröße) den Titel als Canvas-Text; Widgets werden
+        ausgeblendet und erst beim Hineinzoomen wieder verwendet.
+        """
+        lod = self.zoom_level < self.lod_threshold
+        # Texte haben eine feste Schriftgröße und werden je Zoomstufe neu erzeugt
+        self.canvas.delete("card_lod")
+        self._lod_texts.clear()
+        self._schedule_viewport_refresh()
+        if lod == self.lod_active:
+            return
+        self.lod_active = lod
+        bg = self.canvas.cget("bg")
+        for shell, item in self._shell_items.items():
+            if lod:
+                self._style_lod_shell(shell, item)
+            else:
+                self.canvas.itemconfigure(shell, fill=bg, outline="")
+        logger.debug(
+            "Vereinfachte Kartenansicht %s (Zoom %.2f)",
+            "aktiv" if lod else "beendet", self.zoom_level,
+        )
+
+    def _lod_color(self, item):
+        if item.get("effective_color"):
+            return item["effective_color"]
+        if item.get("color"):
+            return item["color"]
+        if item.get("type") == "heading":
+            return self.DEFAULT_HEADING_BG
+        return self.DEFAULT_SOURCE_BG
+
+    def _style_lod_shell(self, shell, item):
+        self.canvas.itemconfigure(shell, fill=self._lod_color(item), outline="#aaaaaa")
+
+    def _refresh_lod_texts(self, visible):
+        for item_id in list(self._lod_texts):
+            if item_id not in visible:
+                self.canvas.delete(self._lod_texts.pop(item_id))
+        font_size = int(self.base_font_title[1] * self.zoom_level)
+        if font_size < 5:
+            return
+        pad = 8 * self.zoom_level
+        for item_id in visible:
+            if item_id in self._lod_texts:
+                continue
+            item = self._shell_items[self.card_shells[item_id]]
+            x1, y1, x2, _ = self.canvas.coords(self.card_shells[item_id])
+            title = (
+                item.get("title") or item.get("url") or item.get("filename")
+                or item.get("text") or ""
+            )
+            if len(title) > 80:
+                title = title[:80] + "…"
+            self._lod_texts[item_id] = self.canvas.create_text(
+                x1 + pad, y1 + pad, text=title, anchor="nw",
+                width=max(1, x2 - x1 - 2 * pad),
+                font=("Helvetica", font_size, "bold"),
+                fill=get_contrast_color(self._lod_color(item)),
+                tags=("card_lod", f"card_{item_id}"),
+            )
+
+    def _reconcile_cards(self, items):
+        """Gleicht die Karten mit einer neuen Elementliste ab, statt alle neu zu bauen.
+
+        Unveränderte Elemente behalten Karte und dict (Bindings verweisen darauf),
+        verschobene werden nur versetzt, geänderte einzeln neu aufgebaut.
+        Auswahl, Suchtreffer und Scrollposition bleiben erhalten.
+        """
+        xview, yview = self.canvas.xview()[0], self.canvas.yview()[0]
+        created = updated = moved = 0
+        merged = []
+        seen = set()
+        for item in items:
+            item_id = item.get("id")
+            seen.add(item_id)
+            shell = self.card_shells.get(item_id)
+            if shell is None:
+                self._ensure_shell(item)
+                merged.append(item)
+                created += 1
+                continue
+            current = self._shell_items[shell]
+            if card_fingerprint(current) != card_fingerprint(item):
+                self._destroy_card(item_id, keep_shell=True)
+                self._ensure_shell(item)
+                self._move_shell(item_id, item)
+                merged.append(item)
+                updated += 1
+                continue
+            x, y = item.get("pos_x", 300), item.get("pos_y", 300)
+            if (current.get("pos_x"), current.get("pos_y")) != (x, y):
+                self._move_shell(item_id, item)
+                current["pos_x"], current["pos_y"] = x, y
+                moved += 1
+            merged.append(current)
+
+        removed = [item_id for item_id in self.card_shells if item_id not in seen]
+        for item_id in removed:
+            self._destroy_card(item_id)
+            self.selected_source_ids.discard(item_id)
+            self.card_original_colors.pop(item_id, None)
+        self.project["data"]["items"] = merged
+        self.item_index.rebuild(merged)
+
+        if created or updated or moved or removed:
+            self.update_scrollregion()
+            self.canvas.xview_moveto(xview)
+            self.canvas.yview_moveto(yview)
+            self._refresh_viewport()
+        if self.search_results and (created or updated or moved or removed):
+            self.search_results = [i for i in self.search_results if i in self.card_shells]
+            self._remove_search_highlights()
+            if self.search_results:
+                self.search_result_index = min(
+                    self.search_result_index, len(self.search_results) - 1
+                )
+                self._apply_search_highlights()
+            self._update_search_status()
+        logger.debug(
+            "Karten abgeglichen — %d neu, %d geändert, %d verschoben, %d entfernt",
+            created, updated, moved, len(removed),
+        )
+
+    def _move_shell(self, item_id, item):
+        """Versetzt Platzhalter und ggf. Karte an die gespeicherte Position."""
+        coords = self.canvas.coords(self.card_shells[item_id])
+        dx = item.get("pos_x", 300) - coords[0]
+        dy = item.get("pos_y", 300) - coords[1]
+        if dx or dy:
+            self.canvas.move(f"card_{item_id}", dx, dy)
+            self._index_card(item_id, self.canvas.coords(self.card_shells[item_id]))
+
     
     def _get_effective_bg_color(self, item):
         custom_color = item.get("color", "").strip()
@@ -910,7 +1301,9 @@ class ProjectWindow:
         if new_zoom < self.min_zoom or new_zoom > self.max_zoom:
             return
         self.canvas.scale("all", x, y, factor, factor)
+        self.spatial.transform(factor, x, y)
         self.zoom_level = new_zoom
+        self._update_lod()
         self._update_card_content_scale()
         self.update_scrollregion()
         self._update_minimap()
@@ -920,17 +1313,28 @@ class ProjectWindow:
             return
         factor = 1.0 / self.zoom_level
         self.canvas.scale("all", 0, 0, factor, factor)
+        self.spatial.transform(factor, 0, 0)
         self.zoom_level = 1.0
+        self._update_lod()
         self._update_card_content_scale()
         self.update_scrollregion()
         self._update_minimap()
 
-    def _update_card_content_scale(self):
+    def _update_card_content_scale(self, item_ids=None):
+        """Skaliert Schriften und Favicons; ohne ``item_ids`` alle sichtbaren Karten."""
+        if item_ids is None:
+            if self.lod_active:
+                return
+            item_ids = [i for i in self.card_widgets if i not in self._card_pool]
         title_size = max(int(self.base_font_title[1] * self.zoom_level), 5)
         heading_size = max(int(self.base_font_heading[1] * self.zoom_level), 8)
         default_size = max(int(self.base_font_default[1] * self.zoom_level), 5)
 
-        for item_id, refs in self.card_widgets.items():
+        for item_id in item_ids:
+            refs = self.card_widgets.get(item_id)
+            if refs is None or refs.get("zoom") == self.zoom_level:
+                continue
+            refs["zoom"] = self.zoom_level
             try:
                 if "title_label" in refs:
                     refs["title_label"].config(font=("Helvetica", title_size, "bold"))
@@ -951,14 +1355,13 @@ class ProjectWindow:
                 if "icon_label" in refs:
                     od = refs.get("original_icon_data", {})
                     if od.get("is_favicon"):
-                        target_size = max(1, int(16 * self.zoom_level))
                         try:
-                            resized = od["pil_img"].resize(
-                                (target_size, target_size), Image.Resampling.LANCZOS
+                            new_img = get_image_cache().photo(
+                                od["path"], thumbnail_size(16, self.zoom_level)
                             )
-                            new_img = ImageTk.PhotoImage(resized)
-                            refs["icon_label"].config(image=new_img)
-                            refs["icon_label"].image = new_img
+                            if new_img is not None:
+                                refs["icon_label"].config(image=new_img)
+                                refs["icon_label"].image = new_img
                         except Exception as exc:
                             logger.debug(
                                 "Favicon-Resize fehlgeschlagen (%s): %s", item_id, exc
@@ -1016,17 +1419,16 @@ class ProjectWindow:
             if f.item_data["id"] not in self.selected_source_ids:
                 f.config(borderwidth=default_border, relief="raised")
 
+        tk_img = None
         if favicon_path:
+            tk_img = get_image_cache().photo(
+                favicon_path, thumbnail_size(16, self.zoom_level, minimum=10)
+            )
+        if tk_img is not None:
             try:
-                pil_img = Image.open(favicon_path)
                 self.card_widgets[item_id]["original_icon_data"] = {
-                    "pil_img": pil_img, "is_favicon": True
+                    "path": favicon_path, "is_favicon": True
                 }
-                target_size = max(10, int(16 * self.zoom_level))
-                resized_pil = pil_img.resize(
-                    (target_size, target_size), Image.Resampling.LANCZOS
-                )
-                tk_img = ImageTk.PhotoImage(resized_pil)
                 favicon_label = tk.Label(frame, image=tk_img, bg=color)
                 favicon_label.image = tk_img
                 favicon_label.pack(anchor="w")
@@ -1113,19 +1515,17 @@ class ProjectWindow:
         frame.bind("<B1-Motion>", lambda e: self.on_card_motion(e))
         frame.bind("<ButtonRelease-1>", lambda e: self.on_card_release(e))
 
-        x, y = source.get("pos_x", 300), source.get("pos_y", 300)
-        window_id = self.canvas.create_window(x, y, window=frame, anchor="nw")
-        self.source_frames[item_id] = (frame, window_id)
+        self._place_card_window(source, frame)
 
         if self.selected_source_id == item_id:
             self.selected_source_ids.add(item_id)
+            self.selected_source_id = None
+        if item_id in self.selected_source_ids:
             self.card_original_colors[item_id] = color
             self._apply_selection_style(item_id, color)
-            self.selected_source_id = None
 
         if self.zoom_level != 1.0:
-            self.canvas.scale(window_id, x, y, self.zoom_level, self.zoom_level)
-            self._update_card_content_scale()
+            self._update_card_content_scale([item_id])
 
     def _create_heading_card_gui(self, heading):
         color = self._get_effective_bg_color(heading)
@@ -1180,35 +1580,52 @@ class ProjectWindow:
         frame.bind("<B1-Motion>", lambda e: self.on_card_motion(e))
         frame.bind("<ButtonRelease-1>", lambda e: self.on_card_release(e))
 
-        x, y = heading.get("pos_x", 300), heading.get("pos_y", 300)
-        window_id = self.canvas.create_window(x, y, window=frame, anchor="nw")
-        self.source_frames[item_id] = (frame, window_id)
+        self._place_card_window(heading, frame)
 
         if self.selected_source_id == item_id:
             self.selected_source_ids.add(item_id)
+            self.selected_source_id = None
+        if item_id in self.selected_source_ids:
             self.card_original_colors[item_id] = color
             self._apply_selection_style(item_id, color)
-            self.selected_source_id = None
 
         if self.zoom_level != 1.0:
-            self.canvas.scale(window_id, x, y, self.zoom_level, self.zoom_level)
-            self._update_card_content_scale()
+            self._update_card_content_scale([item_id])
 
     
-    def _update_minimap(self):
-        if not self.minimap_canvas or not self.minimap_canvas.winfo_exists():
+    def _update_minimap(self, item_ids=None):
+        """Plant ein Neuzeichnen der Minimap, höchstens einmal pro Frame.
+
+        ``item_ids`` markiert einzelne Karten als geändert; ohne Angabe wird
+        nur die Abbildung auf die Minimap (Zoom, Gesamtgröße) nachgeführt.
+        """
+        if item_ids:
+            self._minimap_dirty.update(item_ids)
+        if self._minimap_pending or self.shutting_down:
             return
+        self._minimap_pending = True
+        self.root.after(MINIMAP_REFRESH_MS, self._render_minimap)
 
-        self.minimap_canvas.delete("all")
-        bbox_all = self.canvas.bbox("all")
+    def _render_minimap(self):
+        self._minimap_pending = False
+        if (
+            self.shutting_down
+            or not self.minimap_canvas
+            or not self.minimap_canvas.winfo_exists()
+        ):
+            return
 
+        bbox_all = self.spatial.bounds()
         self._minimap_params = {
             "minimap_scale": 1.0, "offset_x": 0, "offset_y": 0,
             "x1_main": 0, "y1_main": 0, "x2_main": 0, "y2_main": 0,
         }
 
         if not bbox_all:
-            self.viewport_rect_id = None
+            self.minimap_canvas.delete("minimap_card")
+            self._minimap_rects.clear()
+            self._minimap_dirty.clear()
+            self._minimap_transform = None
             self._update_minimap_viewport()
             return
 
@@ -1238,18 +1655,52 @@ class ProjectWindow:
             "offset_x": offset_x, "offset_y": offset_y,
         })
 
-        for item_id, (frame, window_id) in self.source_frames.items():
-            coords = self.canvas.coords(window_id)
-            if not coords:
+        # Die Rechtecke liegen in Weltkoordinaten des Index vor; Zoom und
+        # geänderte Gesamtgröße verschieben nur diese eine Abbildung.
+        scale = self.spatial.scale * minimap_scale
+        ox = self.spatial.offset_x * minimap_scale + offset_x
+        oy = self.spatial.offset_y * minimap_scale + offset_y
+        if self._minimap_transform is None:
+            self.minimap_canvas.delete("minimap_card")
+            self._minimap_rects.clear()
+            self._minimap_dirty.update(item_id for item_id, _ in self.spatial.items())
+        elif self._minimap_transform != (scale, ox, oy):
+            old_scale, old_ox, old_oy = self._minimap_transform
+            ratio = scale / old_scale
+            self.minimap_canvas.scale("minimap_card", 0, 0, ratio, ratio)
+            self.minimap_canvas.move(
+                "minimap_card", ox - old_ox * ratio, oy - old_oy * ratio
+            )
+        self._minimap_transform = (scale, ox, oy)
+
+        for item_id in self._minimap_dirty:
+            rect = self._minimap_rects.get(item_id)
+            box = self.spatial.world_box(item_id)
+            if box is None:
+                if rect is not None:
+                    self.minimap_canvas.delete(rect[0])
+                    del self._minimap_rects[item_id]
                 continue
-            color = frame.item_data.get("effective_color", "#ffffff")
-            mx = coords[0] * minimap_scale + offset_x
-            my = coords[1] * minimap_scale + offset_y
-            mw = max(15, frame.winfo_width() * minimap_scale)
-            mh = max(15, frame.winfo_height() * minimap_scale)
-            self.minimap_canvas.create_rectangle(
-                mx, my, mx + mw, my + mh, fill=color, outline="#aaaaaa", width=1
+            item = self._shell_items[self.card_shells[item_id]]
+            color = item.get("effective_color") or item.get("color") or "#ffffff"
+            coords = (
+                box[0] * scale + ox, box[1] * scale + oy,
+                box[2] * scale + ox, box[3] * scale + oy,
             )
+            if rect is None:
+                self._minimap_rects[item_id] = (
+                    self.minimap_canvas.create_rectangle(
+                        *coords, fill=color, outline="#aaaaaa", width=1,
+                        tags=("minimap_card",),
+                    ),
+                    color,
+                )
+                continue
+            self.minimap_canvas.coords(rect[0], *coords)
+            if rect[1] != color:
+                self.minimap_canvas.itemconfigure(rect[0], fill=color)
+                self._minimap_rects[item_id] = (rect[0], color)
+        self._minimap_dirty.clear()
 
         self._update_minimap_viewport()
 
@@ -1371,7 +1822,10 @@ class ProjectWindow:
 
     def deselect_all_cards(self, exclude_id=None):
         for item_id in list(self.selected_source_ids):
-            if item_id != exclude_id and item_id in self.source_frames:
+            if item_id != exclude_id and item_id not in self.source_frames:
+                self.selected_source_ids.discard(item_id)
+                self.card_original_colors.pop(item_id, None)
+            elif item_id != exclude_id:
                 frame = self.source_frames[item_id][0]
                 item = frame.item_data
                 original_color = self.card_original_colors.pop(
@@ -1384,16 +1838,34 @@ class ProjectWindow:
         self.deselect_all_cards()
 
     def deselect_card_from_context(self, item_id):
-        if item_id in self.selected_source_ids:
-            frame = self.source_frames[item_id][0]
-            item = frame.item_data
-            original_color = self.card_original_colors.pop(
-                item_id, item.get("effective_color", "#ffffff")
+        if item_id not in self.selected_source_ids:
+            return
+        self.selected_source_ids.remove(item_id)
+        original_color = self.card_original_colors.pop(item_id, None)
+        if item_id in self.source_frames:
+            item = self.source_frames[item_id][0].item_data
+            self._remove_selection_style(
+                item_id, original_color or item.get("effective_color", "#ffffff"), item["type"]
             )
-            self._remove_selection_style(item_id, original_color, item["type"])
-            self.selected_source_ids.remove(item_id)
 
     
+    def _select_in_area(self, x1, y1, x2, y2, add=False):
+        """Markiert alle Karten, die das Rechteck schneiden (Strg: zur Auswahl hinzu)."""
+        if not add:
+            self.deselect_all_cards()
+        hits = self.spatial.query(x1, y1, x2, y2)
+        for item_id in hits:
+            if item_id in self.selected_source_ids:
+                continue
+            self.selected_source_ids.add(item_id)
+            if item_id in self.source_frames:
+                color = self.source_frames[item_id][0].item_data.get("effective_color")
+                self.card_original_colors[item_id] = color
+                self._apply_selection_style(item_id, color)
+        # Nicht materialisierte Treffer erhalten ihre Markierung beim Erzeugen
+        self._refresh_viewport()
+        logger.debug("Auswahlrechteck: %d Karte(n) markiert", len(hits))
+
     def on_card_press(self, event, item_id):
         self.handle_card_selection(item_id, event)
         if item_id in self.selected_source_ids:
@@ -1409,36 +1881,41 @@ class ProjectWindow:
             dx = (event.x_root - self.drag_start_x) / self.zoom_level
             dy = (event.y_root - self.drag_start_y) / self.zoom_level
             for item_id in self.selected_source_ids:
-                if item_id in self.source_frames:
-                    self.canvas.move(self.source_frames[item_id][1], dx, dy)
+                self.canvas.move(f"card_{item_id}", dx, dy)
             self.drag_start_x = event.x_root
             self.drag_start_y = event.y_root
 
     def on_card_release(self, event):
         if self.dragging_card:
+            moved = []
+            # Der Platzhalter wandert mit, auch für Karten ohne Widget
             for item_id in self.selected_source_ids:
-                if item_id in self.source_frames:
-                    coords = self.canvas.coords(self.source_frames[item_id][1])
-                    item = next(
-                        i for i in self.project["data"]["items"] if i["id"] == item_id
-                    )
-                    item["pos_x"] = coords[0]
-                    item["pos_y"] = coords[1]
-            self.save_project()
-            self.update_last_mtime()
+                shell = self.card_shells.get(item_id)
+                if shell is None:
+                    continue
+                coords = self.canvas.coords(shell)
+                if self.item_index.move(item_id, coords[0], coords[1]):
+                    moved.append(item_id)
+                    self._index_card(item_id, coords)
+            self.save_project(moved=moved)
             self.dragging_card = False
-            self.update_scrollregion()
-            self._update_minimap()
+            if moved:
+                self.update_scrollregion()
 
     def on_canvas_press(self, event):
         x, y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        if event.state & 0x1:
+            # Umschalt + Ziehen: Karten per Auswahlrechteck markieren
+            self._marquee = (x, y, self.canvas.create_rectangle(
+                x, y, x, y, outline="#0d6efd", dash=(4, 2), width=2,
+            ))
+            return
         search_radius = 2
-        items = self.canvas.find_overlapping(
+        # In der vereinfachten Ansicht verschiebt ein Klick auf eine Karte die Ansicht
+        if not self.lod_active and self.spatial.query(
             x - search_radius, y - search_radius,
             x + search_radius, y + search_radius,
-        )
-        card_items = [wid for _, wid in self.source_frames.values()]
-        if any(item in card_items for item in items):
+        ):
             return
         self.deselect_all_cards()
         self.dragging_canvas = True
@@ -1447,6 +1924,12 @@ class ProjectWindow:
         self.canvas.config(cursor="fleur")
 
     def on_canvas_motion(self, event):
+        if self._marquee is not None:
+            x0, y0, rect = self._marquee
+            self.canvas.coords(
+                rect, x0, y0, self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+            )
+            return
         if self.dragging_canvas:
             self.canvas.xview_scroll(
                 int(-1 * (event.x - self.canvas_start_x) / self.zoom_level), "units"
@@ -1459,6 +1942,15 @@ class ProjectWindow:
             self._update_minimap_viewport()
 
     def on_canvas_release(self, event):
+        if self._marquee is not None:
+            x0, y0, rect = self._marquee
+            self._marquee = None
+            self.canvas.delete(rect)
+            self._select_in_area(
+                x0, y0, self.canvas.canvasx(event.x), self.canvas.canvasy(event.y),
+                add=bool(event.state & 0x4),
+            )
+            return
         if self.dragging_canvas:
             self.dragging_canvas = False
             self.canvas.config(cursor="")
@@ -1473,6 +1965,10 @@ class ProjectWindow:
         if new_item["type"] == "source":
             new_item["added"] = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
             new_item.pop("effective_color", None)
+            # Eigene Liste, die Snapshot-Dateien selbst werden geteilt
+            new_item["saved_pages"] = [
+                dict(page) for page in original_item.get("saved_pages", [])
+            ]
         return new_item
 
     def duplicate_item(self, item):
@@ -1480,17 +1976,13 @@ class ProjectWindow:
         new_item = self._create_new_item_from_existing(
             item, self.paste_offset_x, self.paste_offset_y
         )
-        self.project["data"]["items"].append(new_item)
+        self.item_index.add(new_item)
         if new_item["type"] == "source":
-            threading.Thread(
-                target=self._concurrent_reload_single_card,
-                args=(new_item,), daemon=True,
-            ).start()
+            self.executor.submit(self._concurrent_reload_single_card, new_item)
         else:
             self._create_heading_card_gui(new_item)
         self.selected_source_ids.add(new_item["id"])
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[new_item["id"]])
         self.update_scrollregion()
         self.reset_zoom()
         self._update_minimap()
@@ -1500,8 +1992,9 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         original_items = [
-            next(i for i in self.project["data"]["items"] if i["id"] == item_id)
+            self.item_index.get(item_id)
             for item_id in list(self.selected_source_ids)
+            if item_id in self.item_index
         ]
         self.deselect_all_cards()
         new_ids = []
@@ -1510,13 +2003,15 @@ class ProjectWindow:
             new_item = self._create_new_item_from_existing(
                 original_item, self.paste_offset_x, self.paste_offset_y
             )
-            self.project["data"]["items"].append(new_item)
+            self.item_index.add(new_item)
             items_to_process.append(new_item)
             new_ids.append(new_item["id"])
         self.selected_source_ids.update(new_ids)
-        self._concurrent_load_worker(items_to_process)
-        self.save_project()
-        self.update_last_mtime()
+        # Nur Platzhalter ergänzen; die übrigen Karten bleiben unberührt
+        for new_item in items_to_process:
+            self._ensure_shell(new_item)
+        self._refresh_viewport()
+        self.save_project(put=new_ids)
         self.update_scrollregion()
         self.reset_zoom()
         self._update_minimap()
@@ -1537,20 +2032,16 @@ class ProjectWindow:
         new_item = self._create_new_item_from_existing(
             self.clipboard, self.paste_offset_x, self.paste_offset_y
         )
-        self.project["data"]["items"].append(new_item)
+        self.item_index.add(new_item)
         if new_item["type"] == "source":
-            threading.Thread(
-                target=self._concurrent_reload_single_card,
-                args=(new_item,), daemon=True,
-            ).start()
+            self.executor.submit(self._concurrent_reload_single_card, new_item)
         else:
             self._create_heading_card_gui(new_item)
         self.deselect_all_cards()
         self.selected_source_ids.add(new_item["id"])
         self.paste_offset_x = (self.paste_offset_x + 20 - 50) % 51 + 50
         self.paste_offset_y = (self.paste_offset_y + 20 - 50) % 51 + 50
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[new_item["id"]])
         self.update_scrollregion()
         self.reset_zoom()
         self._update_minimap()
@@ -1586,16 +2077,6 @@ class ProjectWindow:
         self.reload_items()
         logger.debug("Manueller Reload — Projekt: %s", self.project["name"])
 
-    def update_last_mtime(self):
-        try:
-            if os.path.exists(self.project["data_file"]):
-                self.last_file_mtime = os.path.getmtime(self.project["data_file"])
-            else:
-                self.last_file_mtime = 0
-        except OSError as exc:
-            logger.debug("mtime konnte nicht gelesen werden: %s", exc)
-            self.last_file_mtime = 0
-
     
     def show_saved_pages_popup(self, item=None):
         popup = tk.Toplevel(self.root)
@@ -1663,7 +2144,13 @@ class ProjectWindow:
                 return
             full_path = sites_dir / filename
             if full_path.exists():
-                webbrowser.open(full_path.absolute().as_uri())
+                try:
+                    target = browser_path(full_path)
+                except (OSError, EOFError) as exc:
+                    logger.error("Snapshot nicht lesbar (%s): %s", full_path, exc)
+                    messagebox.showerror("Fehler", f"Datei nicht lesbar:\n{full_path}")
+                    return
+                webbrowser.open(target.absolute().as_uri())
             else:
                 logger.warning("Gespeicherte Seite nicht gefunden: %s", full_path)
                 messagebox.showerror("Fehler", f"Datei nicht gefunden:\n{full_path}")
@@ -1688,15 +2175,16 @@ class ProjectWindow:
                 full_path = sites_dir / filename
                 if (not display_title or display_title == "Unbekannter Titel") and full_path.exists():
                     try:
-                        with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                            soup = BeautifulSoup(f.read(), "html.parser")
-                            display_title = (
-                                soup.title.string.strip() if soup.title else filename
-                            )
+                        soup = BeautifulSoup(read_snapshot_bytes(full_path), "html.parser")
+                        display_title = (
+                            soup.title.string.strip() if soup.title else filename
+                        )
                     except Exception as exc:
                         logger.debug("Titel aus HTML nicht lesbar: %s", exc)
                         display_title = filename
                 final_text = f"{timestamp} – {display_title or filename}"
+                if page.get("unchanged"):
+                    final_text = f"{timestamp} – geprüft, unverändert"
                 lbl = ttk.Label(row, text=f"• {final_text}", wraplength=500, cursor="hand2")
                 lbl.pack(side="left", padx=5, fill="x", expand=True)
                 lbl.bind("<Button-1>", lambda e, p=page: open_saved_page(p))
@@ -1721,14 +2209,20 @@ class ProjectWindow:
             ):
                 page_to_del = pages[idx]
                 file_to_del = sites_dir / page_to_del.get("file", "")
-                if file_to_del.exists():
+                # Snapshots sind inhaltsadressiert und können mehrfach referenziert sein
+                shared = snapshot_refs(self.project["data"])[page_to_del.get("file")] > 1
+                if page_to_del.get("file") and not shared and file_to_del.exists():
                     try:
-                        os.remove(file_to_del)
+                        with get_size_ledger().tracking(file_to_del):
+                            os.remove(file_to_del)
                         logger.debug("Gespeicherte Seite gelöscht: %s", file_to_del.name)
                     except OSError as exc:
                         logger.warning("Datei konnte nicht gelöscht werden: %s", exc)
                 pages.pop(idx)
-                self.app.project_manager.save_specific_project_data(self.project)
+                if item and isinstance(item, dict):
+                    self.save_project(put=[item["id"]])
+                else:
+                    self.save_project()
                 refresh_list()
 
         popup.bind("<Delete>", lambda e: delete_entry())
@@ -1738,144 +2232,24 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item:
             self.show_saved_pages_popup(item)
 
     
     def reload_current_page(self, source):
-        threading.Thread(
-            target=self._reload_worker, args=(source,), daemon=True
-        ).start()
+        self.app.reload_source(self.project, source)
 
     def reload_current_page_shortcut(self):
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item:
             self.reload_current_page(item)
 
-    def _reload_worker(self, source):
-        url = source["url"]
-        logger.info("Seite neu laden — url=%s", url)
-        sites_dir = Path(self.project["path"]) / "sites"
-        images_dir = Path(self.project["path"]) / "images"
-        sites_dir.mkdir(exist_ok=True)
-        images_dir.mkdir(exist_ok=True)
-        new_favicon_name = None
-
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/91.0.4472.124 Safari/537.36"
-            )
-        }
-
-        try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            html_content = response.text
-
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"page_{source['id']}_{timestamp}.html"
-            with open(sites_dir / filename, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            logger.debug("Seite gespeichert: %s", filename)
-
-            icon_url = None
-            base_url = "{uri.scheme}://{uri.netloc}".format(uri=urlparse(response.url))
-
-            try:
-                soup = BeautifulSoup(html_content, "html.parser")
-                icon_link = soup.find(
-                    "link",
-                    rel=lambda x: x
-                    and x.lower() in ["icon", "shortcut icon", "apple-touch-icon"],
-                )
-                if icon_link and icon_link.get("href"):
-                    icon_url = urljoin(base_url, icon_link.get("href"))
-            except Exception as exc:
-                logger.debug("Favicon-Link nicht gefunden: %s", exc)
-
-            if not icon_url:
-                icon_url = urljoin(base_url, "/favicon.ico")
-
-            fav_content = None
-            try:
-                fr = requests.get(icon_url, headers=headers, timeout=5)
-                if fr.status_code == 200 and len(fr.content) > 0:
-                    fav_content = fr.content
-            except requests.exceptions.RequestException as exc:
-                logger.debug("Favicon-Download fehlgeschlagen (%s): %s", icon_url, exc)
-
-            if not fav_content:
-                try:
-                    gr = requests.get(
-                        f"https://www.google.com/s2/favicons?domain={base_url}&sz=64",
-                        headers=headers, timeout=5,
-                    )
-                    if gr.status_code == 200:
-                        fav_content = gr.content
-                except requests.exceptions.RequestException as exc:
-                    logger.debug("Google-Favicon-Fallback fehlgeschlagen: %s", exc)
-
-            if fav_content:
-                ext = ".ico"
-                if b"PNG" in fav_content[:8]:
-                    ext = ".png"
-                elif b"JFIF" in fav_content[:10]:
-                    ext = ".jpg"
-                favicon_filename = f"favicon_{source['id']}_{timestamp}{ext}"
-                with open(images_dir / favicon_filename, "wb") as f:
-                    f.write(fav_content)
-                new_favicon_name = favicon_filename
-
-            self.root.after(
-                0, self._finalize_reload, source["id"], filename, timestamp, new_favicon_name
-            )
-
-        except requests.exceptions.Timeout:
-            logger.warning("Reload Timeout — url=%s", url)
-            self.root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "Fehler", f"Zeitüberschreitung beim Laden von:\n{url}", parent=self.root
-                ),
-            )
-        except requests.exceptions.HTTPError as exc:
-            logger.warning("Reload HTTP-Fehler — url=%s: %s", url, exc)
-            self.root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "Fehler", f"Seite nicht erreichbar:\n{exc}", parent=self.root
-                ),
-            )
-        except requests.exceptions.RequestException as exc:
-            logger.error("Reload fehlgeschlagen — url=%s: %s", url, exc)
-            self.root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "Fehler", f"Verbindungsfehler:\n{exc}", parent=self.root
-                ),
-            )
-        except OSError as exc:
-            logger.error("Reload IO-Fehler: %s", exc)
-
-    def _finalize_reload(self, source_id, filename, timestamp, new_favicon_name):
-        source = next(
-            (
-                item
-                for item in self.project["data"].get("items", [])
-                if item.get("id") == source_id and item.get("type") == "source"
-            ),
-            None,
-        )
+    def _finalize_reload(self, source_id, snapshot):
+        source = self.item_index.by_type["source"].get(source_id)
 
         if not source:
             logger.error("Quelle für Reload nicht gefunden: %s", source_id)
@@ -1886,31 +2260,70 @@ class ProjectWindow:
             )
             return
 
-        if "saved_pages" not in source:
-            source["saved_pages"] = []
-
-        source["saved_pages"].append(
-            {
-                "file": filename,
-                "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-            }
-        )
-
-        if new_favicon_name:
-            source["favicon"] = new_favicon_name
+        apply_snapshot(source, snapshot)
+        if snapshot["unchanged"]:
+            self.save_project(put=[source_id])
+            logger.info("Seite geprüft, unverändert: %s", source_id)
+            return
 
-        self.save_project()
+        self.save_project(put=[source_id])
         if source_id in self.source_frames:
-            frame, item_id_canvas = self.source_frames[source_id]
-            self.canvas.delete(item_id_canvas)
-            frame.destroy()
-            del self.source_frames[source_id]
-            del self.card_widgets[source_id]
-            threading.Thread(
-                target=self._concurrent_reload_single_card, args=(source,), daemon=True
-            ).start()
+            self._destroy_card(source_id, keep_shell=True)
+            self.executor.submit(self._concurrent_reload_single_card, source)
         logger.info("Seite aktualisiert: %s", source_id)
 
+    def refresh_all_sources(self):
+        if self.app.refresh_all_sources(self.project):
+            self.bulk_status_label.config(text="Aktualisiere …")
+
+    def show_bulk_progress(self, done, total):
+        if not self.shutting_down:
+            self.bulk_status_label.config(text=f"Aktualisiere {done}/{total}")
+
+    def _finalize_bulk_reload(self, results, total):
+        """Übernimmt alle Ergebnisse der Sammel-Aktualisierung in einem Durchgang.
+
+        ``results`` enthält nur die erfolgreichen der ``total`` Quellen.
+        """
+        if self.shutting_down:
+            return
+        by_id = self.item_index.by_type["source"]
+        updated = unchanged = 0
+        applied = []
+        changed_cards = []
+        for result in results:
+            source_id, snapshot = result["source_id"], result["snapshot"]
+            source = by_id.get(source_id)
+            if source is None:
+                continue
+            old_favicon = source.get("favicon")
+            apply_snapshot(source, snapshot)
+            applied.append(source_id)
+            if snapshot["unchanged"]:
+                unchanged += 1
+            else:
+                updated += 1
+            if source.get("favicon") != old_favicon and source_id in self.source_frames:
+                changed_cards.append(source)
+
+        self.save_project(put=applied)
+
+        # Nur Karten mit neuem Favicon neu aufbauen, danach einmal Canvas aktualisieren
+        for source in changed_cards:
+            self._destroy_card(source["id"], keep_shell=True)
+            result = self._process_item_data(source)
+            self._create_source_card_gui(source, result["favicon_path"])
+        if changed_cards:
+            self.update_scrollregion()
+            self._update_minimap()
+
+        failed = total - len(applied)
+        summary = f"{updated} neu, {unchanged} unverändert, {failed} Fehler"
+        self.bulk_status_label.config(text=summary)
+        logger.info("Sammel-Aktualisierung übernommen — %s", summary)
+        if self.app.project_manager.get_setting("show_prompts", True):
+            messagebox.showinfo("Aktualisiert", f"Quellen aktualisiert:\n{summary}", parent=self.root)
+
     def _concurrent_reload_single_card(self, source):
         try:
             result = self._process_item_data(source)
@@ -2031,14 +2444,9 @@ class ProjectWindow:
             return
         heading["text"] = dialog.result["text"]
         heading["color"] = dialog.result["color"]
-        frame, item_id = self.source_frames[heading["id"]]
-        self.canvas.delete(item_id)
-        frame.destroy()
-        del self.source_frames[heading["id"]]
-        del self.card_widgets[heading["id"]]
+        self._destroy_card(heading["id"], keep_shell=True)
         self._create_heading_card_gui(heading)
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[heading["id"]])
         self.reset_zoom()
         self._update_minimap()
         logger.debug("Überschrift bearbeitet: %s", heading["id"])
@@ -2049,14 +2457,9 @@ class ProjectWindow:
         )
         if new_text is not None and new_text != heading["text"]:
             heading["text"] = new_text
-            frame, item_id = self.source_frames[heading["id"]]
-            self.canvas.delete(item_id)
-            frame.destroy()
-            del self.source_frames[heading["id"]]
-            del self.card_widgets[heading["id"]]
+            self._destroy_card(heading["id"], keep_shell=True)
             self._create_heading_card_gui(heading)
-            self.save_project()
-            self.update_last_mtime()
+            self.save_project(put=[heading["id"]])
             self.reset_zoom()
             self._update_minimap()
 
@@ -2069,14 +2472,9 @@ class ProjectWindow:
             color = color_result[1]
             if color != heading.get("color", ""):
                 heading["color"] = "" if color == self.DEFAULT_HEADING_BG else color
-                frame, item_id = self.source_frames[heading["id"]]
-                self.canvas.delete(item_id)
-                frame.destroy()
-                del self.source_frames[heading["id"]]
-                del self.card_widgets[heading["id"]]
+                self._destroy_card(heading["id"], keep_shell=True)
                 self._create_heading_card_gui(heading)
-                self.save_project()
-                self.update_last_mtime()
+                self.save_project(put=[heading["id"]])
                 self.reset_zoom()
                 self._update_minimap()
 
@@ -2090,26 +2488,16 @@ class ProjectWindow:
             self.delete_item(item_id)
 
     def delete_item(self, item_id):
-        item_to_delete = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item_to_delete = self.item_index.get(item_id)
         if not item_to_delete:
             logger.warning("Zu löschendes Element nicht gefunden: %s", item_id)
             return
-        self.project["data"]["items"] = [
-            i for i in self.project["data"]["items"] if i["id"] != item_id
-        ]
+        self.item_index.remove([item_id])
         self._garbage_collect_files([item_to_delete])
-        if item_id in self.source_frames:
-            frame, canvas_id = self.source_frames[item_id]
-            self.canvas.delete(canvas_id)
-            frame.destroy()
-            del self.source_frames[item_id]
-        if item_id in self.card_widgets:
-            del self.card_widgets[item_id]
+        self._destroy_card(item_id)
         if item_id in self.selected_source_ids:
             self.selected_source_ids.remove(item_id)
-        self.manual_save()
+        self.save_project(deleted=[item_id])
         self._update_minimap()
         logger.info("Element gelöscht: %s", item_id)
 
@@ -2120,28 +2508,13 @@ class ProjectWindow:
             "Löschen", f"{len(self.selected_source_ids)} Element(e) wirklich löschen?"
         ):
             return
-        items_to_remove = [
-            item
-            for item in self.project["data"]["items"]
-            if item["id"] in self.selected_source_ids
-        ]
-        self.project["data"]["items"] = [
-            item
-            for item in self.project["data"]["items"]
-            if item["id"] not in self.selected_source_ids
-        ]
+        items_to_remove = self.item_index.remove(self.selected_source_ids)
         self._garbage_collect_files(items_to_remove)
         for item_id in list(self.selected_source_ids):
-            if item_id in self.source_frames:
-                frame, canvas_id = self.source_frames[item_id]
-                self.canvas.delete(canvas_id)
-                frame.destroy()
-                del self.source_frames[item_id]
-            if item_id in self.card_widgets:
-                del self.card_widgets[item_id]
+            self._destroy_card(item_id)
         logger.info("%d Element(e) gelöscht", len(self.selected_source_ids))
         self.selected_source_ids.clear()
-        self.manual_save()
+        self.save_project(deleted=[item["id"] for item in items_to_remove])
         self._update_minimap()
 
     def _garbage_collect_files(self, removed_items):
@@ -2150,6 +2523,29 @@ class ProjectWindow:
         sites_dir = project_path / "sites"
         files_dir = project_path / "files"
 
+        # Referenzzählung einmal über die verbleibenden Elemente
+        favicon_refs = Counter(
+            i["favicon"] for i in remaining_items if i.get("favicon")
+        )
+        file_refs = Counter(
+            i["filename"]
+            for i in remaining_items
+            if i.get("type") == "file" and i.get("filename")
+        )
+
+        # Snapshots: nur Dateien löschen, auf die kein verbleibender Eintrag zeigt
+        if sites_dir.exists():
+            release_snapshots(
+                sites_dir,
+                [
+                    page["file"]
+                    for item in removed_items
+                    for page in item.get("saved_pages", [])
+                    if page.get("file")
+                ],
+                snapshot_refs(self.project.get("data", {})),
+            )
+
         for item in removed_items:
             item_type = item.get("type")
             item_id = item.get("id")
@@ -2158,52 +2554,31 @@ class ProjectWindow:
 
             if item_type == "file":
                 filename = item.get("filename")
-                if filename and files_dir.exists():
-                    still_used = any(
-                        i.get("filename") == filename and i.get("type") == "file"
-                        for i in remaining_items
-                    )
-                    if not still_used:
-                        fp = files_dir / filename
-                        if fp.exists():
-                            try:
+                if filename and files_dir.exists() and not file_refs[filename]:
+                    fp = files_dir / filename
+                    if fp.exists():
+                        try:
+                            with get_size_ledger().tracking(fp):
                                 fp.unlink()
-                                logger.debug("GC: Datei gelöscht: %s", filename)
-                            except OSError as exc:
-                                logger.warning("GC: Datei konnte nicht gelöscht werden (%s): %s", filename, exc)
+                            logger.debug("GC: Datei gelöscht: %s", filename)
+                        except OSError as exc:
+                            logger.warning("GC: Datei konnte nicht gelöscht werden (%s): %s", filename, exc)
                 continue  # file type has no HTML snapshots or favicons
 
             if item_type == "heading":
                 continue
 
-            # source type: delete HTML snapshots
-            if sites_dir.exists():
-                pattern = f"page_{item_id}_*.html"
-                found_files = list(sites_dir.glob(pattern))
-                if not found_files:
-                    logger.debug("GC: Keine HTML-Dateien für Muster %s", pattern)
-                for html_file in found_files:
-                    try:
-                        html_file.unlink()
-                        logger.debug("GC: HTML gelöscht: %s", html_file.name)
-                    except OSError as exc:
-                        logger.warning("GC: HTML konnte nicht gelöscht werden (%s): %s", html_file.name, exc)
-
             favicon_name = item.get("favicon")
-            if favicon_name:
-                still_used = any(
-                    i.get("favicon") == favicon_name for i in remaining_items
-                )
-                if not still_used:
-                    fav_path = project_path / "images" / favicon_name
-                    if fav_path.exists():
-                        try:
+            if favicon_name and not favicon_refs[favicon_name]:
+                fav_path = project_path / "images" / favicon_name
+                if fav_path.exists():
+                    try:
+                        with get_size_ledger().tracking(fav_path):
                             fav_path.unlink()
-                            logger.debug("GC: Favicon gelöscht: %s", favicon_name)
-                        except OSError as exc:
-                            logger.warning("GC: Favicon konnte nicht gelöscht werden: %s", exc)
+                        logger.debug("GC: Favicon gelöscht: %s", favicon_name)
+                    except OSError as exc:
+                        logger.warning("GC: Favicon konnte nicht gelöscht werden: %s", exc)
 
-    
     def add_heading(self):
         dialog = HeadingDialog(self.root)
         if not dialog.result:
@@ -2213,12 +2588,11 @@ class ProjectWindow:
             "text": dialog.result["text"], "color": dialog.result["color"],
             "pos_x": 300, "pos_y": 300,
         }
-        self.project["data"]["items"].append(new_heading)
+        self.item_index.add(new_heading)
         self.deselect_all_cards()
         self._create_heading_card_gui(new_heading)
         self.selected_source_ids.add(new_heading["id"])
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[new_heading["id"]])
         self.update_scrollregion()
         self.reset_zoom()
         self._update_minimap()
@@ -2233,18 +2607,14 @@ class ProjectWindow:
                 "text": dialog.result["text"], "keywords": dialog.result["keywords"],
                 "color": dialog.result["color"],
                 "added": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-                "pos_x": 300 + len(self.project["data"]["items"]) * 80,
+                "pos_x": 300 + len(self.item_index) * 80,
                 "pos_y": 300, "favicon": "", "saved_pages": [],
             }
-            self.project["data"]["items"].append(new_source)
+            self.item_index.add(new_source)
             self.deselect_all_cards()
             self.selected_source_ids.add(new_source["id"])
-            threading.Thread(
-                target=self._concurrent_reload_single_card,
-                args=(new_source,), daemon=True,
-            ).start()
-            self.save_project()
-            self.update_last_mtime()
+            self.executor.submit(self._concurrent_reload_single_card, new_source)
+            self.save_project(put=[new_source["id"]])
             self.update_scrollregion()
             self.reset_zoom()
             self._update_minimap()
@@ -2261,16 +2631,9 @@ class ProjectWindow:
                 "color": dialog.result["color"],
             })
             item_id = source["id"]
-            frame, item_id_canvas = self.source_frames[item_id]
-            self.canvas.delete(item_id_canvas)
-            frame.destroy()
-            del self.source_frames[item_id]
-            del self.card_widgets[item_id]
-            threading.Thread(
-                target=self._concurrent_reload_single_card, args=(source,), daemon=True
-            ).start()
-            self.save_project()
-            self.update_last_mtime()
+            self._destroy_card(item_id, keep_shell=True)
+            self.executor.submit(self._concurrent_reload_single_card, source)
+            self.save_project(put=[item_id])
             self.update_scrollregion()
             self.reset_zoom()
             self._update_minimap()
@@ -2280,9 +2643,7 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item is None:
             return
         if item["type"] == "heading":
@@ -2295,9 +2656,7 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item is None:
             return
         if item.get("type") == "source" and item.get("url"):
@@ -2311,9 +2670,7 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item and item.get("type") in ("source", "file"):
             MarkdownReader(self.root, item, self.project["path"], self.app)
             logger.debug("Reader geöffnet für: %s", item_id)
@@ -2342,7 +2699,8 @@ class ProjectWindow:
             counter += 1
 
         try:
-            shutil.copy2(str(src), str(dest))
+            with get_size_ledger().tracking(dest):
+                shutil.copy2(str(src), str(dest))
         except OSError as exc:
             messagebox.showerror("Fehler", f"Datei konnte nicht kopiert werden:\n{exc}")
             logger.error("Datei-Copy fehlgeschlagen: %s", exc)
@@ -2353,7 +2711,8 @@ class ProjectWindow:
         if dialog.result is None:
             # User cancelled – remove the copied file
             try:
-                dest.unlink()
+                with get_size_ledger().tracking(dest):
+                    dest.unlink()
             except OSError:
                 pass
             return
@@ -2367,15 +2726,14 @@ class ProjectWindow:
             "keywords": dialog.result.get("keywords", ""),
             "color": dialog.result.get("color", "#e8f4fd"),
             "added": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-            "pos_x": 300 + len(self.project["data"]["items"]) * 30 % 400,
+            "pos_x": 300 + len(self.item_index) * 30 % 400,
             "pos_y": 300,
         }
-        self.project["data"]["items"].append(new_file_item)
+        self.item_index.add(new_file_item)
         self.deselect_all_cards()
         self._create_file_card_gui(new_file_item)
         self.selected_source_ids.add(new_file_item["id"])
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[new_file_item["id"]])
         self.update_scrollregion()
         self.reset_zoom()
         self._update_minimap()
@@ -2393,14 +2751,9 @@ class ProjectWindow:
             "color": dialog.result.get("color", item.get("color", "#e8f4fd")),
         })
         item_id = item["id"]
-        frame, canvas_id = self.source_frames[item_id]
-        self.canvas.delete(canvas_id)
-        frame.destroy()
-        del self.source_frames[item_id]
-        del self.card_widgets[item_id]
+        self._destroy_card(item_id, keep_shell=True)
         self._create_file_card_gui(item)
-        self.save_project()
-        self.update_last_mtime()
+        self.save_project(put=[item_id])
         self._update_minimap()
         logger.debug("Datei-Karte bearbeitet: %s", item_id)
 
@@ -2503,19 +2856,17 @@ class ProjectWindow:
         frame.bind("<B1-Motion>", lambda e: self.on_card_motion(e))
         frame.bind("<ButtonRelease-1>", lambda e: self.on_card_release(e))
 
-        x, y = item.get("pos_x", 300), item.get("pos_y", 300)
-        window_id = self.canvas.create_window(x, y, window=frame, anchor="nw")
-        self.source_frames[item_id] = (frame, window_id)
+        self._place_card_window(item, frame)
 
         if self.selected_source_id == item_id:
             self.selected_source_ids.add(item_id)
+            self.selected_source_id = None
+        if item_id in self.selected_source_ids:
             self.card_original_colors[item_id] = color
             self._apply_selection_style(item_id, color)
-            self.selected_source_id = None
 
         if self.zoom_level != 1.0:
-            self.canvas.scale(window_id, x, y, self.zoom_level, self.zoom_level)
-            self._update_card_content_scale()
+            self._update_card_content_scale([item_id])
 
     def _open_file(self, item):
         """Öffnet eine Datei-Karte mit dem Standard-Programm."""
@@ -2574,9 +2925,7 @@ class ProjectWindow:
         if not self.selected_source_ids:
             return
         item_id = next(iter(self.selected_source_ids))
-        item = next(
-            (i for i in self.project["data"]["items"] if i["id"] == item_id), None
-        )
+        item = self.item_index.get(item_id)
         if item:
             self.create_citation(item)
 
@@ -2594,118 +2943,115 @@ class ProjectWindow:
             self.canvas.configure(scrollregion=(-500, -500, 1000, 1000))
         self._update_minimap()
 
-    def handle_external_data(self, data):
-        threading.Thread(
-            target=self._download_and_add_worker, args=(data,), daemon=True
-        ).start()
-
-    def _download_and_add_worker(self, data):
-        url = data["url"]
-        source_id = str(uuid.uuid4())
-        logger.info("Externe Quelle wird geladen — url=%s", url)
-        new_source = {
-            "id": source_id, "type": "source", "url": url,
-            "title": data.get("title", url), "text": data.get("text", ""),
-            "keywords": data.get("keywords", ""), "color": "#ffffff",
-            "added": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-            "pos_x": 300, "pos_y": 300, "favicon": "", "saved_pages": [],
-        }
-
-        project_dir = Path(self.project["path"])
-        images_dir = project_dir / "images"
-        sites_dir = project_dir / "sites"
-        images_dir.mkdir(exist_ok=True)
-        sites_dir.mkdir(exist_ok=True)
-
-        try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                html_content = response.text
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                html_filename = f"page_{source_id}_{timestamp}.html"
-                with open(sites_dir / html_filename, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                new_source["saved_pages"].append(
-                    {
-                        "file": html_filename,
-                        "timestamp": datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-                    }
-                )
-                try:
-                    parsed_uri = urlparse(url)
-                    base_url = f"{parsed_uri.scheme}://{parsed_uri.netloc}"
-                    fav_resp = requests.get(
-                        urljoin(base_url, "/favicon.ico"), timeout=5
-                    )
-                    if fav_resp.status_code == 200 and fav_resp.content:
-                        fav_name = f"favicon_{source_id}.ico"
-                        with open(images_dir / fav_name, "wb") as f:
-                            f.write(fav_resp.content)
-                        new_source["favicon"] = fav_name
-                except requests.exceptions.RequestException as exc:
-                    logger.debug("Favicon für externe Quelle nicht geladen: %s", exc)
-        except requests.exceptions.RequestException as exc:
-            logger.error("Externe Quelle konnte nicht geladen werden (%s): %s", url, exc)
-        except OSError as exc:
-            logger.error("IO-Fehler beim Speichern der externen Quelle: %s", exc)
-
-        self.root.after(0, lambda: self._add_external_source_to_gui(new_source))
-
     def _add_external_source_to_gui(self, new_source):
-        self.project["data"]["items"].append(new_source)
-        offset = len(self.project["data"]["items"]) * 20
-        new_source["pos_x"] = 300 + (offset % 500)
-        new_source["pos_y"] = 300 + (offset // 500) * 100
+        self.item_index.add(new_source)
+        offset = len(self.item_index) * 20
+        self.item_index.move(
+            new_source["id"], 300 + (offset % 500), 300 + (offset // 500) * 100
+        )
         self.deselect_all_cards()
         self.selected_source_ids.add(new_source["id"])
-        threading.Thread(
-            target=self._concurrent_reload_single_card,
-            args=(new_source,), daemon=True,
-        ).start()
-        self.save_project()
-        self.update_last_mtime()
+        self.executor.submit(self._concurrent_reload_single_card, new_source)
+        self.save_project(put=[new_source["id"]])
         self.update_scrollregion()
         logger.info("Externe Quelle hinzugefügt: %s", new_source["url"])
 
-    def save_project(self):
-        self.project["data"]["canvas_zoom_level"] = self.zoom_level
-        self.project["data"]["selected_source_id"] = (
+    def add_external_sources(self, new_sources):
+        """Fügt mehrere bereits geladene Quellen mit einem einzigen Speichervorgang hinzu.
+
+        Es entstehen nur Platzhalter; Widgets baut ``_refresh_viewport`` für die
+        sichtbaren Karten. Die Auswahl bleibt unverändert.
+        """
+        if self.shutting_down or not new_sources:
+            return
+        for source in new_sources:
+            self.item_index.add(source)
+            offset = len(self.item_index) * 20
+            self.item_index.move(
+                source["id"], 300 + (offset % 500), 300 + (offset // 500) * 100
+            )
+            self._ensure_shell(source)
+        self.save_project(put=[source["id"] for source in new_sources])
+        self.update_scrollregion()
+        self._refresh_viewport()
+        logger.info("%d externe Quelle(n) hinzugefügt", len(new_sources))
+
+    def save_project(self, put=None, moved=None, deleted=None):
+        """Plant das Speichern ein.
+
+        ``put``, ``moved`` und ``deleted`` sind die Ids der geänderten Elemente;
+        daraus entstehen direkt die Journal-Operationen. Ohne Angaben (manuelles
+        Speichern) vergleicht der ProjectWriter ein Abbild aller Daten.
+        """
+        data = self.project["data"]
+        data["canvas_zoom_level"] = self.zoom_level
+        data["selected_source_id"] = (
             next(iter(self.selected_source_ids)) if self.selected_source_ids else None
         )
-        self.app.project_manager.save_specific_project_data(self.project)
-
-    def start_auto_refresh(self):
-        try:
-            if self.shutting_down:
-                return
-            if self.dragging_card or self.dragging_canvas:
-                self.root.after(3000, self.start_auto_refresh)
-                return
+        ops = None
+        if put is not None or moved is not None or deleted is not None:
+            ops = [delete_op(item_id) for item_id in deleted or ()]
+            ops += [put_op(self.item_index.get(i)) for i in put or () if i in self.item_index]
+            ops += [move_op(self.item_index.get(i)) for i in moved or () if i in self.item_index]
+            ops += [
+                meta_op(key, data[key]) for key in VIEW_KEYS
+                if self._saved_view.get(key) != data[key]
+            ]
+        self._saved_view = {key: data.get(key) for key in VIEW_KEYS}
+        self.app.project_manager.schedule_save(self.project, ops)
+        self._schedule_search_sync()
+
+    def start_file_watch(self):
+        """Überwacht project.json und Journal auf Änderungen von außerhalb."""
+        manager = self.app.project_manager
+        if manager.store is not None:
+            # SQLite: Änderungen laufen ausschließlich über den ProjectManager
+            return
+        self._seen_signature = manager.data_signature(self.project)
+        self.file_watcher = FileWatcher(
+            self.project["path"],
+            {Path(self.project["data_file"]).name, JOURNAL_NAME},
+            lambda changed: self.root.after(0, self._on_project_files_changed, changed),
+        )
+        self.file_watcher.start()
 
-            current_mtime = (
-                os.path.getmtime(self.project["data_file"])
-                if os.path.exists(self.project["data_file"])
-                else 0
-            )
-            if current_mtime > self.last_file_mtime:
-                logger.debug("Auto-Refresh ausgelöst — Datei hat sich geändert")
-                self.reload_items()
-                self.last_file_mtime = current_mtime
-        except OSError as exc:
-            logger.debug("Auto-Refresh mtime-Fehler: %s", exc)
-        except Exception as exc:
-            logger.warning("Auto-Refresh Fehler: %s", exc)
+    def stop_file_watch(self):
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
 
-        if not self.shutting_down:
-            self.root.after(3000, self.start_auto_refresh)
+    def _on_project_files_changed(self, changed):
+        if self.shutting_down:
+            return
+        if self.dragging_card or self.dragging_canvas:
+            self.root.after(500, self._on_project_files_changed, changed)
+            return
+        manager = self.app.project_manager
+        signature = manager.data_signature(self.project)
+        # Eigene Schreibvorgänge des ProjectWriters nicht als externe Änderung werten
+        if signature == self._seen_signature or manager.is_own_write(self.project):
+            self._seen_signature = signature
+            return
+        logger.debug("Externe Änderung erkannt (%s) — lade neu", ", ".join(sorted(changed)))
+        self._seen_signature = signature
+        self.reload_items()
 
     def reload_items(self):
         try:
-            with open(self.project["data_file"], "r", encoding="utf-8") as f:
-                updated_data = json.load(f)
-            self.zoom_level = updated_data.get("canvas_zoom_level", 1.0)
+            updated_data = self.app.project_manager.read_project_data(self.project)
+            self.app.project_manager.adopt_external(self.project, updated_data)
+            zoom_level = updated_data.get("canvas_zoom_level", 1.0)
             items = updated_data.get("items", [])
+            if zoom_level == self.zoom_level and self.card_shells:
+                self._reconcile_cards(items)
+                self._schedule_search_sync()
+                logger.debug("Projekt abgeglichen: %d Element(e)", len(items))
+                return
+            self.zoom_level = zoom_level
+            self.lod_active = self.zoom_level < self.lod_threshold
             self.project["data"]["items"] = items
+            self.item_index.rebuild(items)
+            self._schedule_search_sync()
             self.project["data"]["canvas_zoom_level"] = self.zoom_level
             self.selected_source_id = updated_data.get("selected_source_id")
             self.load_items_on_canvas()
@@ -2717,7 +3063,11 @@ class ProjectWindow:
 
     def back_to_projects(self):
         self.shutting_down = True
-        self.save_project()
+        if self._search_sync_job is not None:
+            self.root.after_cancel(self._search_sync_job)
+        self.stop_file_watch()
+        self.save_project(put=())
+        self.page_index.close()
         self.executor.shutdown(wait=False)
         self.main_frame.destroy()
         self.app.close_project()
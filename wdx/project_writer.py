@@ -0,0 +1,121 @@
+import threading
+import time
+
+from constants import PROJECT_WRITE_DELAY, PROJECT_WRITE_MAX_DELAY
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProjectWriter:
+    """Hintergrund-Thread, der geänderte Projekte gebündelt speichert.
+
+    ``mark_dirty`` merkt ein Projekt nur vor. Geschrieben wird, sobald es
+    ``delay`` Sekunden lang keine weitere Änderung gab, spätestens aber
+    ``max_delay`` Sekunden nach der ersten. Mehrere Änderungen dazwischen
+    ergeben einen einzigen Schreibvorgang. ``flush`` schreibt sofort (Schließen,
+    Export, Beenden).
+
+    Jede Änderung bringt ihre Daten mit: entweder ein JSON-Abbild der
+    Projektdaten (``str``) oder eine Liste von Journal-Operationen. Ein Abbild
+    ersetzt alle davor vorgemerkten Änderungen. ``write(project, changes)``
+    bekommt die Änderungen in Reihenfolge und liest ``project["data"]`` nicht.
+    """
+
+    def __init__(self, write, delay=PROJECT_WRITE_DELAY, max_delay=PROJECT_WRITE_MAX_DELAY):
+        self._write = write
+        self.delay = delay
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._writing = set()
+        self._running = True
+        self._stats = {"flushes": 0, "last_ms": 0.0, "max_ms": 0.0, "last_wait_ms": 0.0}
+        self._thread = threading.Thread(
+            target=self._loop, name="wdx-project-writer", daemon=True
+        )
+        self._thread.start()
+
+    def mark_dirty(self, project, change):
+        now = time.monotonic()
+        with self._cond:
+            key = id(project)
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = {
+                    "project": project, "first": now, "last": now, "changes": [],
+                }
+            pending["last"] = now
+            if isinstance(change, str):
+                # Vollständiges Abbild: ältere Änderungen sind darin enthalten
+                pending["changes"] = [change]
+            else:
+                pending["changes"].append(change)
+            self._cond.notify()
+
+    def flush(self, project=None):
+        """Schreibt ausstehende Änderungen sofort, für ein Projekt oder alle."""
+        with self._cond:
+            keys = [id(project)] if project is not None else list(self._pending)
+            # Läuft gerade ein Schreibvorgang für das Projekt, darauf warten
+            while any(key in self._writing for key in keys):
+                self._cond.wait()
+            entries = [self._pending.pop(key) for key in keys if key in self._pending]
+            self._writing.update(id(entry["project"]) for entry in entries)
+        for entry in entries:
+            self._flush_entry(entry)
+
+    def shutdown(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=5)
+        self.flush()
+
+    def stats(self):
+        with self._cond:
+            return dict(self._stats, pending=len(self._pending))
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                entry = None
+                while self._running and entry is None:
+                    now = time.monotonic()
+                    timeout = None
+                    for key, pending in self._pending.items():
+                        if key in self._writing:
+                            continue
+                        due = min(pending["last"] + self.delay, pending["first"] + self.max_delay)
+                        if due <= now:
+                            entry = self._pending.pop(key)
+                            self._writing.add(key)
+                            break
+                        timeout = due - now if timeout is None else min(timeout, due - now)
+                    if entry is None:
+                        self._cond.wait(timeout)
+                if entry is None:
+                    return
+            self._flush_entry(entry)
+
+    def _flush_entry(self, entry):
+        project = entry["project"]
+        started = time.monotonic()
+        try:
+            self._write(project, entry["changes"])
+        except Exception as exc:
+            logger.exception("Projekt '%s' konnte nicht gespeichert werden: %s", project.get("name"), exc)
+        finished = time.monotonic()
+        write_ms = (finished - started) * 1000
+        wait_ms = (started - entry["first"]) * 1000
+        with self._cond:
+            self._writing.discard(id(project))
+            self._stats["flushes"] += 1
+            self._stats["last_ms"] = round(write_ms, 1)
+            self._stats["max_ms"] = round(max(self._stats["max_ms"], write_ms), 1)
+            self._stats["last_wait_ms"] = round(wait_ms, 1)
+            self._cond.notify_all()
+        logger.debug(
+            "Projekt '%s' gespeichert — %.1f ms Schreibzeit, %.0f ms nach erster Änderung",
+            project.get("name"), write_ms, wait_ms,
+        )
@@ -0,0 +1,188 @@
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+
+from size_ledger import get_size_ledger
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+SEARCH_INDEX_NAME = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+TOKEN_RE = re.compile(r"\w+")
+
+
+def fold(text):
+    """Kleinschreibung ohne diakritische Zeichen: „Größe“ → „grosse“, „café“ → „cafe“."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(fold(text or ""))
+
+
+def searchable_fields(item):
+    """``(alle Felder, nur Schlagwörter)`` eines Elements wie bei der bisherigen Suche."""
+    keywords = item.get("keywords", "") or ""
+    if item.get("type") == "heading":
+        return item.get("text", "") or "", keywords
+    return " ".join(
+        item.get(key, "") or "" for key in ("title", "text", "keywords")
+    ), keywords
+
+
+class SearchIndex:
+    """Invertierter Index über Titel, Text und Schlagwörter eines Projekts.
+
+    Pro Element werden die gefalteten Tokens zusammen mit einem Fingerabdruck der
+    Felder in ``search_index.json`` im Projektordner gespeichert; ``sync``
+    tokenisiert nur neue oder geänderte Elemente neu. Suchanfragen werden als
+    Präfixe über ein sortiertes Vokabular aufgelöst und die Trefferlisten der
+    einzelnen Wörter geschnitten.
+    """
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._entries = {}
+        self._postings = {}
+        self._keyword_postings = {}
+        self._vocabulary = None
+        self._keyword_vocabulary = None
+        self._dirty = False
+        self.ready = False
+
+    def load(self):
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Suchindex nicht lesbar, wird neu aufgebaut: %s", exc)
+            return
+        if payload.get("version") != SEARCH_INDEX_VERSION:
+            return
+        with self._lock:
+            for item_id, entry in payload.get("items", {}).items():
+                self._link(item_id, entry)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(
+                {"version": SEARCH_INDEX_VERSION, "items": self._entries},
+                ensure_ascii=False, separators=(",", ":"),
+            )
+            self._dirty = False
+        tmp_file = self.index_file.with_suffix(".tmp")
+        try:
+            with get_size_ledger().tracking(self.index_file, tmp_file):
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.index_file)
+        except OSError as exc:
+            logger.error("Suchindex konnte nicht gespeichert werden: %s", exc)
+
+    @staticmethod
+    def _fingerprint(fields):
+        return hashlib.blake2b("\0".join(fields).encode("utf-8"), digest_size=8).hexdigest()
+
+    def _link(self, item_id, entry):
+        self._entries[item_id] = entry
+        for token in entry["all"]:
+            self._postings.setdefault(token, set()).add(item_id)
+        for token in entry["kw"]:
+            self._keyword_postings.setdefault(token, set()).add(item_id)
+        self._vocabulary = self._keyword_vocabulary = None
+
+    def _unlink(self, item_id):
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+        for postings, tokens in (
+            (self._postings, entry["all"]), (self._keyword_postings, entry["kw"]),
+        ):
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is not None:
+                    ids.discard(item_id)
+                    if not ids:
+                        del postings[token]
+        self._vocabulary = self._keyword_vocabulary = None
+
+    def sync(self, items):
+        """Gleicht den Index mit der Elementliste ab; gibt die Zahl der Änderungen zurück."""
+        with self._sync_lock:
+            return self._sync(items)
+
+    def _sync(self, items):
+        changed = {}
+        seen = set()
+        with self._lock:
+            known = {item_id: entry["fp"] for item_id, entry in self._entries.items()}
+        for item in items:
+            item_id = item.get("id")
+            seen.add(item_id)
+            fields = searchable_fields(item)
+            fp = self._fingerprint(fields)
+            if known.get(item_id) != fp:
+                changed[item_id] = {
+                    "fp": fp,
+                    "all": sorted(set(tokenize(fields[0]))),
+                    "kw": sorted(set(tokenize(fields[1]))),
+                }
+        removed = [item_id for item_id in known if item_id not in seen]
+        with self._lock:
+            for item_id in removed:
+                self._unlink(item_id)
+            for item_id, entry in changed.items():
+                self._unlink(item_id)
+                self._link(item_id, entry)
+            if changed or removed:
+                self._dirty = True
+            self.ready = True
+        return len(changed) + len(removed)
+
+    def _matches(self, postings, vocabulary, prefix):
+        ids = set()
+        start = bisect.bisect_left(vocabulary, prefix)
+        for token in vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            ids |= postings[token]
+        return ids
+
+    def search(self, query, only_keywords=False):
+        """Ids aller Elemente, in denen jedes Wort der Anfrage als Wortanfang vorkommt.
+
+        ``None``, solange der Index nicht aufgebaut ist oder die Anfrage keine
+        Wortzeichen enthält — der Aufrufer durchsucht dann die Felder direkt.
+        """
+        tokens = tokenize(query)
+        if not tokens or not self.ready:
+            return None
+        with self._lock:
+            if only_keywords:
+                if self._keyword_vocabulary is None:
+                    self._keyword_vocabulary = sorted(self._keyword_postings)
+                postings, vocabulary = self._keyword_postings, self._keyword_vocabulary
+            else:
+                if self._vocabulary is None:
+                    self._vocabulary = sorted(self._postings)
+                postings, vocabulary = self._postings, self._vocabulary
+            result = None
+            # Längste Wörter zuerst: kleinste Trefferlisten, frühester Abbruch
+            for token in sorted(set(tokens), key=len, reverse=True):
+                ids = self._matches(postings, vocabulary, token)
+                result = ids if result is None else result & ids
+                if not result:
+                    return set()
+            return result
@@ -1,20 +1,127 @@
 import threading
 import http.server
-import socketserver
+import socket
 import json
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 
-from constants import PORT
+from constants import (
+    PORT,
+    SERVER_MAX_CONNECTIONS,
+    SERVER_KEEPALIVE_TIMEOUT,
+    SERVER_MAX_BODY_SIZE,
+)
 from wdx_logger import get_logger
 
 logger = get_logger(__name__)
 
+SOURCE_TEXT_FIELDS = ("title", "text", "keywords", "author", "date")
+
+
+def validate_source(entry):
+    """Prüft einen einzelnen Quellen-Datensatz und gibt eine Fehlermeldung oder None zurück."""
+    if not isinstance(entry, dict):
+        return "Eintrag ist kein Objekt"
+    url = entry.get("url")
+    if not isinstance(url, str) or not url.strip():
+        return "URL fehlt"
+    for field in SOURCE_TEXT_FIELDS:
+        value = entry.get(field)
+        if value is not None and not isinstance(value, str):
+            return f"Feld '{field}' ist kein Text"
+    return None
+
+
+def parse_sources_payload(post_data, content_type=""):
+    """Liest ein JSON-Array, {"sources": [...]} oder NDJSON und trennt gültige von ungültigen Einträgen."""
+    def ndjson_entries():
+        return [json.loads(line) for line in post_data.splitlines() if line.strip()]
+
+    if "ndjson" in content_type:
+        entries = ndjson_entries()
+    else:
+        try:
+            payload = json.loads(post_data)
+        except json.JSONDecodeError:
+            if "\n" not in post_data.strip():
+                raise
+            payload = ndjson_entries()
+        if isinstance(payload, dict) and "sources" in payload:
+            payload = payload["sources"]
+        elif isinstance(payload, dict):
+            payload = [payload]
+        if not isinstance(payload, list):
+            raise ValueError("Erwartet wird eine Liste von Quellen")
+        entries = payload
+
+    sources, rejected = [], []
+    for index, entry in enumerate(entries):
+        error = validate_source(entry)
+        if error:
+            rejected.append({"index": index, "message": error})
+        else:
+            sources.append(entry)
+    return sources, rejected
+
 
 class WdxHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = SERVER_KEEPALIVE_TIMEOUT
+
     def __init__(self, *args, app=None, **kwargs):
         self.app = app
         super().__init__(*args, **kwargs)
 
+    def _send_empty(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        """Liest den Request-Body (Content-Length oder chunked). None nach gesendeter Fehlerantwort."""
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            chunks, total = [], 0
+            while True:
+                size_line = self.rfile.readline(65537)
+                try:
+                    size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                except ValueError:
+                    self.close_connection = True
+                    self._send_empty(400)
+                    return None
+                if size == 0:
+                    # Trailer bis zur Leerzeile verwerfen
+                    while self.rfile.readline(65537).strip():
+                        pass
+                    break
+                total += size
+                if total > SERVER_MAX_BODY_SIZE:
+                    self.close_connection = True
+                    self._send_empty(413)
+                    return None
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline(3)
+            return b"".join(chunks)
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0 or content_length > SERVER_MAX_BODY_SIZE:
+            logger.warning("POST %s mit ungültiger Länge abgelehnt: %s", self.path, content_length)
+            self.close_connection = True
+            self._send_empty(413 if content_length > 0 else 400)
+            return None
+        return self.rfile.read(content_length)
+
     def end_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, HEAD, OPTIONS")
@@ -22,50 +129,79 @@ class WdxHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         super().end_headers()
 
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.end_headers()
+        self._send_empty(200)
 
     def do_POST(self):
         if hasattr(self.app, "main_window"):
             self.app.root.after(0, self.app.main_window.set_browser_connected, True)
 
         if self.path == "/api/add_source":
-            content_length = int(self.headers.get("Content-Length", 0))
-
-            if content_length == 0:
+            raw = self._read_body()
+            if raw is None:
+                return
+            if not raw:
                 logger.warning("POST /api/add_source ohne Body empfangen")
-                self.send_response(400)
-                self.end_headers()
+                self._send_empty(400)
                 return
 
-            raw = self.rfile.read(content_length)
             try:
                 post_data = raw.decode("utf-8")
             except UnicodeDecodeError as exc:
                 logger.warning("POST-Body konnte nicht dekodiert werden: %s", exc)
-                self.send_response(400)
-                self.end_headers()
+                self._send_empty(400)
                 return
 
             try:
                 data = json.loads(post_data)
                 logger.debug("POST /api/add_source — url=%s", data.get("url", "?"))
                 self.app.root.after(0, lambda: self.app.handle_communication(data))
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(b'{"status": "success"}')
+                self._send_json(200, {"status": "success"})
 
             except json.JSONDecodeError as exc:
                 logger.warning("Ungültiges JSON in POST-Body: %s", exc)
-                self.send_response(400)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(b'{"status": "error", "message": "Invalid JSON"}')
+                self._send_json(400, {"status": "error", "message": "Invalid JSON"})
+        elif self.path == "/api/add_sources":
+            self._handle_add_sources()
         else:
             logger.debug("POST auf unbekannten Pfad: %s", self.path)
-            self.send_response(404)
-            self.end_headers()
+            # Body nicht gelesen — Verbindung kann nicht wiederverwendet werden
+            self.close_connection = True
+            self._send_empty(404)
+
+    def _handle_add_sources(self):
+        raw = self._read_body()
+        if raw is None:
+            return
+        try:
+            post_data = raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            logger.warning("Batch-Body konnte nicht dekodiert werden: %s", exc)
+            self._send_empty(400)
+            return
+
+        try:
+            sources, rejected = parse_sources_payload(
+                post_data, self.headers.get("Content-Type", "")
+            )
+        except (json.JSONDecodeError, ValueError) as exc:
+            logger.warning("Ungültiger Batch-Body: %s", exc)
+            self._send_json(400, {"status": "error", "message": "Invalid JSON"})
+            return
+
+        if not sources:
+            self._send_json(
+                400,
+                {"status": "error", "message": "No valid sources", "rejected": rejected},
+            )
+            return
+
+        logger.debug(
+            "POST /api/add_sources — %d gültig, %d abgelehnt", len(sources), len(rejected)
+        )
+        self.app.root.after(0, lambda: self.app.handle_batch_communication(sources))
+        self._send_json(
+            200, {"status": "success", "accepted": len(sources), "rejected": rejected}
+        )
 
     def do_GET(self):
         if hasattr(self.app, "main_window"):
@@ -74,17 +210,19 @@ class WdxHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         if self.path == "/api/status":
             current_project = getattr(self.app, "current_project_name", None)
             response = {"connected": True, "current_project": current_project}
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode("utf-8"))
+            scheduler = getattr(self.app, "download_scheduler", None)
+            if scheduler is not None:
+                response["downloads"] = scheduler.stats()
+            project_manager = getattr(self.app, "project_manager", None)
+            if project_manager is not None:
+                response["persistence"] = project_manager.writer.stats()
+            self._send_json(200, response)
         else:
             super().do_GET()
 
     def do_HEAD(self):
-        if self.path in ("/api/add_source", "/api/status"):
-            self.send_response(200)
-            self.end_headers()
+        if self.path in ("/api/add_source", "/api/add_sources", "/api/status"):
+            self._send_empty(200)
         else:
             super().do_HEAD()
 
@@ -92,9 +230,80 @@ class WdxHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         logger.debug("HTTP %s", fmt % args)
 
 
-class ReusableTCPServer(socketserver.TCPServer):
+class WdxHTTPServer(http.server.HTTPServer):
+    """HTTP-Server mit begrenztem Thread-Pool und Keep-Alive-Verbindungen."""
+
     allow_reuse_address = True
 
+    def __init__(self, server_address, handler_class, max_connections=SERVER_MAX_CONNECTIONS):
+        self.max_connections = max(1, int(max_connections))
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._active = set()
+        self._active_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_connections, thread_name_prefix="wdx-http"
+        )
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            logger.warning(
+                "Verbindungslimit erreicht (%d) — %s abgewiesen",
+                self.max_connections, client_address[0],
+            )
+            self._reject_busy(request)
+            return
+        with self._active_lock:
+            self._active.add(request)
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Executor bereits heruntergefahren
+            self._release(request)
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._release(request)
+
+    def _release(self, request):
+        with self._active_lock:
+            self._active.discard(request)
+        self._slots.release()
+
+    def _reject_busy(self, request):
+        try:
+            request.sendall(
+                b"HTTP/1.1 503 Service Unavailable\r\n"
+                b"Content-Length: 0\r\n"
+                b"Retry-After: 1\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+        except OSError as exc:
+            logger.debug("503-Antwort konnte nicht gesendet werden: %s", exc)
+        self.shutdown_request(request)
+
+    def handle_error(self, request, client_address):
+        logger.exception("Fehler bei Anfrage von %s", client_address[0])
+
+    def server_close(self):
+        super().server_close()
+        # Offene Keep-Alive-Verbindungen beenden, laufende Antworten dürfen fertig werden
+        with self._active_lock:
+            active = list(self._active)
+        for request in active:
+            try:
+                request.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("HTTP-Server beendet (%d offene Verbindung(en) geschlossen)", len(active))
+
 
 def start_server(app):
     def run_server():
@@ -102,9 +311,15 @@ def start_server(app):
             handler = lambda *args, **kwargs: WdxHTTPRequestHandler(
                 *args, app=app, **kwargs
             )
-            httpd = ReusableTCPServer(("", PORT), handler)
+            max_connections = app.project_manager.get_setting(
+                "server_max_connections", SERVER_MAX_CONNECTIONS
+            )
+            httpd = WdxHTTPServer(("", PORT), handler, max_connections=max_connections)
             app.httpd = httpd
-            logger.info("HTTP-Server gestartet auf Port %d", PORT)
+            logger.info(
+                "HTTP-Server gestartet auf Port %d (max. %d Verbindungen)",
+                PORT, httpd.max_connections,
+            )
             httpd.serve_forever()
         except OSError as exc:
             logger.critical("Server auf Port %d konnte nicht gestartet werden: %s", PORT, exc)
@@ -119,4 +334,12 @@ def start_server(app):
             logger.exception("Unerwarteter Server-Fehler: %s", exc)
 
     thread = threading.Thread(target=run_server, daemon=True)
-    thread.start()
\ No newline at end of file
+    thread.start()
+
+
+def stop_server(app):
+    httpd = getattr(app, "httpd", None)
+    if httpd is None:
+        return
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from constants import WDX_DIR, SIZE_LEDGER_FILE, SIZE_SCAN_INTERVAL
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def dir_size(path) -> int:
+    """Summiert rekursiv die Dateigrößen unter ``path`` (ohne Symlinks)."""
+    total_size = 0
+    try:
+        path_obj = Path(path)
+        if not path_obj.exists():
+            return 0
+        with os.scandir(path_obj) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat().st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        total_size += dir_size(entry.path)
+                except (PermissionError, OSError) as exc:
+                    logger.debug("Dateigröße nicht lesbar (%s): %s", entry.path, exc)
+    except Exception as exc:
+        logger.warning("Fehler bei Größenberechnung für %s: %s", path, exc)
+    return total_size
+
+
+def _file_size(path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+class SizeLedger:
+    """Laufend nachgeführte Projektgrößen, gespeichert in ``sizes.json``.
+
+    Schreib- und Löschvorgänge von wdx melden ihre Größenänderung über
+    ``tracking``; der Projektordner wird dafür nicht durchlaufen. ``reconcile``
+    gleicht veraltete Einträge gelegentlich per Verzeichnisscan im Hintergrund ab
+    (Änderungen von außerhalb, abgebrochene Schreibvorgänge).
+    """
+
+    def __init__(self, ledger_file=SIZE_LEDGER_FILE, root=WDX_DIR):
+        self.ledger_file = ledger_file
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        self._scanning = False
+        # Änderungen je Projekt, die während seines laufenden Scans gebucht wurden
+        self._scan_deltas = {}
+        self._load()
+
+    def _load(self):
+        if not self.ledger_file.exists():
+            return
+        try:
+            with open(self.ledger_file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Größen-Ledger nicht lesbar, wird neu aufgebaut: %s", exc)
+            self._entries = {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(self._entries, indent=4)
+            self._dirty = False
+        try:
+            self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.ledger_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_file, self.ledger_file)
+        except OSError as exc:
+            logger.error("Größen-Ledger konnte nicht gespeichert werden: %s", exc)
+
+    def size(self, name):
+        with self._lock:
+            entry = self._entries.get(name)
+            return entry["size"] if entry else None
+
+    def set(self, name, size, scanned=False):
+        with self._lock:
+            entry = self._entries.setdefault(name, {"size": 0, "scanned": 0})
+            entry["size"] = size
+            if scanned:
+                entry["scanned"] = time.time()
+            self._dirty = True
+
+    def adjust(self, name, delta):
+        if not name or not delta:
+            return
+        with self._lock:
+            if name in self._scan_deltas:
+                self._scan_deltas[name] += delta
+            entry = self._entries.get(name)
+            if entry is None:
+                # Unbekanntes Projekt: beim nächsten Abgleich gescannt
+                return
+            entry["size"] = max(0, entry["size"] + delta)
+            self._dirty = True
+
+    def rename(self, old_name, new_name):
+        with self._lock:
+            # Ergebnis eines laufenden Scans gehört zum alten Pfad und wird verworfen
+            self._scan_deltas.pop(old_name, None)
+            if old_name in self._entries:
+                self._entries[new_name] = self._entries.pop(old_name)
+                self._dirty = True
+
+    def remove(self, name):
+        with self._lock:
+            self._scan_deltas.pop(name, None)
+            if self._entries.pop(name, None) is not None:
+                self._dirty = True
+
+    def project_of(self, path):
+        try:
+            return Path(path).relative_to(self.root).parts[0]
+        except (ValueError, IndexError):
+            return None
+
+    @contextmanager
+    def tracking(self, *paths):
+        """Bucht die Größenänderung der Dateien in ``paths`` auf ihr Projekt."""
+        before = sum(_file_size(p) for p in paths)
+        try:
+            yield
+        finally:
+            after = sum(_file_size(p) for p in paths)
+            if after != before:
+                self.adjust(self.project_of(paths[0]), after - before)
+
+    def _store_scan(self, name, scanned_size):
+        """Übernimmt ein Scanergebnis samt der währenddessen gebuchten Änderungen.
+
+        Gibt zurück, ob sich die Größe dadurch geändert hat.
+        """
+        with self._lock:
+            if name not in self._scan_deltas:
+                # Während des Scans umbenannt oder entfernt
+                return False
+            size = max(0, scanned_size + self._scan_deltas.pop(name))
+            entry = self._entries.setdefault(name, {"size": 0, "scanned": 0})
+            changed = entry["size"] != size
+            entry["size"] = size
+            entry["scanned"] = time.time()
+            self._dirty = True
+            return changed
+
+    def reconcile(self, projects, max_age=SIZE_SCAN_INTERVAL, on_done=None):
+        """Scannt Projekte mit fehlendem oder veraltetem Eintrag im Hintergrund.
+
+        ``projects`` ist eine Liste von ``(name, pfad)``; ``on_done`` erhält die
+        Namen der Projekte, deren Größe sich geändert hat.
+        """
+        now = time.time()
+        with self._lock:
+            if self._scanning:
+                return False
+            stale = [
+                (name, path) for name, path in projects
+                if now - self._entries.get(name, {}).get("scanned", 0) >= max_age
+            ]
+            if not stale:
+                return False
+            self._scanning = True
+
+        def worker():
+            changed = []
+            try:
+                for name, path in stale:
+                    with self._lock:
+                        self._scan_deltas[name] = 0
+                    size = dir_size(path)
+                    if self._store_scan(name, size):
+                        changed.append(name)
+                self.save()
+                logger.info(
+                    "Größenabgleich: %d Projekt(e) gescannt, %d geändert",
+                    len(stale), len(changed),
+                )
+            finally:
+                with self._lock:
+                    self._scanning = False
+                    self._scan_deltas.clear()
+            if on_done is not None:
+                on_done(changed)
+
+        threading.Thread(target=worker, name="wdx-size-scan", daemon=True).start()
+        return True
+
+
+def get_size_ledger() -> SizeLedger:
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = SizeLedger()
+        return _ledger
@@ -0,0 +1,193 @@
+import gzip
+import hashlib
+import os
+import tempfile
+import uuid
+from collections import Counter
+from pathlib import Path
+
+from size_ledger import get_size_ledger
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+GZIP_SUFFIX = ".gz"
+GZIP_MAGIC = b"\x1f\x8b"
+PREVIEW_DIR = Path(tempfile.gettempdir()) / "wdx_snapshots"
+
+
+class SnapshotTooLarge(ValueError):
+    def __init__(self, max_bytes):
+        super().__init__(f"Seite größer als {max_bytes // (1024 * 1024)} MB")
+        self.max_bytes = max_bytes
+
+
+def store_snapshot_stream(sites_dir, chunks, compress=False, max_bytes=None):
+    """Schreibt einen Snapshot stückweise und legt ihn inhaltsadressiert ab.
+
+    Die Daten landen zunächst in einer Temp-Datei, der Hash wird nebenbei
+    berechnet. Überschreitet der Inhalt ``max_bytes``, wird ``SnapshotTooLarge``
+    ausgelöst. Gibt ``(dateiname, hash)`` zurück.
+    """
+    sites_dir = Path(sites_dir)
+    tmp_file = sites_dir / f"{uuid.uuid4().hex}.tmp"
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_file, "wb") as raw:
+            out = (
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0, filename="")
+                if compress else raw
+            )
+            try:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        raise SnapshotTooLarge(max_bytes)
+                    hasher.update(chunk)
+                    out.write(chunk)
+            finally:
+                if out is not raw:
+                    out.close()
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    digest = hasher.hexdigest()
+    for name in (f"{digest}.html", f"{digest}.html{GZIP_SUFFIX}"):
+        if (sites_dir / name).exists():
+            tmp_file.unlink(missing_ok=True)
+            return name, digest
+    filename = f"{digest}.html{GZIP_SUFFIX if compress else ''}"
+    with get_size_ledger().tracking(sites_dir / filename):
+        os.replace(tmp_file, sites_dir / filename)
+    return filename, digest
+
+
+def snapshot_refs(data) -> Counter:
+    """Zählt, wie viele ``saved_pages``-Einträge auf jede Snapshot-Datei zeigen."""
+    refs = Counter(p["file"] for p in data.get("saved_pages", []) if p.get("file"))
+    for item in data.get("items", []):
+        refs.update(p["file"] for p in item.get("saved_pages", []) if p.get("file"))
+    return refs
+
+
+def release_snapshots(sites_dir, files, refs):
+    """Löscht die Dateien aus ``files``, auf die ``refs`` keinen Verweis mehr zählt."""
+    removed = 0
+    for filename in set(files):
+        if refs[filename]:
+            continue
+        path = Path(sites_dir) / filename
+        if not path.exists():
+            continue
+        try:
+            with get_size_ledger().tracking(path):
+                path.unlink()
+            removed += 1
+            logger.debug("GC: Snapshot gelöscht: %s", filename)
+        except OSError as exc:
+            logger.warning("GC: Snapshot konnte nicht gelöscht werden (%s): %s", filename, exc)
+    return removed
+
+
+def read_snapshot_bytes(path) -> bytes:
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:2] == GZIP_MAGIC:
+        return gzip.decompress(data)
+    return data
+
+
+def read_snapshot(path) -> str:
+    """Liest einen Snapshot als Text, komprimiert oder nicht."""
+    return read_snapshot_bytes(path).decode("utf-8", errors="ignore")
+
+
+def browser_path(path) -> Path:
+    """Gibt einen vom Browser öffenbaren Pfad zurück.
+
+    Komprimierte Snapshots werden dafür in ein temporäres Verzeichnis entpackt.
+    """
+    path = Path(path)
+    if not path.name.endswith(GZIP_SUFFIX):
+        return path
+    PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+    target = PREVIEW_DIR / path.name[: -len(GZIP_SUFFIX)]
+    if not target.exists() or target.stat().st_mtime < path.stat().st_mtime:
+        with open(target, "wb") as f:
+            f.write(read_snapshot_bytes(path))
+    return target
+
+
+def compress_file(path, keep_original=False) -> tuple:
+    """Komprimiert eine ``.html``-Datei; gibt (neuer Name, gesparte Bytes) zurück.
+
+    Mit ``keep_original`` bleibt die unkomprimierte Datei liegen, bis die
+    Verweise darauf umgestellt sind.
+    """
+    path = Path(path)
+    target = path.with_name(path.name + GZIP_SUFFIX)
+    with open(path, "rb") as f:
+        raw = f.read()
+    tmp_file = target.with_name(target.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(gzip.compress(raw, compresslevel=6, mtime=0))
+    with get_size_ledger().tracking(path, target):
+        os.replace(tmp_file, target)
+        saved = len(raw) - target.stat().st_size
+        if not keep_original:
+            path.unlink()
+    return target.name, saved
+
+
+def compress_project_files(project_path):
+    """Komprimiert alle unkomprimierten Snapshots eines Projekts (nur Dateien).
+
+    Die Originale bleiben erhalten, bis ``rename_snapshot_refs`` die Verweise
+    umgestellt hat und diese gespeichert sind (``remove_originals``). Gibt
+    ``({alter_name: neuer_name}, gesparte_bytes)`` zurück.
+    """
+    sites_dir = Path(project_path) / "sites"
+    if not sites_dir.exists():
+        return {}, 0
+    renamed = {}
+    saved_total = 0
+    for html_file in sites_dir.glob("*.html"):
+        try:
+            new_name, saved = compress_file(html_file, keep_original=True)
+        except OSError as exc:
+            logger.warning("Snapshot nicht komprimierbar (%s): %s", html_file.name, exc)
+            continue
+        renamed[html_file.name] = new_name
+        saved_total += saved
+    logger.info(
+        "%d Snapshot(s) komprimiert, %d KB gespart (%s)",
+        len(renamed), saved_total // 1024, project_path,
+    )
+    return renamed, saved_total
+
+
+def rename_snapshot_refs(data, renamed):
+    """Stellt die ``saved_pages``-Einträge in ``data`` auf die neuen Namen um."""
+    pages = list(data.get("saved_pages", []))
+    for item in data.get("items", []):
+        pages.extend(item.get("saved_pages", []))
+    changed = 0
+    for page in pages:
+        if page.get("file") in renamed:
+            page["file"] = renamed[page["file"]]
+            changed += 1
+    return changed
+
+
+def remove_originals(project_path, renamed):
+    """Löscht die unkomprimierten Originale nach ``compress_project_files``."""
+    sites_dir = Path(project_path) / "sites"
+    for filename in renamed:
+        path = sites_dir / filename
+        try:
+            with get_size_ledger().tracking(path):
+                path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Original nicht löschbar (%s): %s", filename, exc)
@@ -0,0 +1,158 @@
+from collections import defaultdict
+from math import floor
+
+from constants import SPATIAL_CELL_SIZE
+
+
+class GridIndex:
+    """Uniformes Gitter über achsenparallele Rechtecke für Bereichs- und Punktabfragen.
+
+    Rechtecke werden in festen Weltkoordinaten abgelegt; ``transform`` bildet
+    ``canvas.scale`` nach, sodass ein Zoom nur die Abbildung Welt → Canvas
+    ändert statt alle Einträge. Alle öffentlichen Methoden arbeiten in
+    Canvas-Koordinaten.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = defaultdict(set)
+        self._boxes = {}
+        self._bounds = None
+        self.scale = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __contains__(self, key):
+        return key in self._boxes
+
+    def clear(self):
+        self._cells.clear()
+        self._boxes.clear()
+        self._bounds = None
+        self.scale = 1.0
+        self.offset_x = self.offset_y = 0.0
+
+    def transform(self, factor, x, y):
+        """Entspricht ``canvas.scale(..., x, y, factor, factor)``."""
+        self.scale *= factor
+        self.offset_x = (self.offset_x - x) * factor + x
+        self.offset_y = (self.offset_y - y) * factor + y
+
+    def _to_world(self, x1, y1, x2, y2):
+        s = self.scale
+        return (
+            (x1 - self.offset_x) / s, (y1 - self.offset_y) / s,
+            (x2 - self.offset_x) / s, (y2 - self.offset_y) / s,
+        )
+
+    def _to_canvas(self, box):
+        s = self.scale
+        return (
+            box[0] * s + self.offset_x, box[1] * s + self.offset_y,
+            box[2] * s + self.offset_x, box[3] * s + self.offset_y,
+        )
+
+    def _cell_range(self, box):
+        size = self.cell_size
+        return (
+            floor(box[0] / size), floor(box[1] / size),
+            floor(box[2] / size), floor(box[3] / size),
+        )
+
+    def set(self, key, x1, y1, x2, y2):
+        """Fügt ein Rechteck ein oder verschiebt es."""
+        old = self._unlink(key)
+        if old is not None and self._bounds is not None and self._on_edge(old):
+            self._bounds = None
+        box = self._to_world(x1, y1, x2, y2)
+        self._boxes[key] = box
+        cx1, cy1, cx2, cy2 = self._cell_range(box)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self._cells[(cx, cy)].add(key)
+        if self._bounds is not None:
+            b = self._bounds
+            self._bounds = (
+                min(b[0], box[0]), min(b[1], box[1]), max(b[2], box[2]), max(b[3], box[3])
+            )
+
+    def remove(self, key):
+        box = self._unlink(key)
+        if box is not None and self._bounds is not None and self._on_edge(box):
+            self._bounds = None
+
+    def _unlink(self, key):
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return None
+        cx1, cy1, cx2, cy2 = self._cell_range(box)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+        return box
+
+    def _on_edge(self, box):
+        # Nur Rechtecke am Rand bestimmen die Gesamtgrenzen
+        b = self._bounds
+        return box[0] <= b[0] or box[1] <= b[1] or box[2] >= b[2] or box[3] >= b[3]
+
+    def box(self, key):
+        box = self._boxes.get(key)
+        return self._to_canvas(box) if box is not None else None
+
+    def world_box(self, key):
+        """Rechteck in Weltkoordinaten (unabhängig von ``transform``)."""
+        return self._boxes.get(key)
+
+    def items(self):
+        """``(key, rechteck)`` aller Einträge in Canvas-Koordinaten."""
+        for key, box in self._boxes.items():
+            yield key, self._to_canvas(box)
+
+    def bounds(self):
+        """Umschließendes Rechteck aller Einträge oder ``None``."""
+        if not self._boxes:
+            return None
+        if self._bounds is None:
+            boxes = self._boxes.values()
+            self._bounds = (
+                min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes),
+            )
+        return self._to_canvas(self._bounds)
+
+    def query(self, x1, y1, x2, y2):
+        """Schlüssel aller Rechtecke, die den Bereich schneiden."""
+        area = self._to_world(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        cx1, cy1, cx2, cy2 = self._cell_range(area)
+        candidates = set()
+        if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > len(self._cells):
+            # Bereich größer als das belegte Gitter: nur belegte Zellen prüfen
+            for (cx, cy), keys in self._cells.items():
+                if cx1 <= cx <= cx2 and cy1 <= cy <= cy2:
+                    candidates |= keys
+        else:
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    keys = self._cells.get((cx, cy))
+                    if keys:
+                        candidates |= keys
+        return {
+            key for key in candidates
+            if self._intersects(self._boxes[key], area)
+        }
+
+    def at(self, x, y):
+        """Schlüssel aller Rechtecke, die den Punkt enthalten."""
+        return self.query(x, y, x, y)
+
+    @staticmethod
+    def _intersects(a, b):
+        return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
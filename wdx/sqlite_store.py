@@ -0,0 +1,218 @@
+import json
+import sqlite3
+import threading
+import time
+
+from constants import SQLITE_DB_FILE
+from wdx_logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    project TEXT NOT NULL,
+    id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    type TEXT,
+    pos_x NUMERIC,
+    pos_y NUMERIC,
+    data TEXT NOT NULL,
+    PRIMARY KEY (project, id)
+);
+CREATE INDEX IF NOT EXISTS items_by_seq ON items (project, seq);
+CREATE TABLE IF NOT EXISTS saved_pages (
+    project TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    file TEXT,
+    hash TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (project, item_id, seq)
+);
+CREATE INDEX IF NOT EXISTS saved_pages_by_file ON saved_pages (project, file);
+"""
+
+
+class SqliteProjectStore:
+    """SQLite-Ablage für Projektdaten als Alternative zu ``project.json``.
+
+    Elemente und gespeicherte Seiten liegen in eigenen Tabellen und
+    werden über die Journal-Operationen (``put``, ``move``, ``delete``, ``order``,
+    ``meta``) zeilenweise aktualisiert. ``load``/``replace`` wandeln vom und in das
+    bisherige JSON-Format, damit Import und Export unverändert funktionieren.
+    """
+
+    def __init__(self, db_file=SQLITE_DB_FILE):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._modified = {}
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def modified_at(self, name):
+        """Zeitpunkt der letzten Änderung eines Projekts durch diese Instanz."""
+        return self._modified.get(name, 0)
+
+    def has_project(self, name):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM projects WHERE name = ?", (name,)
+            ).fetchone()
+        return row is not None
+
+    def load(self, name):
+        """Setzt die Projektdaten im JSON-Format zusammen."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta FROM projects WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                return None
+            data = json.loads(row[0])
+            pages = {}
+            for item_id, page in self._conn.execute(
+                "SELECT item_id, data FROM saved_pages WHERE project = ? ORDER BY item_id, seq",
+                (name,),
+            ):
+                pages.setdefault(item_id, []).append(json.loads(page))
+            items = []
+            for item_id, pos_x, pos_y, item_data in self._conn.execute(
+                "SELECT id, pos_x, pos_y, data FROM items WHERE project = ? ORDER BY seq",
+                (name,),
+            ):
+                item = json.loads(item_data)
+                item["pos_x"], item["pos_y"] = pos_x, pos_y
+                if item_id in pages:
+                    item["saved_pages"] = pages[item_id]
+                items.append(item)
+        data["items"] = items
+        return data
+
+    def replace(self, name, data):
+        """Ersetzt ein Projekt vollständig (Import, Migration)."""
+        with self._lock, self._conn:
+            self._delete_rows(name)
+            self._conn.execute(
+                "INSERT INTO projects (name, meta) VALUES (?, ?)",
+                (name, json.dumps(self._meta_of(data), ensure_ascii=False)),
+            )
+            for seq, item in enumerate(data.get("items", [])):
+                self._put_item(name, item, seq)
+            self._modified[name] = time.time()
+
+    def apply(self, name, ops):
+        """Überträgt Journal-Operationen zeilenweise in einer Transaktion."""
+        with self._lock, self._conn:
+            for op in ops:
+                kind = op["op"]
+                if kind == "put":
+                    self._put_item(name, op["item"])
+                elif kind == "move":
+                    self._conn.execute(
+                        "UPDATE items SET pos_x = ?, pos_y = ? WHERE project = ? AND id = ?",
+                        (op["x"], op["y"], name, op["id"]),
+                    )
+                elif kind == "delete":
+                    for table, column in (("items", "id"), ("saved_pages", "item_id")):
+                        self._conn.execute(
+                            f"DELETE FROM {table} WHERE project = ? AND {column} = ?",
+                            (name, op["id"]),
+                        )
+                elif kind == "order":
+                    self._conn.executemany(
+                        "UPDATE items SET seq = ? WHERE project = ? AND id = ?",
+                        [(seq, name, item_id) for seq, item_id in enumerate(op["ids"])],
+                    )
+            meta_ops = [op for op in ops if op["op"] == "meta"]
+            if meta_ops:
+                row = self._conn.execute(
+                    "SELECT meta FROM projects WHERE name = ?", (name,)
+                ).fetchone()
+                meta = json.loads(row[0]) if row is not None else {}
+                for op in meta_ops:
+                    meta[op["key"]] = op["value"]
+                self._conn.execute(
+                    "UPDATE projects SET meta = ? WHERE name = ?",
+                    (json.dumps(meta, ensure_ascii=False), name),
+                )
+            self._modified[name] = time.time()
+
+    def rename(self, old_name, new_name, data):
+        with self._lock, self._conn:
+            for table, column in (
+                ("projects", "name"), ("items", "project"), ("saved_pages", "project"),
+            ):
+                self._conn.execute(
+                    f"UPDATE {table} SET {column} = ? WHERE {column} = ?",
+                    (new_name, old_name),
+                )
+            self._conn.execute(
+                "UPDATE projects SET meta = ? WHERE name = ?",
+                (json.dumps(self._meta_of(data), ensure_ascii=False), new_name),
+            )
+            self._modified[new_name] = time.time()
+            self._modified.pop(old_name, None)
+
+    def delete(self, name):
+        with self._lock, self._conn:
+            self._delete_rows(name)
+            self._modified.pop(name, None)
+
+    @staticmethod
+    def _meta_of(data):
+        return {key: value for key, value in data.items() if key != "items"}
+
+    def _delete_rows(self, name):
+        self._conn.execute("DELETE FROM projects WHERE name = ?", (name,))
+        for table in ("items", "saved_pages"):
+            self._conn.execute(f"DELETE FROM {table} WHERE project = ?", (name,))
+
+    def _put_item(self, name, item, seq=None):
+        item_id = item.get("id")
+        if seq is None:
+            row = self._conn.execute(
+                "SELECT seq FROM items WHERE project = ? AND id = ?", (name, item_id)
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq), -1) + 1 FROM items WHERE project = ?", (name,)
+                ).fetchone()
+            seq = row[0]
+        body = {
+            k: v for k, v in item.items()
+            if k not in ("pos_x", "pos_y", "saved_pages")
+        }
+        self._conn.execute(
+            "INSERT OR REPLACE INTO items (project, id, seq, type, pos_x, pos_y, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                name, item_id, seq, item.get("type"), item.get("pos_x"), item.get("pos_y"),
+                json.dumps(body, ensure_ascii=False),
+            ),
+        )
+        self._conn.execute(
+            "DELETE FROM saved_pages WHERE project = ? AND item_id = ?", (name, item_id)
+        )
+        self._conn.executemany(
+            "INSERT INTO saved_pages (project, item_id, seq, file, hash, timestamp, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    name, item_id, page_seq, page.get("file"), page.get("hash"),
+                    page.get("timestamp"), json.dumps(page, ensure_ascii=False),
+                )
+                for page_seq, page in enumerate(item.get("saved_pages", []))
+            ],
+        )
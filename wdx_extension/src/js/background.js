@@ -1,4 +1,4 @@
-import { API_ADD, API_STATUS } from './constants.js';
+import { API_ADD, API_ADD_BATCH, API_STATUS } from './constants.js';
 
 chrome.runtime.onInstalled.addListener(() => {
   chrome.contextMenus.create({ id: "save_source", title: "In wdx speichern", contexts: ["page"] });
@@ -46,6 +46,44 @@ async function processQueue() {
     let queue = data.offlineQueue || [];
     if (queue.length === 0) return;
 
+    let result = await sendQueueBatch(queue);
+    if (result === null) {
+      result = await sendQueueSingle(queue);
+    }
+    const { newQueue, processedCount } = result;
+
+    await chrome.storage.local.set({ offlineQueue: newQueue });
+    
+    if (processedCount > 0) {
+        notify("Offline-Warteschlange", `${processedCount} Elemente nachsynchronisiert.`);
+    }
+}
+
+// Ganze Warteschlange in einem Request senden; null = Endpunkt nicht verfügbar (ältere App)
+async function sendQueueBatch(queue) {
+  try {
+    const res = await fetch(API_ADD_BATCH, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(queue),
+    });
+    if (res.status === 404) return null;
+    if (!res.ok) {
+      const body = await res.json().catch(() => ({}));
+      // Nur ungültige Einträge -> verwerfen, sonst später erneut versuchen
+      if (res.status === 400 && Array.isArray(body.rejected) && body.rejected.length === queue.length) {
+        return { newQueue: [], processedCount: 0 };
+      }
+      return { newQueue: queue, processedCount: 0 };
+    }
+    const body = await res.json();
+    return { newQueue: [], processedCount: body.accepted || 0 };
+  } catch (e) {
+    return { newQueue: queue, processedCount: 0 };
+  }
+}
+
+async function sendQueueSingle(queue) {
     const newQueue = [];
     let processedCount = 0;
 
@@ -62,12 +100,7 @@ async function processQueue() {
         newQueue.push(item);
       }
     }
-    
-    await chrome.storage.local.set({ offlineQueue: newQueue });
-    
-    if (processedCount > 0) {
-        notify("Offline-Warteschlange", `${processedCount} Elemente nachsynchronisiert.`);
-    }
+    return { newQueue, processedCount };
 }
 
 chrome.contextMenus.onClicked.addListener(async (info, tab) => {
@@ -1,5 +1,6 @@
 export const API_BASE = "http://127.0.0.1:8765";
 export const API_ADD = `${API_BASE}/api/add_source`;
+export const API_ADD_BATCH = `${API_BASE}/api/add_sources`;
 export const API_STATUS = `${API_BASE}/api/status`;
 export const VERSION = "1.4.5";
 export const BUILDDATE = "2026-07-24";
\ No newline at end of file